@@ -1,11 +1,70 @@
 """Repository classes for admin_service models"""
 
-from typing import List, Optional
+import copy
+from typing import Any, Dict, List, Optional
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Session
 
+from shared.config_cache import get_config_cache, PLATFORMS, SEARCH_RULES, FIELD_MAPPINGS
 from .models import Platform, SearchRule, FieldMapping
 
 
+class CachedRow:
+    """Read-only column snapshot of a configuration row
+
+    The config cache keeps one plain dict of column values per row and
+    every read gets its own CachedRow with copies of mutable values (JSON
+    columns), so a caller changing what it got cannot leak into other
+    requests or threads. Attribute access mirrors the model's columns;
+    relationships are not available.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Dict[str, Any]):
+        object.__setattr__(self, "_values", {
+            name: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for name, value in values.items()
+        })
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Cached configuration rows are read-only; update through the repository")
+
+    def __getitem__(self, name: str) -> Any:
+        return self._values[name]
+
+    def keys(self):
+        return self._values.keys()
+
+    def __repr__(self) -> str:
+        return f"<CachedRow({self._values})>"
+
+
+def _columns(result: Any) -> Any:
+    """Column values of loaded row(s) as plain dicts, the form kept in the cache"""
+    def values(row: Any) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        return {column.key: getattr(row, column.key) for column in sa_inspect(row).mapper.column_attrs}
+
+    if isinstance(result, list):
+        return tuple(values(row) for row in result)
+    return values(result)
+
+
+def _rows(cached: Any) -> Any:
+    """Fresh CachedRow(s) for cached column dicts"""
+    if isinstance(cached, tuple):
+        return [CachedRow(values) for values in cached]
+    return CachedRow(cached) if cached is not None else None
+
+
 class PlatformRepository:
     """Repository for Platform model operations"""
     
@@ -23,42 +82,58 @@ class PlatformRepository:
         self.db.add(platform)
         self.db.commit()
         self.db.refresh(platform)
+        get_config_cache().invalidate(PLATFORMS)
         return platform
     
-    def get_by_id(self, platform_id: int) -> Optional[Platform]:
-        """Get platform by ID"""
-        return self.db.query(Platform).filter(Platform.id == platform_id).first()
+    def get_by_id(self, platform_id: int) -> Optional[CachedRow]:
+        """Get platform by ID (cached)"""
+        return _rows(get_config_cache().get_or_load(
+            PLATFORMS, f"id:{platform_id}",
+            lambda: _columns(self._get(platform_id)),
+        ))
     
-    def get_by_code(self, code: str) -> Optional[Platform]:
-        """Get platform by code"""
-        return self.db.query(Platform).filter(Platform.code == code).first()
+    def get_by_code(self, code: str) -> Optional[CachedRow]:
+        """Get platform by code (cached)"""
+        return _rows(get_config_cache().get_or_load(
+            PLATFORMS, f"code:{code}",
+            lambda: _columns(self.db.query(Platform).filter(Platform.code == code).first()),
+        ))
     
-    def list_all(self, active_only: bool = False) -> List[Platform]:
-        """List all platforms"""
-        query = self.db.query(Platform)
-        if active_only:
-            query = query.filter(Platform.is_active == True)
-        return query.all()
+    def list_all(self, active_only: bool = False) -> List[CachedRow]:
+        """List all platforms (cached)"""
+        def load():
+            query = self.db.query(Platform)
+            if active_only:
+                query = query.filter(Platform.is_active == True)
+            return _columns(query.all())
+        
+        return _rows(get_config_cache().get_or_load(PLATFORMS, f"all:{active_only}", load))
     
     def update(self, platform_id: int, **kwargs) -> Optional[Platform]:
         """Update platform"""
-        platform = self.get_by_id(platform_id)
+        platform = self._get(platform_id)
         if platform:
             for key, value in kwargs.items():
                 if hasattr(platform, key):
                     setattr(platform, key, value)
             self.db.commit()
             self.db.refresh(platform)
+            get_config_cache().invalidate(PLATFORMS)
         return platform
     
     def delete(self, platform_id: int) -> bool:
         """Delete platform"""
-        platform = self.get_by_id(platform_id)
+        platform = self._get(platform_id)
         if platform:
             self.db.delete(platform)
             self.db.commit()
+            get_config_cache().invalidate()  # Rules and mappings are deleted with the platform (cascade)
             return True
         return False
+    
+    def _get(self, platform_id: int) -> Optional[Platform]:
+        """Load platform attached to this session (for writes)"""
+        return self.db.query(Platform).filter(Platform.id == platform_id).first()
 
 
 class SearchRuleRepository:
@@ -79,38 +154,52 @@ class SearchRuleRepository:
         self.db.add(rule)
         self.db.commit()
         self.db.refresh(rule)
+        get_config_cache().invalidate(SEARCH_RULES)
         return rule
     
-    def get_by_id(self, rule_id: int) -> Optional[SearchRule]:
-        """Get search rule by ID"""
-        return self.db.query(SearchRule).filter(SearchRule.id == rule_id).first()
+    def get_by_id(self, rule_id: int) -> Optional[CachedRow]:
+        """Get search rule by ID (cached)"""
+        return _rows(get_config_cache().get_or_load(
+            SEARCH_RULES, f"id:{rule_id}",
+            lambda: _columns(self._get(rule_id)),
+        ))
     
-    def get_by_platform(self, platform_id: int, active_only: bool = False) -> List[SearchRule]:
-        """Get search rules for platform"""
-        query = self.db.query(SearchRule).filter(SearchRule.platform_id == platform_id)
-        if active_only:
-            query = query.filter(SearchRule.is_active == True)
-        return query.all()
+    def get_by_platform(self, platform_id: int, active_only: bool = False) -> List[CachedRow]:
+        """Get search rules for platform (cached)"""
+        def load():
+            query = self.db.query(SearchRule).filter(SearchRule.platform_id == platform_id)
+            if active_only:
+                query = query.filter(SearchRule.is_active == True)
+            return _columns(query.all())
+        
+        return _rows(get_config_cache().get_or_load(SEARCH_RULES, f"platform:{platform_id}:{active_only}", load))
     
     def update(self, rule_id: int, **kwargs) -> Optional[SearchRule]:
         """Update search rule"""
-        rule = self.get_by_id(rule_id)
+        rule = self._get(rule_id)
         if rule:
             for key, value in kwargs.items():
                 if hasattr(rule, key):
                     setattr(rule, key, value)
             self.db.commit()
             self.db.refresh(rule)
+            get_config_cache().invalidate(SEARCH_RULES)
         return rule
     
     def delete(self, rule_id: int) -> bool:
         """Delete search rule"""
-        rule = self.get_by_id(rule_id)
+        rule = self._get(rule_id)
         if rule:
             self.db.delete(rule)
             self.db.commit()
+            get_config_cache().invalidate(SEARCH_RULES)
+            get_config_cache().invalidate(FIELD_MAPPINGS)  # Deleted with the rule (cascade)
             return True
         return False
+    
+    def _get(self, rule_id: int) -> Optional[SearchRule]:
+        """Load search rule attached to this session (for writes)"""
+        return self.db.query(SearchRule).filter(SearchRule.id == rule_id).first()
 
 
 class FieldMappingRepository:
@@ -136,36 +225,52 @@ class FieldMappingRepository:
         self.db.add(mapping)
         self.db.commit()
         self.db.refresh(mapping)
+        get_config_cache().invalidate(FIELD_MAPPINGS)
         return mapping
     
-    def get_by_id(self, mapping_id: int) -> Optional[FieldMapping]:
-        """Get field mapping by ID"""
-        return self.db.query(FieldMapping).filter(FieldMapping.id == mapping_id).first()
+    def get_by_id(self, mapping_id: int) -> Optional[CachedRow]:
+        """Get field mapping by ID (cached)"""
+        return _rows(get_config_cache().get_or_load(
+            FIELD_MAPPINGS, f"id:{mapping_id}",
+            lambda: _columns(self._get(mapping_id)),
+        ))
     
-    def get_by_platform(self, platform_id: int) -> List[FieldMapping]:
-        """Get field mappings for platform"""
-        return self.db.query(FieldMapping).filter(FieldMapping.platform_id == platform_id).all()
+    def get_by_platform(self, platform_id: int) -> List[CachedRow]:
+        """Get field mappings for platform (cached)"""
+        return _rows(get_config_cache().get_or_load(
+            FIELD_MAPPINGS, f"platform:{platform_id}",
+            lambda: _columns(self.db.query(FieldMapping).filter(FieldMapping.platform_id == platform_id).all()),
+        ))
     
-    def get_by_search_rule(self, search_rule_id: int) -> List[FieldMapping]:
-        """Get field mappings for search rule"""
-        return self.db.query(FieldMapping).filter(FieldMapping.search_rule_id == search_rule_id).all()
+    def get_by_search_rule(self, search_rule_id: int) -> List[CachedRow]:
+        """Get field mappings for search rule (cached)"""
+        return _rows(get_config_cache().get_or_load(
+            FIELD_MAPPINGS, f"rule:{search_rule_id}",
+            lambda: _columns(self.db.query(FieldMapping).filter(FieldMapping.search_rule_id == search_rule_id).all()),
+        ))
     
     def update(self, mapping_id: int, **kwargs) -> Optional[FieldMapping]:
         """Update field mapping"""
-        mapping = self.get_by_id(mapping_id)
+        mapping = self._get(mapping_id)
         if mapping:
             for key, value in kwargs.items():
                 if hasattr(mapping, key):
                     setattr(mapping, key, value)
             self.db.commit()
             self.db.refresh(mapping)
+            get_config_cache().invalidate(FIELD_MAPPINGS)
         return mapping
     
     def delete(self, mapping_id: int) -> bool:
         """Delete field mapping"""
-        mapping = self.get_by_id(mapping_id)
+        mapping = self._get(mapping_id)
         if mapping:
             self.db.delete(mapping)
             self.db.commit()
+            get_config_cache().invalidate(FIELD_MAPPINGS)
             return True
         return False
+    
+    def _get(self, mapping_id: int) -> Optional[FieldMapping]:
+        """Load field mapping attached to this session (for writes)"""
+        return self.db.query(FieldMapping).filter(FieldMapping.id == mapping_id).first()
@@ -5,9 +5,9 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from factory_parsers.shared.logger import logger
-from factory_parsers.normalizer_service.repositories import NormalizedTenderRepository
-from factory_parsers.normalizer_service.models import NormalizedTender
+from shared.logger import logger
+from normalizer_service.repositories import NormalizedTenderRepository
+from normalizer_service.models import NormalizedTender
 
 
 class TenderAnalyzer:
@@ -3,10 +3,10 @@
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
-from factory_parsers.shared.logger import logger
-from factory_parsers.analytics_service.models import DailyMetrics, ScraperMetrics, SearchMetrics
-from factory_parsers.normalizer_service.repositories import NormalizedTenderRepository
-from factory_parsers.search_service.elasticsearch_client import ElasticsearchClient
+from shared.logger import logger
+from .models import DailyMetrics, ScraperMetrics, SearchMetrics
+from normalizer_service.repositories import NormalizedTenderRepository
+from search_service.elasticsearch_client import ElasticsearchClient
 
 
 class MetricsCollector:
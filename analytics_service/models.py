@@ -3,7 +3,7 @@
 from datetime import datetime
 from sqlalchemy import Column, DateTime, Integer, String, Float, JSON, BigInteger
 
-from factory_parsers.shared.database import Base
+from shared.database import Base
 
 
 class DailyMetrics(Base):
@@ -5,10 +5,10 @@ from typing import Optional
 from fastapi import APIRouter, Query, Depends
 from sqlalchemy.orm import Session
 
-from factory_parsers.shared.database import get_db
-from factory_parsers.analytics_service.collector import MetricsCollector
-from factory_parsers.analytics_service.analyzer import TenderAnalyzer
-from factory_parsers.analytics_service.repositories import MetricsRepository
+from shared.database import get_db
+from .collector import MetricsCollector
+from .analyzer import TenderAnalyzer
+from .repositories import MetricsRepository
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -1,10 +1,10 @@
 """Celery tasks for analytics"""
 
-from factory_parsers.scheduler_service.celery_app import task
-from factory_parsers.shared.database import SessionLocal
-from factory_parsers.shared.logger import logger
-from factory_parsers.analytics_service.collector import MetricsCollector
-from factory_parsers.analytics_service.analyzer import TenderAnalyzer
+from scheduler_service.celery_app import task
+from shared.database import SessionLocal
+from shared.logger import logger
+from .collector import MetricsCollector
+from .analyzer import TenderAnalyzer
 
 
 @task(name="collect_daily_metrics")
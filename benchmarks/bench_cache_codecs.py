@@ -0,0 +1,112 @@
+"""Benchmark: cache codecs on a TenderSearcher result page
+
+For every serializer/compression pair in shared.serializers, reports the
+encoded size and the encode/decode time of a search result page shaped
+like TenderSearcher._parse_results output in the list view (source
+fields, score and highlight fragments). Codecs whose optional package is
+not installed are listed as unavailable.
+
+Usage:
+    python benchmarks/bench_cache_codecs.py --page-size 20 --rounds 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shared.serializers import COMPRESSIONS, SERIALIZERS, Codec  # noqa: E402
+
+SYLLABLES = (
+    "по", "ста", "вка", "ре", "монт", "обо", "ру", "до", "ва",
+    "ния", "ус", "луг", "за", "куп", "ка", "стро", "и", "тель",
+)
+CUSTOMERS = (
+    "ГБУЗ Областная клиническая больница №1", "Администрация городского округа Самара",
+    "МБОУ Средняя общеобразовательная школа №12", "ФКУ Упрдор Москва-Харьков",
+)
+
+
+def _vocabulary(rng: random.Random, size: int = 3000):
+    return ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(size)]
+
+
+def _words(rng: random.Random, vocabulary, count: int) -> str:
+    return " ".join(rng.choice(vocabulary) for _ in range(count))
+
+
+def result_page(rng: random.Random, size: int) -> dict:
+    """Parsed search response for the list view"""
+    vocabulary = _vocabulary(rng)
+    items = []
+    for n in range(size):
+        start = datetime(2026, 1, 1) + timedelta(days=rng.randint(0, 280))
+        title = _words(rng, vocabulary, rng.randint(8, 16)).capitalize()
+        items.append({
+            "tender_id": f"{rng.getrandbits(128):032x}",
+            "title": title,
+            "platform": rng.choice(("zakupki", "goszakup", "sberbank-ast")),
+            "customer": rng.choice(CUSTOMERS),
+            "category": rng.choice(("construction", "medical", "it", "services")),
+            "status": rng.choice(("new", "active", "closed")),
+            "budget": float(rng.randrange(10_000, 90_000_000, 100)),
+            "currency": "RUB",
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=rng.randint(7, 60))).isoformat(),
+            "normalized_at": datetime(2026, 10, 1, rng.randint(0, 23), rng.randint(0, 59)).isoformat(),
+            "_id": f"{n}",
+            "_score": round(rng.uniform(1, 25), 6),
+            "highlight": {
+                "title": ["<em>" + title + "</em>"],
+                "description": [_words(rng, vocabulary, 28)],
+                "extracted_text": [_words(rng, vocabulary, 28), _words(rng, vocabulary, 28)],
+            },
+        })
+    return {"total": rng.randint(size, 20_000), "items": items, "query_time_ms": rng.randint(5, 120)}
+
+
+def bench(codec: Codec, page: dict, rounds: int):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        data = codec.dumps(page)
+    encode_us = (time.perf_counter() - started) / rounds * 1e6
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        decoded = codec.loads(data)
+    decode_us = (time.perf_counter() - started) / rounds * 1e6
+
+    if decoded != page:
+        raise SystemExit(f"{codec.serializer}+{codec.compression}: round trip changed the page")
+    return len(data), encode_us, decode_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=1000)
+    parser.add_argument("--threshold", type=int, default=1024, help="cache_compression_threshold")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    page = result_page(random.Random(args.seed), args.page_size)
+    print(f"Result page with {args.page_size} items, {args.rounds} rounds")
+    print(f"  {'codec':<16} {'bytes':>9} {'encode us':>11} {'decode us':>11}")
+    for serializer in SERIALIZERS:
+        for compression in COMPRESSIONS:
+            name = serializer if compression == "none" else f"{serializer}+{compression}"
+            try:
+                codec = Codec(serializer, compression, args.threshold)
+            except ImportError as e:
+                print(f"  {name:<16} unavailable ({e.name} not installed)")
+                continue
+            size, encode_us, decode_us = bench(codec, page, args.rounds)
+            print(f"  {name:<16} {size:>9} {encode_us:>11.1f} {decode_us:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
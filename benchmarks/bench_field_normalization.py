@@ -0,0 +1,115 @@
+"""Microbenchmark: date and budget parsing in TenderNormalizer
+
+Before: every date tried up to seven strptime formats in order, and
+budgets went through two regex passes. After: numeric dates are classified
+by one precompiled regex and built from its groups, month-name dates start
+with the platform's last working format, and budgets take one regex pass.
+
+The "before" functions are the pre-change implementations, kept here for
+comparison; both sides must produce identical values.
+
+Usage:
+    python benchmarks/bench_field_normalization.py --values 100000 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from normalizer_service.normalizer import TenderNormalizer  # noqa: E402
+
+_OLD_DATE_FORMATS = ['%Y-%m-%d', '%d-%m-%Y', '%d.%m.%Y', '%Y/%m/%d', '%d/%m/%Y', '%d %b %Y', '%d %B %Y']
+
+
+def old_normalize_date(date_str):
+    if not date_str:
+        return None
+    if isinstance(date_str, datetime):
+        return date_str
+    for fmt in _OLD_DATE_FORMATS:
+        try:
+            return datetime.strptime(str(date_str), fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def old_normalize_budget(budget_str):
+    if not budget_str:
+        return None
+    if isinstance(budget_str, (int, float)):
+        return float(budget_str)
+    budget_str = re.sub(r'[\s,\-]+', '', str(budget_str))
+    numbers = re.findall(r'\d+', budget_str)
+    return float(''.join(numbers)) if numbers else None
+
+
+def sample_dates(rng: random.Random, count: int):
+    # Share of each shape roughly as seen across the scraped platforms
+    shapes = (
+        ('%Y-%m-%d', 45), ('%d.%m.%Y', 35), ('%d/%m/%Y', 8),
+        ('%Y/%m/%d', 4), ('%d-%m-%Y', 4), ('%d %b %Y', 4),
+    )
+    formats = [fmt for fmt, weight in shapes for _ in range(weight)]
+    return [
+        datetime(rng.randint(2019, 2026), rng.randint(1, 12), rng.randint(1, 28)).strftime(rng.choice(formats))
+        for _ in range(count)
+    ]
+
+
+def sample_budgets(rng: random.Random, count: int):
+    def budget():
+        amount = rng.randrange(10_000, 100_000_000, 100)
+        shape = rng.randrange(4)
+        if shape == 0:
+            return float(amount)
+        if shape == 1:
+            return str(amount)
+        if shape == 2:
+            return f"{amount:,}".replace(",", " ") + " руб."
+        return f"{amount:,}".replace(",", " ")
+    return [budget() for _ in range(count)]
+
+
+def timed(fn, values, repeat: int):
+    """Results and best-of-`repeat` time per value, microseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [fn(value) for value in values]
+        best = min(best, time.perf_counter() - started)
+    return results, best / len(values) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Best of this many passes")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    dates = sample_dates(rng, args.values)
+    budgets = sample_budgets(rng, args.values)
+
+    cases = (
+        ("date", dates, old_normalize_date, lambda value: TenderNormalizer._normalize_date(value, "zakupki")),
+        ("budget", budgets, old_normalize_budget, TenderNormalizer._normalize_budget),
+    )
+    print(f"{args.values} values per field, best of {args.repeat}")
+    for name, values, before, after in cases:
+        expected, before_us = timed(before, values, args.repeat)
+        actual, after_us = timed(after, values, args.repeat)
+        if expected != actual:
+            raise SystemExit(f"{name}: results differ between implementations")
+        print(f"  {name:<7} before {before_us:7.2f} us  after {after_us:7.2f} us  ({before_us / after_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark: MinHash signature and LSH lookup for near-duplicate detection
+
+Reports the per-tender cost of shingling, signing and querying an in-memory
+NearDuplicateIndex holding --size signatures (the per-lookup target is
+under 1 ms), plus the mean error of the similarity estimate against the
+exact Jaccard similarity of the shingle sets.
+
+Usage:
+    python benchmarks/bench_near_duplicate.py --size 100000 --lookups 2000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from normalizer_service.near_duplicate import MinHasher, NearDuplicateIndex  # noqa: E402
+
+SYLLABLES = ("по", "ста", "вка", "ре", "монт", "обо", "ру", "до", "ва", "ния", "ус", "луг", "за", "куп", "ка", "стро", "и", "тель")
+KINDS = ("ГБУЗ", "МБОУ", "МКУ", "ФКУ", "АО", "ООО", "Администрация")
+
+
+def _vocabulary(rng: random.Random, size: int):
+    return [
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        for _ in range(size)
+    ]
+
+
+def _tender(rng: random.Random, words):
+    title = " ".join(rng.choice(words) for _ in range(rng.randint(8, 14))).capitalize()
+    customer = f"{rng.choice(KINDS)} {rng.choice(words)} {rng.choice(words)} №{rng.randint(1, 500)}"
+    return title, customer, float(rng.randrange(10_000, 50_000_000, 1000))
+
+
+def _republish(rng: random.Random, title: str, words) -> str:
+    tokens = title.split()
+    for _ in range(rng.randint(0, 2)):
+        tokens[rng.randrange(len(tokens))] = rng.choice(words)
+    return " ".join(tokens)
+
+
+def _timed(fn, items):
+    started = time.perf_counter()
+    results = [fn(item) for item in items]
+    return results, (time.perf_counter() - started) / len(items) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=50_000, help="Signatures in the index")
+    parser.add_argument("--lookups", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = _vocabulary(rng, 3000)
+    hasher = MinHasher()
+    index = NearDuplicateIndex(hasher)
+    index.sync_interval = float("inf")  # Memory only, no database
+
+    stored = [_tender(rng, words) for _ in range(args.size)]
+    now = datetime.utcnow()
+    index.publish([
+        (pk, hasher.signature(hasher.shingles(*tender)), "zakupki", now)
+        for pk, tender in enumerate(stored)
+    ])
+
+    probes = [
+        (_republish(rng, title, words), customer, budget)
+        for title, customer, budget in rng.sample(stored, args.lookups // 2)
+    ]
+    probes += [_tender(rng, words) for _ in range(args.lookups - len(probes))]
+
+    shingles, shingle_ms = _timed(lambda probe: hasher.shingles(*probe), probes)
+    _, signature_ms = _timed(hasher.signature, shingles)
+    matches, query_ms = _timed(lambda probe: index.query(None, *probe), probes)
+
+    errors = []
+    for (title, customer, budget), probe in zip(rng.sample(stored, 500), rng.sample(probes, 500)):
+        a, b = hasher.shingles(title, customer, budget), hasher.shingles(*probe)
+        exact = len(a & b) / len(a | b)
+        errors.append(abs(MinHasher.similarity(hasher.signature(a), hasher.signature(b)) - exact))
+
+    print(f"index size {args.size}, {len(probes)} lookups ({args.lookups // 2} republished)")
+    print(f"  shingles            {shingle_ms:8.3f} ms/tender")
+    print(f"  signature           {signature_ms:8.3f} ms/tender")
+    print(f"  query (all steps)   {query_ms:8.3f} ms/lookup")
+    print(f"  matched             {sum(1 for found in matches if found)}")
+    print(f"  similarity error    {statistics.mean(errors):8.4f} mean abs vs exact Jaccard")
+
+
+if __name__ == "__main__":
+    main()
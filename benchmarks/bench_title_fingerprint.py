@@ -0,0 +1,122 @@
+"""Benchmark: fuzzy-title duplicate lookup, platform scan vs fingerprint index
+
+Before: DuplicateDetector loaded every non-duplicate tender of the platform
+and re-hashed each title in Python. After: the fingerprint is stored at
+insert time and found with one probe on idx_platform_title_fingerprint.
+
+Runs against an in-memory SQLite table shaped like normalized_tenders, once
+per table size, so the scan's linear growth and the index's flat cost show
+side by side.
+
+Usage:
+    python benchmarks/bench_title_fingerprint.py --rows 10000 100000 1000000 --lookups 40
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from normalizer_service.duplicate_detector import DuplicateDetector  # noqa: E402
+
+PLATFORMS = ("zakupki", "goszakup", "sberbank-ast", "roseltorg", "b2b-center")
+WORDS = (
+    "поставка", "оказание", "услуг", "выполнение", "работ", "ремонт", "здания",
+    "оборудования", "медицинского", "программного", "обеспечения", "закупка",
+    "топлива", "строительство", "дороги", "охраны", "объекта", "питания",
+)
+
+
+def _title(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(6)).capitalize() + f" №{n}"
+
+
+def build_table(rows: int, seed: int) -> sqlite3.Connection:
+    rng = random.Random(seed)
+    db = sqlite3.connect(":memory:")
+    db.execute(
+        "CREATE TABLE normalized_tenders ("
+        "id INTEGER PRIMARY KEY, platform_id TEXT, title TEXT, "
+        "title_fingerprint TEXT, is_duplicate INTEGER)"
+    )
+    db.executemany(
+        "INSERT INTO normalized_tenders VALUES (?, ?, ?, ?, 0)",
+        (
+            (n, rng.choice(PLATFORMS), title, DuplicateDetector.title_fingerprint(title))
+            for n, title in ((n, _title(rng, n)) for n in range(1, rows + 1))
+        ),
+    )
+    db.execute("CREATE INDEX idx_platform ON normalized_tenders (platform_id)")
+    db.execute(
+        "CREATE INDEX idx_platform_title_fingerprint "
+        "ON normalized_tenders (platform_id, title_fingerprint, is_duplicate)"
+    )
+    db.commit()
+    return db
+
+
+def lookup_scan(db: sqlite3.Connection, platform_id: str, title: str):
+    title_hash = DuplicateDetector.title_fingerprint(title)
+    rows = db.execute(
+        "SELECT id, title FROM normalized_tenders WHERE platform_id = ? AND is_duplicate = 0",
+        (platform_id,),
+    ).fetchall()
+    for tender_id, stored_title in rows:
+        if DuplicateDetector.title_fingerprint(stored_title) == title_hash:
+            return tender_id
+    return None
+
+
+def lookup_indexed(db: sqlite3.Connection, platform_id: str, title: str):
+    row = db.execute(
+        "SELECT id FROM normalized_tenders "
+        "WHERE platform_id = ? AND title_fingerprint = ? AND is_duplicate = 0 LIMIT 1",
+        (platform_id, DuplicateDetector.title_fingerprint(title)),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def probes_for(db: sqlite3.Connection, rows: int, lookups: int, rng: random.Random):
+    existing = [
+        db.execute("SELECT platform_id, title FROM normalized_tenders WHERE id = ?", (tender_id,)).fetchone()
+        for tender_id in rng.sample(range(1, rows + 1), min(lookups // 2, rows))
+    ]
+    # Half hits (titles re-typed with different case/spacing), half misses
+    probes = [(platform, "  " + title.upper().replace(" ", "   ")) for platform, title in existing]
+    probes += [(rng.choice(PLATFORMS), _title(rng, -n)) for n in range(lookups - len(probes))]
+    return probes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    strategies = (("before (platform scan)", lookup_scan), ("after (fingerprint index)", lookup_indexed))
+    print(f"{args.lookups} lookups per table size, ms/lookup")
+    print(f"  {'rows':>9}" + "".join(f" {name:>26}" for name, _ in strategies))
+    for rows in args.rows:
+        db = build_table(rows, args.seed)
+        probes = probes_for(db, rows, args.lookups, random.Random(args.seed + 1))
+
+        results, timings = [], []
+        for _, lookup in strategies:
+            started = time.perf_counter()
+            results.append([lookup(db, platform, title) for platform, title in probes])
+            timings.append((time.perf_counter() - started) / len(probes) * 1000)
+        print(f"  {rows:>9}" + "".join(f" {ms:>26.3f}" for ms in timings))
+
+        scan, indexed = results
+        if [bool(hit) for hit in scan] != [bool(hit) for hit in indexed]:
+            raise SystemExit(f"{rows} rows: lookup results differ between strategies")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
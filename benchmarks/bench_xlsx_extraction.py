@@ -0,0 +1,118 @@
+"""Benchmark: XLSX text extraction, full workbook load vs read-only streaming
+
+Before: openpyxl.load_workbook() built every cell object of the workbook
+before the first row was read. After: TextExtractor.iter_xlsx opens it
+read-only and parses rows lazily, optionally capped per sheet.
+
+Generates a bill-of-quantities style workbook, then reports wall time and
+peak Python memory (tracemalloc, separate run) per strategy. Needs
+openpyxl.
+
+Usage:
+    python benchmarks/bench_xlsx_extraction.py --rows 50000 --sheets 2
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import openpyxl  # noqa: E402
+
+from normalizer_service.text_extractor import TextExtractor  # noqa: E402
+
+ITEMS = (
+    "Кабель ВВГнг-LS 3x2.5", "Труба стальная 57x3.5", "Бетон B25 W6 F150",
+    "Арматура А500С d12", "Щит распределительный ЩРН-24", "Светильник LED 36W",
+)
+UNITS = ("м", "шт", "м3", "т", "компл")
+
+
+def build_workbook(path: str, sheets: int, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    wb = openpyxl.Workbook(write_only=True)
+    for sheet in range(sheets):
+        ws = wb.create_sheet(f"Смета {sheet + 1}")
+        ws.append(["№", "Наименование", "Ед. изм.", "Кол-во", "Цена", "Сумма", "Примечание"])
+        for n in range(1, rows + 1):
+            quantity = rng.randint(1, 500)
+            price = round(rng.uniform(10, 50_000), 2)
+            ws.append([
+                n, rng.choice(ITEMS), rng.choice(UNITS), quantity, price,
+                round(quantity * price, 2), None if n % 3 else "по проекту",
+            ])
+    wb.save(path)
+
+
+def extract_full_load(path: str) -> str:
+    """Pre-change implementation of TextExtractor.iter_xlsx"""
+    wb = openpyxl.load_workbook(path)
+    chunks = []
+    for sheet in wb.sheetnames:
+        for row in wb[sheet].iter_rows(values_only=True):
+            cells = [str(cell) for cell in row if cell]
+            if cells:
+                chunks.append('\n'.join(cells))
+    return '\n'.join(chunks)
+
+
+def measure(fn, *args):
+    """Wall time of an untraced run, then peak memory of a traced one
+
+    tracemalloc slows allocation-heavy code several times over, so timing
+    a traced run would mostly measure the tracer.
+    """
+    started = time.perf_counter()
+    text = fn(*args)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return text, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000, help="Rows per sheet")
+    parser.add_argument("--sheets", type=int, default=2)
+    parser.add_argument("--max-rows-per-sheet", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        build_workbook(path, args.sheets, args.rows, args.seed)
+        print(f"{args.sheets} sheets x {args.rows} rows, {os.path.getsize(path) / 1e6:.1f} MB on disk")
+
+        strategies = (
+            ("before (full load)", extract_full_load, (path,)),
+            ("after (read-only stream)", lambda p: "\n".join(TextExtractor.iter_xlsx(p)), (path,)),
+            (
+                f"after, {args.max_rows_per_sheet} rows/sheet",
+                lambda p: "\n".join(TextExtractor.iter_xlsx(p, max_rows_per_sheet=args.max_rows_per_sheet)),
+                (path,),
+            ),
+        )
+        texts = []
+        for name, fn, fn_args in strategies:
+            text, elapsed, peak = measure(fn, *fn_args)
+            texts.append(text)
+            print(f"  {name:<30} {elapsed:8.2f} s  peak {peak / 1e6:8.1f} MB  {len(text):>10} chars")
+
+        if texts[0] != texts[1]:
+            raise SystemExit("Read-only extraction differs from full load")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
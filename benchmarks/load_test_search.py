@@ -0,0 +1,131 @@
+"""Load test: concurrent search requests against a running API (httpx + asyncio)
+
+Each of --concurrency workers sends requests back to back for --duration
+seconds, cycling through a mix of queries and filters, then the script
+reports throughput, latency percentiles and status codes. Run it against
+the sync and async search paths (or before/after a change) with the same
+arguments to compare them.
+
+Targets:
+    client   GET  /api/v1/search     (client API)
+    search   POST /search/query      (search service)
+
+Usage:
+    python benchmarks/load_test_search.py --base-url http://localhost:8000 \\
+        --target client --concurrency 64 --duration 30
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import statistics
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Tuple
+
+import httpx
+
+QUERIES = (
+    "поставка оборудования", "ремонт дороги", "медицинские изделия", "программное обеспечение",
+    "строительство", "охрана объекта", "топливо", "питание", "уборка помещений", "*",
+)
+PLATFORMS = (None, "zakupki", "goszakup", "sberbank-ast")
+CATEGORIES = (None, "construction", "medical", "it", "services")
+BUDGETS = ((None, None), (100_000, None), (None, 5_000_000), (1_000_000, 50_000_000))
+
+
+def request_mix(seed: int, count: int = 500) -> List[Dict[str, Any]]:
+    """Search parameter sets; repeats let the result cache show up in the numbers"""
+    rng = random.Random(seed)
+    mix = []
+    for _ in range(count):
+        budget_min, budget_max = rng.choice(BUDGETS)
+        params = {
+            "query": rng.choice(QUERIES),
+            "platform": rng.choice(PLATFORMS),
+            "category": rng.choice(CATEGORIES),
+            "budget_min": budget_min,
+            "budget_max": budget_max,
+            "page": rng.choice((1, 1, 1, 2, 3)),
+            "size": 20,
+        }
+        mix.append({key: value for key, value in params.items() if value is not None})
+    return mix
+
+
+async def send(client: httpx.AsyncClient, target: str, params: Dict[str, Any]) -> httpx.Response:
+    if target == "client":
+        return await client.get("/api/v1/search", params=params)
+    return await client.post("/search/query", json=params)
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    target: str,
+    mix: Iterator[Dict[str, Any]],
+    deadline: float,
+    latencies: List[float],
+    statuses: Counter,
+) -> None:
+    while time.perf_counter() < deadline:
+        params = next(mix)
+        started = time.perf_counter()
+        try:
+            response = await send(client, target, params)
+            statuses[response.status_code] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(args: argparse.Namespace) -> Tuple[List[float], Counter, float]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    mix = itertools.cycle(request_mix(args.seed))
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        if args.warmup:
+            await worker(client, args.target, mix, time.perf_counter() + args.warmup, [], Counter())
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, args.target, mix, deadline, latencies, statuses)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+    return latencies, statuses, elapsed
+
+
+def report(latencies: List[float], statuses: Counter, elapsed: float) -> None:
+    total = sum(statuses.values())
+    print(f"{total} requests in {elapsed:.1f} s, {len(latencies) / elapsed:.1f} req/s")
+    print("  status " + ", ".join(f"{status}: {count}" for status, count in sorted(statuses.items(), key=str)))
+    if len(latencies) < 2:
+        return
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"  latency ms  mean {statistics.mean(latencies) * 1000:.1f}  p50 {cuts[49] * 1000:.1f}  "
+        f"p95 {cuts[94] * 1000:.1f}  p99 {cuts[98] * 1000:.1f}  max {max(latencies) * 1000:.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--target", choices=("client", "search"), default="client")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of measured load")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds of single-worker warmup")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout, seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    report(*asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,42 @@
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
-from factory_parsers.shared.logger import logger
-from factory_parsers.normalizer_service.repositories import NormalizedTenderRepository
+from shared.logger import logger
+from normalizer_service.models import NormalizedTender
+from normalizer_service.repositories import NormalizedTenderRepository, get_detail_cache
+
+# Columns read by _tender_to_dict; raw_data and extracted_text are never loaded
+DETAIL_COLUMNS = (
+    NormalizedTender.id,
+    NormalizedTender.tender_id,
+    NormalizedTender.platform_id,
+    NormalizedTender.external_id,
+    NormalizedTender.title,
+    NormalizedTender.description,
+    NormalizedTender.summary,
+    NormalizedTender.ai_summary,
+    NormalizedTender.category,
+    NormalizedTender.customer_name,
+    NormalizedTender.customer_contact,
+    NormalizedTender.budget_amount,
+    NormalizedTender.budget_currency,
+    NormalizedTender.budget_min,
+    NormalizedTender.budget_max,
+    NormalizedTender.published_date,
+    NormalizedTender.deadline_date,
+    NormalizedTender.start_date,
+    NormalizedTender.end_date,
+    NormalizedTender.status,
+    NormalizedTender.source_url,
+    NormalizedTender.requirements,
+    NormalizedTender.criteria,
+    NormalizedTender.restrictions,
+    NormalizedTender.ai_extracted,
+    NormalizedTender.ai_keywords,
+    NormalizedTender.attachments,
+    NormalizedTender.data_quality_score,
+    NormalizedTender.normalized_at,
+)
 
 
 class DetailService:
@@ -13,6 +47,7 @@ class DetailService:
     def __init__(self, db: Session):
         self.db = db
         self.tender_repo = NormalizedTenderRepository(db)
+        self.cache = get_detail_cache()
     
     def get_tender(self, tender_id: str) -> Optional[Dict[str, Any]]:
         """Get tender details
@@ -23,12 +58,20 @@ class DetailService:
         Returns:
             Tender data or None
         """
-        tender = self.tender_repo.get_by_id(tender_id)
+        # Local LRU -> Redis -> PostgreSQL; repository writes invalidate the entry
+        tender = self.cache.get_or_compute(tender_id, lambda: self._load_tender(tender_id))
         if not tender:
             logger.warning(f"Tender not found: {tender_id}")
             return None
         
-        return self._tender_to_dict(tender)
+        return tender
+    
+    def _load_tender(self, tender_id: str) -> Optional[Dict[str, Any]]:
+        """Load tender detail with a column-projected query"""
+        row = self.db.query(*DETAIL_COLUMNS).filter(
+            NormalizedTender.tender_id == tender_id
+        ).first()
+        return self._tender_to_dict(row) if row else None
     
     def get_tender_by_external_id(self, external_id: str, platform_id: str) -> Optional[Dict[str, Any]]:
         """Get tender by external ID
@@ -40,9 +83,9 @@ class DetailService:
         Returns:
             Tender data or None
         """
-        tender = self.db.query(__import__('factory_parsers.normalizer_service.models', fromlist=['NormalizedTender']).NormalizedTender).filter(
-            __import__('factory_parsers.normalizer_service.models', fromlist=['NormalizedTender']).NormalizedTender.external_id == external_id,
-            __import__('factory_parsers.normalizer_service.models', fromlist=['NormalizedTender']).NormalizedTender.platform_id == platform_id
+        tender = self.db.query(*DETAIL_COLUMNS).filter(
+            NormalizedTender.external_id == external_id,
+            NormalizedTender.platform_id == platform_id
         ).first()
         
         if not tender:
@@ -52,7 +95,7 @@ class DetailService:
     
     @staticmethod
     def _tender_to_dict(tender) -> Dict[str, Any]:
-        """Convert ORM object to dict"""
+        """Convert ORM object or DETAIL_COLUMNS row to JSON-serializable dict"""
         return {
             'id': tender.id,
             'tender_id': tender.tender_id,
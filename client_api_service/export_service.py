@@ -0,0 +1,109 @@
+"""Bulk export of search results as NDJSON or CSV"""
+
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, List, Optional
+
+from shared.logger import logger
+from search_service.query_builder import EXPORT_VIEW, RESULT_VIEWS
+from search_service.searcher import AsyncTenderSearcher
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+# Columns exported when the caller doesn't pick fields
+EXPORT_FIELDS = RESULT_VIEWS[EXPORT_VIEW]['_source']['includes']
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+class ExportService:
+    """Stream every matching tender without deep pagination
+
+    Results are walked with a point-in-time and search_after, so memory stays
+    bounded by one batch and the index snapshot is consistent for the whole
+    export. Only the exported fields are fetched from `_source`.
+    """
+
+    def __init__(self):
+        self.searcher = AsyncTenderSearcher()
+
+    async def stream(self,
+                     query: str,
+                     format: str = 'ndjson',
+                     fields: Optional[List[str]] = None,
+                     include_text: bool = False,
+                     platform: Optional[str] = None,
+                     category: Optional[str] = None,
+                     customer: Optional[str] = None,
+                     budget_min: Optional[float] = None,
+                     budget_max: Optional[float] = None) -> AsyncIterator[str]:
+        """Stream export body
+
+        Args:
+            query: Search query
+            format: "ndjson" or "csv"
+            fields: Fields to export (default EXPORT_FIELDS)
+            include_text: Also export extracted attachment text
+            platform: Platform filter
+            category: Category filter
+            customer: Customer filter
+            budget_min: Min budget
+            budget_max: Max budget
+
+        Yields:
+            Body chunks, one per search batch
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        columns = list(fields or EXPORT_FIELDS)
+        if include_text and 'extracted_text' not in columns:
+            columns.append('extracted_text')
+
+        writer = None
+        buffer = None
+        if format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+
+        exported = 0
+        batches = self.searcher.iter_export(
+            query,
+            platform=platform,
+            category=category,
+            customer=customer,
+            budget_min=budget_min,
+            budget_max=budget_max,
+            source={'includes': columns},
+        )
+        try:
+            async for docs in batches:
+                exported += len(docs)
+                if writer is None:
+                    yield ''.join(
+                        json.dumps({column: doc.get(column) for column in columns}, ensure_ascii=False, default=str) + '\n'
+                        for doc in docs
+                    )
+                    continue
+
+                for doc in docs:
+                    writer.writerow([_csv_value(doc.get(column)) for column in columns])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+            if writer is not None and exported == 0:
+                yield buffer.getvalue()  # Header only
+        finally:
+            await batches.aclose()  # Releases the point-in-time on client disconnect
+
+        logger.info(f"Exported {exported} tenders as {format} for query: {query}")
@@ -1,18 +1,21 @@
 """Client API routes (Sprint 34)"""
 
 from typing import Optional
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from factory_parsers.shared.database import get_db
-from .search_service import SearchService
+from shared.database import get_db
+from search_service.query_builder import LIST_VIEW
+from .search_service import AsyncSearchService
 from .detail_service import DetailService
+from .export_service import EXPORT_FORMATS, ExportService
 
 router = APIRouter(prefix="/api/v1", tags=["client-api"])
 
 
 @router.get("/search")
-def search_tenders(
+async def search_tenders(
     query: str = Query(..., description="Search query"),
     platform: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
@@ -21,19 +24,63 @@ def search_tenders(
     budget_max: Optional[float] = Query(None),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description='"*" starts cursor pagination; then pass next_cursor'),
+    view: str = Query(LIST_VIEW, description="Result view: list, detail or export"),
 ):
     """Search tenders"""
-    service = SearchService(db)
-    return service.search(
+    service = AsyncSearchService()
+    try:
+        return await service.search(
+            query=query,
+            platform=platform,
+            category=category,
+            customer=customer,
+            budget_min=budget_min,
+            budget_max=budget_max,
+            page=page,
+            size=size,
+            cursor=cursor,
+            view=view,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/search/export")
+async def export_tenders(
+    query: str = Query(..., description="Search query"),
+    platform: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    customer: Optional[str] = Query(None),
+    budget_min: Optional[float] = Query(None),
+    budget_max: Optional[float] = Query(None),
+    format: str = Query("ndjson", description="ndjson or csv"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to export"),
+    include_text: bool = Query(False, description="Include extracted attachment text"),
+):
+    """Export all matching tenders as a streamed NDJSON or CSV file"""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format: {format}",
+        )
+
+    field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    body = ExportService().stream(
         query=query,
+        format=format,
+        fields=field_list,
+        include_text=include_text,
         platform=platform,
         category=category,
         customer=customer,
         budget_min=budget_min,
         budget_max=budget_max,
-        page=page,
-        size=size,
+    )
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="tenders.{format}"'},
     )
 
 
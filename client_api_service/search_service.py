@@ -3,17 +3,22 @@
 from typing import Dict, Any, Optional, List
 from sqlalchemy.orm import Session
 
-from factory_parsers.shared.logger import logger
-from factory_parsers.shared.cache import Cache
-from factory_parsers.search_service.searcher import TenderSearcher
+from shared.config import get_settings
+from shared.logger import logger
+from shared.index_generation import get_async_index_generations, get_index_generations
+from shared.tiered_cache import get_async_tiered_cache, get_tiered_cache
+from search_service.query_builder import LIST_VIEW
+from search_service.searcher import AsyncTenderSearcher, TenderSearcher
 
 
 class SearchService:
     """Search service with caching and filtering"""
     
     def __init__(self, db: Session = None):
+        settings = get_settings()
         self.searcher = TenderSearcher()
-        self.cache = Cache(namespace="search")
+        self.cache = get_tiered_cache("search", settings.search_cache_ttl, settings.search_cache_stale_ttl)
+        self.generations = get_index_generations()
     
     def search(self,
                query: str,
@@ -23,7 +28,9 @@ class SearchService:
                budget_min: Optional[float] = None,
                budget_max: Optional[float] = None,
                page: int = 1,
-               size: int = 20) -> Dict[str, Any]:
+               size: int = 20,
+               cursor: Optional[str] = None,
+               view: str = LIST_VIEW) -> Dict[str, Any]:
         """Search tenders
         
         Args:
@@ -35,10 +42,29 @@ class SearchService:
             budget_max: Max budget
             page: Page number
             size: Results per page
+            cursor: Cursor pagination token ("*" to start); not cached
+            view: Result view; the list view returns highlights instead of
+                description/attachment text
         
         Returns:
             Search results
         """
+        # Writes to the searched platform/category change the generation, and so the key;
+        # cursor pages and searches while generations are unavailable aren't cached
+        generation = self.generations.current(platform, category) if cursor is None else None
+        if generation is None:
+            return self.searcher.search(
+                query=query,
+                platform=platform,
+                category=category,
+                customer=customer,
+                budget_min=budget_min,
+                budget_max=budget_max,
+                size=size,
+                cursor=cursor,
+                view=view,
+            )
+        
         # Build cache key
         cache_key = self._build_cache_key({
             'query': query,
@@ -49,17 +75,13 @@ class SearchService:
             'budget_max': budget_max,
             'page': page,
             'size': size,
+            'view': view,
+            'generation': generation,
         })
         
-        # Check cache
-        cached = self.cache.get(cache_key)
-        if cached:
-            logger.debug(f"Cache hit for query: {query}")
-            return cached
-        
-        # Execute search
+        # Local LRU -> Redis -> Elasticsearch; concurrent misses share one search
         from_offset = (page - 1) * size
-        results = self.searcher.search(
+        results = self.cache.get_or_compute(cache_key, lambda: self.searcher.search(
             query=query,
             platform=platform,
             category=category,
@@ -68,10 +90,8 @@ class SearchService:
             budget_max=budget_max,
             size=size,
             from_=from_offset,
-        )
-        
-        # Cache results (60 sec)
-        self.cache.set(cache_key, results, ttl=60)
+            view=view,
+        ))
         logger.info(f"Search: {query}, results: {results['total']}")
         
         return results
@@ -83,3 +103,69 @@ class SearchService:
         import json
         payload = json.dumps(params, sort_keys=True)
         return hashlib.md5(payload.encode()).hexdigest()
+
+
+class AsyncSearchService:
+    """Non-blocking SearchService for async route handlers (shares its cache entries)"""
+    
+    def __init__(self):
+        settings = get_settings()
+        self.searcher = AsyncTenderSearcher()
+        self.cache = get_async_tiered_cache("search", settings.search_cache_ttl, settings.search_cache_stale_ttl)
+        self.generations = get_async_index_generations()
+    
+    async def search(self,
+                     query: str,
+                     platform: Optional[str] = None,
+                     category: Optional[str] = None,
+                     customer: Optional[str] = None,
+                     budget_min: Optional[float] = None,
+                     budget_max: Optional[float] = None,
+                     page: int = 1,
+                     size: int = 20,
+                     cursor: Optional[str] = None,
+                     view: str = LIST_VIEW) -> Dict[str, Any]:
+        """Search tenders (see SearchService.search)"""
+        generation = await self.generations.current(platform, category) if cursor is None else None
+        if generation is None:
+            # Cursor pages are one-off reads of a point-in-time: never cached
+            return await self.searcher.search(
+                query=query,
+                platform=platform,
+                category=category,
+                customer=customer,
+                budget_min=budget_min,
+                budget_max=budget_max,
+                size=size,
+                cursor=cursor,
+                view=view,
+            )
+        
+        cache_key = SearchService._build_cache_key({
+            'query': query,
+            'platform': platform,
+            'category': category,
+            'customer': customer,
+            'budget_min': budget_min,
+            'budget_max': budget_max,
+            'page': page,
+            'size': size,
+            'view': view,
+            'generation': generation,
+        })
+        
+        from_offset = (page - 1) * size
+        results = await self.cache.get_or_compute(cache_key, lambda: self.searcher.search(
+            query=query,
+            platform=platform,
+            category=category,
+            customer=customer,
+            budget_min=budget_min,
+            budget_max=budget_max,
+            size=size,
+            from_=from_offset,
+            view=view,
+        ))
+        logger.info(f"Search: {query}, results: {results['total']}")
+        
+        return results
@@ -177,6 +177,13 @@ async def startup_event():
     Base.metadata.create_all(bind=engine)
     
     logger.info("Database tables created successfully")
+    
+    # Bootstrap the search index once, not on the first search request
+    try:
+        from search_service.elasticsearch_client import ElasticsearchClient
+        ElasticsearchClient()
+    except Exception as e:
+        logger.warning(f"Elasticsearch index bootstrap failed, will retry on first use: {str(e)}")
     logger.info("Tender Sniper application started")
     logger.info("API documentation available at /docs")
     logger.info("Monitoring dashboard available at http://localhost:3000")
@@ -185,6 +192,11 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event"""
+    from search_service.elasticsearch_client import close_async_elasticsearch
+    from shared.cache import close_async_redis
+    
+    await close_async_elasticsearch()
+    await close_async_redis()
     logger.info("Tender Sniper application stopped")
 
 
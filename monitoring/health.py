@@ -2,12 +2,11 @@
 
 from typing import Dict, Any
 import psycopg2
-from redis import Redis
-from elasticsearch import Elasticsearch
 
-from factory_parsers.shared.database import SessionLocal
-from factory_parsers.search_service.elasticsearch_client import ElasticsearchClient
-from factory_parsers.shared.logger import logger
+from shared.cache import get_redis
+from shared.database import SessionLocal
+from search_service.elasticsearch_client import get_elasticsearch, TENDER_INDEX_ALIAS
+from shared.logger import logger
 
 
 class HealthCheck:
@@ -29,10 +28,7 @@ class HealthCheck:
     def check_redis() -> Dict[str, Any]:
         """Check Redis connectivity"""
         try:
-            from factory_parsers.shared.config import get_settings
-            settings = get_settings()
-            redis = Redis.from_url(settings.redis_url)
-            redis.ping()
+            get_redis().ping()  # Shared pool, no new connection per probe
             return {"status": "healthy", "service": "redis"}
         except Exception as e:
             logger.error(f"Redis health check failed: {str(e)}")
@@ -42,8 +38,8 @@ class HealthCheck:
     def check_elasticsearch() -> Dict[str, Any]:
         """Check Elasticsearch connectivity"""
         try:
-            es_client = ElasticsearchClient()
-            stats = es_client.get_stats()
+            es = get_elasticsearch()  # Shared pooled client, no index bootstrap per probe
+            stats = es.indices.stats(index=TENDER_INDEX_ALIAS)["_all"]["primaries"]["docs"]
             return {"status": "healthy", "service": "elasticsearch", "stats": stats}
         except Exception as e:
             logger.error(f"Elasticsearch health check failed: {str(e)}")
@@ -1,6 +1,6 @@
 """Normalizer Service - Data standardization and text extraction"""
 
-from .normalizer import Normalizer
+from .normalizer import TenderNormalizer
 from .text_extractor import TextExtractor
 
-__all__ = ["Normalizer", "TextExtractor"]
+__all__ = ["TenderNormalizer", "TextExtractor"]
@@ -0,0 +1,180 @@
+"""Streaming member extraction from archive attachments (ZIP/RAR/7z)"""
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from shared.config import get_settings
+from shared.logger import logger
+
+ARCHIVE_SUFFIXES = {'.zip', '.rar', '.7z'}
+
+# Members dispatched to TextExtractor; nested archives are not unpacked
+MEMBER_SUFFIXES = {'.pdf', '.docx', '.xlsx', '.txt'}
+
+COPY_CHUNK_SIZE = 64 * 1024
+
+
+class ArchiveLimitError(ValueError):
+    """Archive exceeds member count, size or compression ratio limits"""
+
+
+def is_archive(file_path: str) -> bool:
+    """Check whether file is a supported archive by suffix"""
+    return Path(file_path).suffix.lower() in ARCHIVE_SUFFIXES
+
+
+class ArchiveExtractor:
+    """Unpack supported archive members one at a time under zip-bomb guards
+
+    Limits are checked against the archive directory before anything is
+    unpacked, and again against the bytes actually written, since headers
+    can lie. Members are written to a private temp directory (ZIP/RAR members
+    under generated names, never the member path), which is removed when
+    `members()` exits.
+
+    Usage:
+        with ArchiveExtractor().members(path) as members:
+            for name, member_path in members:
+                ...
+    """
+
+    def __init__(
+        self,
+        max_members: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+        max_member_bytes: Optional[int] = None,
+        max_compression_ratio: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.max_members = max_members or settings.archive_max_members
+        self.max_total_bytes = max_total_bytes or settings.archive_max_total_bytes
+        self.max_member_bytes = max_member_bytes or settings.archive_max_member_bytes
+        self.max_compression_ratio = max_compression_ratio or settings.archive_max_compression_ratio
+
+    @contextmanager
+    def members(self, archive_path: str) -> Iterator[Iterator[Tuple[str, str]]]:
+        """Stream supported members of an archive to temp files
+
+        Args:
+            archive_path: Path to .zip/.rar/.7z file
+
+        Yields:
+            Iterator of (member name, temp file path); files stay on disk
+            until the context exits, so they can be parsed concurrently
+        """
+        work_dir = tempfile.mkdtemp(prefix='archive-')
+        try:
+            yield self._iter_members(archive_path, work_dir)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _iter_members(self, archive_path: str, work_dir: str) -> Iterator[Tuple[str, str]]:
+        suffix = Path(archive_path).suffix.lower()
+        if suffix == '.zip':
+            return self._iter_zip(archive_path, work_dir)
+        elif suffix == '.rar':
+            return self._iter_rar(archive_path, work_dir)
+        elif suffix == '.7z':
+            return self._iter_7z(archive_path, work_dir)
+        raise ValueError(f"Unsupported archive format: {suffix}")
+
+    def _iter_zip(self, archive_path: str, work_dir: str) -> Iterator[Tuple[str, str]]:
+        import zipfile
+
+        with zipfile.ZipFile(archive_path) as archive:
+            yield from self._stream_members(archive, work_dir)
+
+    def _iter_rar(self, archive_path: str, work_dir: str) -> Iterator[Tuple[str, str]]:
+        try:
+            import rarfile
+        except ImportError:
+            raise ValueError("RAR support requires the 'rarfile' package")
+
+        with rarfile.RarFile(archive_path) as archive:
+            yield from self._stream_members(archive, work_dir)
+
+    def _iter_7z(self, archive_path: str, work_dir: str) -> Iterator[Tuple[str, str]]:
+        try:
+            import py7zr
+        except ImportError:
+            raise ValueError("7z support requires the 'py7zr' package")
+
+        # Solid 7z blocks can't be read member by member; unpack only the
+        # supported members in one pass, after the directory passed the limits
+        with py7zr.SevenZipFile(archive_path, mode='r') as archive:
+            infos = [info for info in archive.list() if not info.is_directory]
+            self._check_directory([
+                (info.filename, info.uncompressed, info.compressed or 0) for info in infos
+            ])
+            targets = [info.filename for info in infos if self._is_member_supported(info.filename)]
+            if not targets:
+                return
+            unpack_dir = os.path.join(work_dir, '7z')
+            archive.extract(path=unpack_dir, targets=targets)
+
+        root = os.path.realpath(unpack_dir)
+        written = 0
+        for name in targets:
+            member_path = os.path.realpath(os.path.join(unpack_dir, name))
+            if not member_path.startswith(root + os.sep) or not os.path.isfile(member_path):
+                continue
+            size = os.path.getsize(member_path)
+            written += size
+            if size > self.max_member_bytes or written > self.max_total_bytes:
+                raise ArchiveLimitError(f"{name}: unpacked size exceeds archive limits")
+            yield name, member_path
+
+    def _stream_members(self, archive, work_dir: str) -> Iterator[Tuple[str, str]]:
+        """Walk a zipfile/rarfile archive, copying one member at a time"""
+        infos = [info for info in archive.infolist() if not info.is_dir()]
+        self._check_directory([(info.filename, info.file_size, info.compress_size) for info in infos])
+
+        written = 0
+        for info in infos:
+            if not self._is_member_supported(info.filename):
+                continue
+            with archive.open(info) as source:
+                member_path, size = self._copy_member(info.filename, source, work_dir)
+            written += size
+            if written > self.max_total_bytes:
+                raise ArchiveLimitError(f"Archive unpacks to over {self.max_total_bytes} bytes")
+            yield info.filename, member_path
+
+    def _check_directory(self, entries: List[Tuple[str, int, int]]) -> None:
+        """Reject archive from its declared member sizes before unpacking"""
+        if len(entries) > self.max_members:
+            raise ArchiveLimitError(f"Archive has {len(entries)} members, limit is {self.max_members}")
+
+        total = 0
+        for name, size, compressed in entries:
+            if size > self.max_member_bytes:
+                raise ArchiveLimitError(f"{name}: {size} bytes exceeds member limit {self.max_member_bytes}")
+            if compressed and size / compressed > self.max_compression_ratio:
+                raise ArchiveLimitError(f"{name}: compression ratio {size // compressed} exceeds {self.max_compression_ratio}")
+            total += size
+
+        if total > self.max_total_bytes:
+            raise ArchiveLimitError(f"Archive unpacks to {total} bytes, limit is {self.max_total_bytes}")
+
+    def _copy_member(self, name: str, source, work_dir: str) -> Tuple[str, int]:
+        """Copy member stream to a temp file, enforcing limits on actual bytes"""
+        fd, member_path = tempfile.mkstemp(suffix=Path(name).suffix.lower(), dir=work_dir)
+        written = 0
+        with os.fdopen(fd, 'wb') as target:
+            for chunk in iter(lambda: source.read(COPY_CHUNK_SIZE), b''):
+                written += len(chunk)
+                if written > self.max_member_bytes:
+                    raise ArchiveLimitError(f"{name}: unpacked size exceeds member limit {self.max_member_bytes}")
+                target.write(chunk)
+        return member_path, written
+
+    def _is_member_supported(self, name: str) -> bool:
+        suffix = Path(name).suffix.lower()
+        if suffix not in MEMBER_SUFFIXES:
+            logger.debug(f"Skipping archive member {name}: unsupported format")
+            return False
+        return True
@@ -1,10 +1,11 @@
 """Duplicate detection for tenders"""
 
 import hashlib
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
-fromshared.logger import logger
+from shared.logger import logger
 from .models import NormalizedTender
 
 
@@ -35,20 +36,65 @@ class DuplicateDetector:
             logger.debug(f"Duplicate detected (exact ID): {external_id}")
             return True, exact_match.id
         
-        # Strategy 2: Title + platform fuzzy match
-        title_hash = self._hash_title(title)
-        fuzzy_match = self.db.query(NormalizedTender).filter(
+        # Strategy 2: Title + platform fuzzy match (indexed fingerprint lookup)
+        fuzzy_match = self.db.query(NormalizedTender.id).filter(
             NormalizedTender.platform_id == platform_id,
+            NormalizedTender.title_fingerprint == self.title_fingerprint(title),
             NormalizedTender.is_duplicate == False
-        ).all()
+        ).first()
         
-        for tender in fuzzy_match:
-            if self._hash_title(tender.title) == title_hash:
-                logger.debug(f"Duplicate detected (fuzzy title): {title}")
-                return True, tender.id
+        if fuzzy_match:
+            logger.debug(f"Duplicate detected (fuzzy title): {title}")
+            return True, fuzzy_match.id
         
         return False, None
     
+    def find_existing(
+        self,
+        platform_id: str,
+        external_ids: List[str],
+        fingerprints: List[str],
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Check a whole batch for duplicates with a single query
+        
+        Args:
+            platform_id: Platform identifier
+            external_ids: External platform IDs of the batch
+            fingerprints: Title fingerprints of the batch
+        
+        Returns:
+            ({external_id: id}, {title_fingerprint: id}) of already stored tenders
+        """
+        conditions = []
+        if external_ids:
+            conditions.append(NormalizedTender.external_id.in_(set(external_ids)))
+        if fingerprints:
+            conditions.append(and_(
+                NormalizedTender.title_fingerprint.in_(set(fingerprints)),
+                NormalizedTender.is_duplicate == False
+            ))
+        if not conditions:
+            return {}, {}
+        
+        rows = self.db.query(
+            NormalizedTender.id,
+            NormalizedTender.external_id,
+            NormalizedTender.title_fingerprint,
+            NormalizedTender.is_duplicate,
+        ).filter(
+            NormalizedTender.platform_id == platform_id,
+            or_(*conditions)
+        ).all()
+        
+        by_external_id = {}
+        by_fingerprint = {}
+        for row in rows:
+            by_external_id.setdefault(row.external_id, row.id)
+            if not row.is_duplicate and row.title_fingerprint:
+                by_fingerprint.setdefault(row.title_fingerprint, row.id)
+        
+        return by_external_id, by_fingerprint
+    
     def mark_as_duplicate(self, tender_id: int, duplicate_of_id: int) -> None:
         """Mark tender as duplicate
         
@@ -82,16 +128,52 @@ class DuplicateDetector:
         
         return [d.id for d in duplicates]
     
+    def backfill_title_fingerprints(self, batch_size: int = 1000) -> int:
+        """Populate title_fingerprint for rows stored before the column existed
+        
+        Args:
+            batch_size: Rows updated per transaction
+        
+        Returns:
+            Number of updated rows
+        """
+        updated = 0
+        last_id = 0
+        
+        while True:
+            rows = self.db.query(NormalizedTender.id, NormalizedTender.title).filter(
+                NormalizedTender.id > last_id,
+                NormalizedTender.title_fingerprint == None
+            ).order_by(NormalizedTender.id).limit(batch_size).all()
+            
+            if not rows:
+                break
+            
+            self.db.bulk_update_mappings(NormalizedTender, [
+                {"id": row.id, "title_fingerprint": self.title_fingerprint(row.title)}
+                for row in rows
+            ])
+            self.db.commit()
+            
+            updated += len(rows)
+            last_id = rows[-1].id
+            logger.info(f"Backfilled title fingerprints: {updated} rows")
+        
+        return updated
+    
     @staticmethod
-    def _hash_title(title: str) -> str:
+    def title_fingerprint(title: Optional[str]) -> str:
         """Create normalized hash of title for fuzzy matching
         
+        Stored in NormalizedTender.title_fingerprint at insert time, so the
+        fuzzy check is a single indexed lookup instead of a platform scan.
+        
         Args:
             title: Tender title
         
         Returns:
             MD5 hash of normalized title
         """
-        # Normalize: lowercase, remove extra spaces, keep only alphanumeric + spaces
-        normalized = " ".join(title.lower().split())  # lowercase + collapse spaces
+        # Normalize: lowercase + collapse spaces
+        normalized = " ".join((title or "").lower().split())
         return hashlib.md5(normalized.encode()).hexdigest()
@@ -1,10 +1,20 @@
 """Elasticsearch indexing for normalized tenders"""
 
-from typing import Dict, Any, Optional
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
 
-fromshared.logger import logger
-fromsearch_service.elasticsearch_client import ElasticsearchClient
-from .models import NormalizedTender
+from shared.config import get_settings
+from shared.database import SessionLocal
+from shared.index_generation import get_index_generations
+from shared.logger import logger
+from search_service.elasticsearch_client import ElasticsearchClient, build_tender_document
+from .models import NormalizedTender, NormalizationLog
 
 
 class ElasticsearchIndexer:
@@ -12,7 +22,7 @@ class ElasticsearchIndexer:
     
     def __init__(self):
         self.es_client = ElasticsearchClient()
-        self.index_name = "tenders_normalized"
+        self.index_name = self.es_client.index_name
     
     def index_tender(self, tender: NormalizedTender) -> bool:
         """Index single tender
@@ -24,11 +34,13 @@ class ElasticsearchIndexer:
             Success status
         """
         try:
-            doc = self._tender_to_doc(tender)
-            self.es_client.index_document(
-                index=self.index_name,
-                doc_id=tender.tender_id,
-                document=doc
+            doc = build_tender_document(tender)
+            previous = self.es_client.get_partitions([tender.tender_id])
+            if not self.es_client.index_document(doc_id=tender.tender_id, document=doc):
+                return False
+            get_index_generations().bump_written(
+                [(tender.platform_id, tender.category)],
+                previous.values() if previous is not None else None,
             )
             logger.info(f"Indexed tender: {tender.tender_id}")
             return True
@@ -36,22 +48,25 @@ class ElasticsearchIndexer:
             logger.error(f"Failed to index tender {tender.tender_id}: {str(e)}")
             return False
     
-    def bulk_index(self, tenders: list) -> Dict[str, int]:
+    def bulk_index(self, tenders: list) -> int:
         """Bulk index multiple tenders
         
         Args:
             tenders: List of NormalizedTender records
         
         Returns:
-            Indexing stats {indexed: count, errors: count}
+            Number of indexed documents
         """
-        docs = [self._tender_to_doc(t) for t in tenders]
-        result = self.es_client.bulk_index(
-            index=self.index_name,
-            documents=docs
-        )
-        logger.info(f"Bulk indexed {len(tenders)} tenders")
-        return result
+        docs = [build_tender_document(t) for t in tenders]
+        previous = self.es_client.get_partitions(t.tender_id for t in tenders)
+        indexed = self.es_client.bulk_index(documents=docs)
+        if indexed:
+            get_index_generations().bump_written(
+                [(t.platform_id, t.category) for t in tenders],
+                previous.values() if previous is not None else None,
+            )
+        logger.info(f"Bulk indexed {indexed}/{len(tenders)} tenders")
+        return indexed
     
     def delete_tender(self, tender_id: str) -> bool:
         """Delete tender from index
@@ -63,43 +78,213 @@ class ElasticsearchIndexer:
             Success status
         """
         try:
-            self.es_client.delete_document(self.index_name, tender_id)
+            if not self.es_client.delete_document(tender_id):
+                return False
+            get_index_generations().bump_epoch()  # Partitions of the deleted document are unknown
             logger.info(f"Deleted tender from index: {tender_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to delete tender {tender_id}: {str(e)}")
             return False
+
+
+class BulkIndexBuffer:
+    """Buffered indexing sink for the normalizer
     
-    @staticmethod
-    def _tender_to_doc(tender: NormalizedTender) -> Dict[str, Any]:
-        """Convert NormalizedTender to ES document
+    Collects documents and sends them with the ES bulk helper once the buffer
+    reaches `max_docs` or its oldest document is `max_seconds` old. Failures
+    carry the id of the matching NormalizationLog; `mark_failed_logs` writes
+    them back, so the buffer can outlive the session that filled it (see
+    `get_index_buffer`). Successfully indexed rows get `indexed_at` set, which
+    lets the incremental indexer skip them. Safe to share between threads.
+    """
+    
+    def __init__(
+        self,
+        indexer: Optional[ElasticsearchIndexer] = None,
+        max_docs: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        refresh: Any = False,
+    ):
+        settings = get_settings()
+        self.indexer = indexer or ElasticsearchIndexer()
+        self.max_docs = max_docs or settings.es_bulk_max_docs
+        self.max_seconds = max_seconds if max_seconds is not None else settings.es_bulk_flush_seconds
+        self.refresh = refresh
+        self._actions: List[Dict[str, Any]] = []
+        self._logs: Dict[str, int] = {}
+        self._versions: Dict[str, datetime] = {}
+        self._first_added_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._actions)
+    
+    def add(self, tender: NormalizedTender, log=None) -> List[Dict[str, Any]]:
+        """Buffer tender for indexing, flushing if a threshold is reached
         
         Args:
             tender: NormalizedTender record
+            log: Committed NormalizationLog to report indexing failures to
         
         Returns:
-            Document for indexing
+            Per-document failures if a flush happened, otherwise []
         """
+        action = {
+            "_id": tender.tender_id,
+            "_source": build_tender_document(tender),
+        }
+        with self._lock:
+            self._actions.append(action)
+            self._versions[tender.tender_id] = tender.updated_at
+            if log is not None:
+                self._logs[tender.tender_id] = log.id
+            if self._first_added_at is None:
+                self._first_added_at = time.monotonic()
+        
+        if self.is_due():
+            return self.flush()
+        return []
+    
+    def is_due(self) -> bool:
+        """Check size and age thresholds"""
+        with self._lock:
+            if not self._actions:
+                return False
+            if len(self._actions) >= self.max_docs:
+                return True
+            return time.monotonic() - self._first_added_at >= self.max_seconds
+    
+    def flush(self) -> List[Dict[str, Any]]:
+        """Send buffered documents in one bulk request
+        
+        Returns:
+            Per-document failures [{tender_id, status, error, log_id}]
+        """
+        with self._lock:
+            if not self._actions:
+                return []
+            actions, logs, versions = self._actions, self._logs, self._versions
+            self._actions, self._logs, self._versions, self._first_added_at = [], {}, {}, None
+        
+        try:
+            success, errors = self.indexer.es_client.bulk(actions, refresh=self.refresh)
+            failures = [self._parse_error(error) for error in errors]
+        except Exception as e:
+            logger.error(f"Bulk indexing request failed: {str(e)}")
+            success = 0
+            failures = [
+                {"tender_id": action["_id"], "status": None, "error": str(e)}
+                for action in actions
+            ]
+        
+        # Only freshly inserted tenders (unique tender_id) pass through the
+        # sink, so there is no previously indexed partition to invalidate
+        if success:
+            get_index_generations().bump(
+                (action["_source"].get("platform"), action["_source"].get("category"))
+                for action in actions
+            )
+        
+        for failure in failures:
+            failure["log_id"] = logs.get(failure["tender_id"])
+        
+        failed_ids = {failure["tender_id"] for failure in failures}
+        self._mark_indexed([
+            {"b_tender_id": tender_id, "b_updated_at": updated_at}
+            for tender_id, updated_at in versions.items()
+            if tender_id not in failed_ids
+        ])
+        
+        if failures:
+            logger.warning(f"Bulk indexed {success}/{len(actions)} tenders, {len(failures)} failed")
+        else:
+            logger.info(f"Bulk indexed {success} tenders")
+        return failures
+    
+    @staticmethod
+    def mark_failed_logs(db: Session, failures: List[Dict[str, Any]]) -> None:
+        """Mark the NormalizationLog of each failed document 'partial'
+        
+        The caller commits the session.
+        
+        Args:
+            db: Database session
+            failures: Failures returned by `add` or `flush`
+        """
+        by_log_id = {failure["log_id"]: failure for failure in failures if failure.get("log_id")}
+        if not by_log_id:
+            return
+        
+        for log in db.query(NormalizationLog).filter(NormalizationLog.id.in_(by_log_id)).all():
+            log.status = 'partial'
+            log.warnings = (log.warnings or []) + [
+                f"Elasticsearch indexing failed: {by_log_id[log.id]['error']}"
+            ]
+    
+    @staticmethod
+    def _mark_indexed(versions: List[Dict[str, Any]]) -> None:
+        """Set `indexed_at` on rows still at the version that was indexed
+        
+        Uses its own session, like the flusher thread. `updated_at` is written
+        back unchanged so its onupdate doesn't make the row look modified.
+        """
+        if not versions:
+            return
+        
+        table = NormalizedTender.__table__
+        statement = (
+            update(table)
+            .where(table.c.tender_id == bindparam("b_tender_id"))
+            .where(table.c.updated_at == bindparam("b_updated_at"))
+            .values(indexed_at=bindparam("b_updated_at"), updated_at=table.c.updated_at)
+        )
+        db = SessionLocal()
+        try:
+            db.execute(statement, versions)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            # Harmless: the incremental indexer re-sends the rows
+            logger.error(f"Failed to record indexed tenders: {str(e)}")
+        finally:
+            db.close()
+    
+    @contextmanager
+    def bulk_load(self) -> Iterator["BulkIndexBuffer"]:
+        """Disable index refresh for the duration of a large load"""
+        es_client = self.indexer.es_client
+        es_client.set_refresh_interval("-1")
+        try:
+            yield self
+            self.flush()
+        finally:
+            es_client.set_refresh_interval(get_settings().es_refresh_interval)
+            try:
+                es_client.refresh()
+            except Exception as e:
+                logger.error(f"Failed to refresh index after bulk load: {str(e)}")
+            # Earlier flushes bumped generations before their documents became visible
+            get_index_generations().bump_epoch()
+    
+    @staticmethod
+    def _parse_error(error: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert bulk helper error item to failure record"""
+        info = next(iter(error.values()), {}) if isinstance(error, dict) else {}
+        reason = info.get("error")
+        if isinstance(reason, dict):
+            reason = reason.get("reason") or reason.get("type")
         return {
-            "tender_id": tender.tender_id,
-            "platform_id": tender.platform_id,
-            "external_id": tender.external_id,
-            "title": tender.title,
-            "description": tender.description,
-            "summary": tender.summary or tender.ai_summary,
-            "category": tender.category,
-            "customer_name": tender.customer_name,
-            "budget_amount": tender.budget_amount,
-            "budget_currency": tender.budget_currency,
-            "status": tender.status,
-            "published_date": tender.published_date.isoformat() if tender.published_date else None,
-            "deadline_date": tender.deadline_date.isoformat() if tender.deadline_date else None,
-            "start_date": tender.start_date.isoformat() if tender.start_date else None,
-            "end_date": tender.end_date.isoformat() if tender.end_date else None,
-            "requirements": tender.requirements or [],
-            "criteria": tender.criteria or [],
-            "ai_keywords": tender.ai_keywords or [],
-            "data_quality_score": tender.data_quality_score,
-            "is_duplicate": tender.is_duplicate,
-            "normalized_at": tender.normalized_at.isoformat(),
+            "tender_id": info.get("_id"),
+            "status": info.get("status"),
+            "error": str(reason or info.get("exception") or error),
         }
+
+
+@lru_cache()
+def get_index_buffer() -> BulkIndexBuffer:
+    """Get process-wide buffer shared by single-tender normalization tasks
+    
+    Flushed by the worker (see normalizer_service.tasks), not per task.
+    """
+    return BulkIndexBuffer()
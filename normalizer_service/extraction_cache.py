@@ -0,0 +1,178 @@
+"""Content-addressed cache of text extracted from attachments"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from shared.config import get_settings
+from shared.logger import logger
+from shared.metrics import extraction_cache_requests_total, extraction_cache_evictions_total
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ExtractionCache:
+    """Disk cache of extracted text keyed by SHA-256 of the file bytes
+
+    Layout under `cache_dir`:
+        text/<sha[:2]>/<sha>.txt.gz   extracted text
+        urls/<sha256(url)>.json       {etag, last_modified, sha256} for conditional GETs
+
+    Entries are evicted oldest-access-first once the text store exceeds
+    `max_bytes`. Several worker processes may share the same directory.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        settings = get_settings()
+        self.root = Path(
+            cache_dir
+            or settings.extraction_cache_dir
+            or os.path.join(tempfile.gettempdir(), "tender-extraction-cache")
+        )
+        self.max_bytes = max_bytes or settings.extraction_cache_max_bytes
+        self.text_dir = self.root / "text"
+        self.url_dir = self.root / "urls"
+        self.text_dir.mkdir(parents=True, exist_ok=True)
+        self.url_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._size = sum(entry.stat().st_size for entry in self.text_dir.glob("*/*.txt.gz"))
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """SHA-256 of file contents"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, sha256: str) -> Optional[str]:
+        """Get cached text by content hash"""
+        path = self._text_path(sha256)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                text = file.read()
+            os.utime(path)  # Access time for eviction order
+        except (FileNotFoundError, OSError, EOFError):
+            extraction_cache_requests_total.labels(kind="content", result="miss").inc()
+            return None
+
+        extraction_cache_requests_total.labels(kind="content", result="hit").inc()
+        return text
+
+    def set(self, sha256: str, text: str) -> None:
+        """Store extracted text by content hash"""
+        path = self._text_path(sha256)
+        path.parent.mkdir(exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as file:
+                file.write(text.encode("utf-8"))
+            size = os.path.getsize(tmp_path)
+            try:
+                replaced = path.stat().st_size  # Overwrite: don't count the old file twice
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            self._size += size - replaced
+            over_limit = self._size > self.max_bytes
+        if over_limit:
+            self._evict()
+
+    def get_or_extract(self, file_path: str, extract: Callable[[str], str], sha256: Optional[str] = None) -> str:
+        """Return cached text for file contents or extract and cache it
+
+        Args:
+            file_path: Path to file
+            extract: Extractor called on cache miss
+            sha256: Precomputed content hash (e.g. computed while downloading)
+
+        Returns:
+            Extracted text
+        """
+        sha256 = sha256 or self.hash_file(file_path)
+        text = self.get(sha256)
+        if text is None:
+            text = extract(file_path)
+            if text:  # Don't pin failed/empty extractions
+                self.set(sha256, text)
+        return text
+
+    def get_url_validators(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get {etag, last_modified, sha256} remembered for URL"""
+        try:
+            with open(self._url_path(url), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def set_url_validators(self, url: str, sha256: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Remember HTTP validators and content hash for URL"""
+        if not etag and not last_modified:
+            return
+        path = self._url_path(url)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"etag": etag, "last_modified": last_modified, "sha256": sha256}, file)
+        os.replace(tmp_path, path)
+
+    def record_url_hit(self, hit: bool) -> None:
+        """Count conditional GET outcome"""
+        extraction_cache_requests_total.labels(kind="url", result="hit" if hit else "miss").inc()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries down to 90% of the limit"""
+        entries = []
+        for path in self.text_dir.glob("*/*.txt.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._size = total
+        if evicted:
+            extraction_cache_evictions_total.inc(evicted)
+            logger.info(f"Extraction cache evicted {evicted} entries, {total} bytes left")
+
+    def _text_path(self, sha256: str) -> Path:
+        return self.text_dir / sha256[:2] / f"{sha256}.txt.gz"
+
+    def _url_path(self, url: str) -> Path:
+        return self.url_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+
+@lru_cache()
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Get process-wide extraction cache (None if disabled)"""
+    if not get_settings().extraction_cache_enabled:
+        return None
+    return ExtractionCache()
@@ -0,0 +1,330 @@
+"""Parallel attachment text extraction (streaming downloads + process-pool parsing)"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from billiard.einfo import ExceptionWithTraceback
+from billiard.exceptions import TimeLimitExceeded
+from billiard.pool import Pool
+
+from shared.config import get_settings
+from shared.logger import logger
+from .archive_extractor import ArchiveExtractor, is_archive
+from .extraction_cache import get_extraction_cache
+from .text_extractor import TextExtractor
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Fallback file suffix when the URL has none (e.g. /download?id=123)
+SUFFIX_BY_CONTENT_TYPE = {
+    'application/pdf': '.pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': '.xlsx',
+    'text/plain': '.txt',
+    'application/zip': '.zip',
+    'application/x-zip-compressed': '.zip',
+    'application/vnd.rar': '.rar',
+    'application/x-rar-compressed': '.rar',
+    'application/x-7z-compressed': '.7z',
+}
+
+
+class FileTooLargeError(ValueError):
+    """Attachment exceeds the configured download size cap"""
+
+
+def download_to_temp(
+    session: requests.Session,
+    url: str,
+    max_bytes: int,
+    timeout: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Stream URL to a temp file without buffering it in memory
+
+    The SHA-256 of the body is computed while streaming, so content-addressed
+    cache lookups cost no extra read.
+
+    Args:
+        session: HTTP session (connection pool)
+        url: URL to file
+        max_bytes: Abort once the body exceeds this size
+        timeout: Connect/read timeout
+        headers: Extra request headers (e.g. If-None-Match)
+
+    Returns:
+        {path, sha256, etag, last_modified, not_modified}; path is None on
+        304 Not Modified, otherwise the caller removes the file
+    """
+    with session.get(url, stream=True, timeout=timeout, headers=headers) as response:
+        info = {
+            'path': None,
+            'sha256': None,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'not_modified': response.status_code == 304,
+        }
+        if info['not_modified']:
+            return info
+        response.raise_for_status()
+
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > max_bytes:
+            raise FileTooLargeError(f"{url}: Content-Length {length} exceeds {max_bytes} bytes")
+
+        suffix = Path(urlparse(url).path).suffix
+        if not suffix:
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            suffix = SUFFIX_BY_CONTENT_TYPE.get(content_type, '')
+
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+        try:
+            written = 0
+            with os.fdopen(fd, 'wb') as tmp:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise FileTooLargeError(f"{url}: body exceeds {max_bytes} bytes")
+                    digest.update(chunk)
+                    tmp.write(chunk)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    info['path'] = tmp_path
+    info['sha256'] = digest.hexdigest()
+    return info
+
+
+def _extract_file(file_path: str, max_chars: Optional[int] = None, max_pages: Optional[int] = None) -> str:
+    """Parse file in a pool worker process"""
+    return TextExtractor.extract_from_file(file_path, max_chars, max_pages)
+
+
+class ExtractionEngine:
+    """Extract text from many attachments concurrently
+
+    Downloads run on a thread pool sharing one pooled HTTP session and stream
+    to disk under a size cap; CPU-bound parsing runs in a bounded process pool
+    with a per-file timeout. The pool is billiard's (Celery's multiprocessing
+    fork), which can start from daemonic prefork workers; its hard time limit
+    kills a parser stuck past the timeout and replaces the process.
+
+    Usage:
+        with ExtractionEngine() as engine:
+            for result in engine.extract_many(urls):
+                ...
+    """
+
+    def __init__(
+        self,
+        download_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        max_file_bytes: Optional[int] = None,
+        download_timeout: Optional[int] = None,
+        parse_timeout: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.download_workers = download_workers or settings.attachment_download_workers
+        self.parse_workers = parse_workers or settings.attachment_parse_workers or os.cpu_count() or 1
+        self.max_file_bytes = max_file_bytes or settings.attachment_max_bytes
+        self.download_timeout = download_timeout or settings.attachment_download_timeout
+        self.parse_timeout = parse_timeout or settings.attachment_parse_timeout
+        self.tasks_per_child = settings.attachment_parse_tasks_per_child
+        self.max_chars = settings.attachment_max_chars or None
+        self.max_pages = settings.attachment_max_pages or None
+        self.max_rows_per_sheet = settings.attachment_max_rows_per_sheet or None
+        self.cache = get_extraction_cache()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.download_workers,
+            pool_maxsize=self.download_workers,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def __enter__(self) -> "ExtractionEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def extract_many(self, urls: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Extract text from URLs, yielding results as they complete
+
+        Args:
+            urls: Attachment URLs
+
+        Yields:
+            {url, text, error} per URL (error is None on success)
+        """
+        with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+            futures = [executor.submit(self._process_url, url) for url in urls]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def extract_file(self, file_path: str) -> str:
+        """Parse local file in the process pool with timeout
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Extracted text
+        """
+        if is_archive(file_path):
+            return self.extract_archive(file_path)
+
+        result = self._get_pool().apply_async(_extract_file, (file_path, self.max_chars, self.max_pages))
+        return self._wait(result, Path(file_path).name)
+
+    def extract_archive(self, file_path: str) -> str:
+        """Unpack archive members and parse them concurrently in the pool
+
+        Members are submitted as soon as each is unpacked, so unpacking
+        overlaps with parsing; unpacked files are bounded by archive limits.
+
+        Args:
+            file_path: Path to .zip/.rar/.7z file
+
+        Returns:
+            Member texts joined in archive order
+        """
+        pool = self._get_pool()
+        with ArchiveExtractor().members(file_path) as members:
+            pending = [
+                (name, pool.apply_async(_extract_file, (member_path, self.max_chars, self.max_pages)))
+                for name, member_path in members
+            ]
+            texts = []
+            for name, result in pending:
+                try:
+                    text = self._wait(result, name)
+                except TimeoutError as e:
+                    logger.error(f"Parsing archive member failed: {str(e)}")
+                    continue
+                if text:
+                    texts.append(text)
+
+        result = '\n'.join(texts)
+        return result[:self.max_chars] if self.max_chars else result
+
+    def close(self) -> None:
+        """Shut down parser pool and HTTP session"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()  # Stuck parsers are killed by the pool's time limit
+                self._pool.join()
+                self._pool = None
+        self.session.close()
+
+    def _process_url(self, url: str) -> Dict[str, Any]:
+        tmp_path = None
+        try:
+            text = self._cached_by_url(url)
+            if text is None:
+                download = download_to_temp(self.session, url, self.max_file_bytes, self.download_timeout)
+                tmp_path = download['path']
+                if self.cache is not None:
+                    key = self._cache_key(download['sha256'])
+                    text = self.cache.get_or_extract(tmp_path, self.extract_file, sha256=key)
+                    self.cache.set_url_validators(url, key, download['etag'], download['last_modified'])
+                else:
+                    text = self.extract_file(tmp_path)
+            logger.info(f"Extracted {len(text)} chars from URL: {url}")
+            return {'url': url, 'text': text, 'error': None}
+        except Exception as e:
+            logger.error(f"Failed to extract from {url}: {str(e)}")
+            return {'url': url, 'text': '', 'error': str(e)}
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def _cached_by_url(self, url: str) -> Optional[str]:
+        """Revalidate URL with ETag/Last-Modified; cached text on 304 Not Modified"""
+        if self.cache is None:
+            return None
+        validators = self.cache.get_url_validators(url)
+        if not validators:
+            return None
+
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        download = download_to_temp(self.session, url, self.max_file_bytes, self.download_timeout, headers=headers)
+        if not download['not_modified']:
+            # Changed upstream: the full body is already on disk, reuse it
+            self.cache.record_url_hit(False)
+            try:
+                key = self._cache_key(download['sha256'])
+                text = self.cache.get_or_extract(download['path'], self.extract_file, sha256=key)
+                self.cache.set_url_validators(url, key, download['etag'], download['last_modified'])
+                return text
+            finally:
+                os.unlink(download['path'])
+
+        text = self.cache.get(validators['sha256'])
+        self.cache.record_url_hit(text is not None)
+        return text
+
+    def _cache_key(self, sha256: str) -> str:
+        """Content hash, qualified by the extraction budget when one is set"""
+        if self.max_chars is None and self.max_pages is None and self.max_rows_per_sheet is None:
+            return sha256
+        return f"{sha256}-c{self.max_chars or 0}-p{self.max_pages or 0}-r{self.max_rows_per_sheet or 0}"
+
+    def _wait(self, result, name: str) -> str:
+        """Wait for a parse submitted to the pool
+
+        No client-side timeout: the pool's hard time limit runs from when a
+        worker starts the task, so files queued behind other parses are not
+        failed early. It kills only the stuck worker and replaces it.
+
+        Raises:
+            TimeoutError: If the parse hit the time limit
+        """
+        try:
+            return result.get()
+        except (TimeLimitExceeded, ExceptionWithTraceback) as e:
+            # billiard reports the hard limit wrapped in ExceptionWithTraceback
+            if not isinstance(getattr(e, 'exc', e), TimeLimitExceeded):
+                raise
+            raise TimeoutError(f"Parsing {name} exceeded {self.parse_timeout}s") from None
+
+    def _get_pool(self) -> Pool:
+        """Start the parser pool on first use
+
+        Raises:
+            RuntimeError: If the pool cannot start; parsing never falls back
+                to the calling thread, where no timeout could be enforced
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                try:
+                    self._pool = Pool(
+                        processes=self.parse_workers,
+                        maxtasksperchild=self.tasks_per_child,
+                        timeout=self.parse_timeout,
+                    )
+                except Exception as e:
+                    logger.error(f"Attachment parser pool failed to start: {str(e)}")
+                    raise RuntimeError(f"Attachment parser pool unavailable: {str(e)}") from e
+            return self._pool
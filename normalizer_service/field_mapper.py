@@ -1,84 +1,222 @@
 """Field mapping service for normalizing platform-specific fields"""
 
-from typing import Dict, Any, Optional
+import json
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 from sqlalchemy.orm import Session
 
-fromshared.logger import logger
+from shared.config import get_settings
+from shared.config_cache import get_config_cache, FIELD_MAPPINGS
+from shared.logger import logger
 from .models import FieldMapping
 
 
+def _to_text(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, str):
+        value = value.replace(' ', '').replace(',', '.')
+    return int(float(value))
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, str):
+        value = value.replace(' ', '').replace(',', '.')
+    return float(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'y', 'да')
+    return bool(value)
+
+
+def _to_json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+# Coercions by field type; "date" values are left to TenderNormalizer._normalize_date
+COERCIONS: Dict[str, Callable[[Any], Any]] = {
+    'text': _to_text,
+    'str': _to_text,
+    'int': _to_int,
+    'float': _to_float,
+    'bool': _to_bool,
+    'json': _to_json,
+}
+
+
+def _key_getter(key: str) -> Callable[[Dict[str, Any]], Any]:
+    def get(data: Dict[str, Any]) -> Any:
+        return data.get(key)
+    return get
+
+
+def _path_getter(keys: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Any]:
+    def get(data: Dict[str, Any]) -> Any:
+        current = data
+        for key in keys:
+            if not isinstance(current, dict):
+                return None
+            current = current.get(key)
+            if current is None:
+                return None
+        return current
+    return get
+
+
+class MappingPlan:
+    """Field mapping compiled into direct getters and type coercions
+
+    Mapping values are either a source path ("customer.name") or
+    {"field": "customer.name", "type": "float"}.
+    """
+
+    def __init__(self, mapping: Dict[str, Union[str, Dict[str, Any]]]):
+        self.mapping = mapping
+        self.steps: List[Tuple[str, Callable[[Dict[str, Any]], Any], Optional[Callable[[Any], Any]]]] = []
+
+        for normalized_field, rule in mapping.items():
+            if isinstance(rule, dict):
+                source_field = rule.get('field') or normalized_field
+                field_type = rule.get('type')
+            else:
+                source_field, field_type = rule, None
+
+            keys = tuple(source_field.split('.'))
+            getter = _key_getter(source_field) if len(keys) == 1 else _path_getter(keys)
+
+            coerce = COERCIONS.get(field_type) if field_type else None
+            if field_type and coerce is None and field_type != 'date':
+                logger.warning(f"Unknown field type '{field_type}' for {normalized_field}, value kept as is")
+            self.steps.append((normalized_field, getter, coerce))
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def apply(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map raw data
+
+        Args:
+            raw_data: Original data from scraper
+
+        Returns:
+            Mapped data dictionary (fields that are missing or fail coercion are omitted)
+        """
+        mapped = {}
+        for normalized_field, getter, coerce in self.steps:
+            value = getter(raw_data)
+            if value is None:
+                continue
+            if coerce is not None:
+                try:
+                    value = coerce(value)
+                except (TypeError, ValueError):
+                    logger.debug(f"Could not coerce {normalized_field}={value!r}")
+                    continue
+            mapped[normalized_field] = value
+        return mapped
+
+
+# Process-wide compiled plans: {platform_id: (version, expires_at, plan or None)}
+_plans: Dict[str, Tuple[Tuple[int, int], float, Optional[MappingPlan]]] = {}
+_plan_versions: Dict[str, int] = {}
+_global_plan_version = 0
+_plans_lock = threading.Lock()
+
+
+def _plan_version(platform_id: str) -> Tuple[int, int]:
+    return _global_plan_version, _plan_versions.get(platform_id, 0)
+
+
+def invalidate_mapping_plan(platform_id: Optional[str] = None) -> None:
+    """Drop compiled mapping plans in this process
+
+    Called in every process when the field_mapping config namespace is
+    invalidated; `field_mapping_plan_ttl` bounds staleness if a message is lost.
+
+    Args:
+        platform_id: Platform to invalidate, or None for all platforms
+    """
+    global _global_plan_version
+    with _plans_lock:
+        if platform_id is None:
+            _global_plan_version += 1
+        else:
+            _plan_versions[platform_id] = _plan_versions.get(platform_id, 0) + 1
+
+
+def _on_config_invalidated(namespace: Optional[str]) -> None:
+    if namespace in (None, FIELD_MAPPINGS):
+        invalidate_mapping_plan()
+
+
+_listener_registered = False
+
+
+def _register_invalidation_listener() -> None:
+    global _listener_registered
+    with _plans_lock:
+        if _listener_registered:
+            return
+        _listener_registered = True
+    get_config_cache().add_listener(_on_config_invalidated)
+
+
 class FieldMapper:
     """Maps platform-specific fields to normalized format"""
     
     def __init__(self, db: Session):
         self.db = db
-        self._cache = {}  # Cache platform mappings
+        _register_invalidation_listener()
     
-    def get_mapping(self, platform_id: str) -> Optional[Dict[str, Any]]:
-        """Get field mapping for platform"""
-        if platform_id in self._cache:
-            return self._cache[platform_id]
+    def get_plan(self, platform_id: str) -> Optional[MappingPlan]:
+        """Get compiled mapping plan for platform (process-wide cache)"""
+        now = time.monotonic()
+        with _plans_lock:
+            version = _plan_version(platform_id)
+            cached = _plans.get(platform_id)
+        if cached and cached[0] == version and cached[1] > now:
+            return cached[2]
         
         mapping = self.db.query(FieldMapping).filter(
             FieldMapping.platform_id == platform_id,
             FieldMapping.is_active == True
         ).first()
         
-        if mapping:
-            self._cache[platform_id] = mapping.field_mappings
-            return mapping.field_mappings
+        plan = MappingPlan(mapping.field_mappings) if mapping else None
+        if plan is None:
+            logger.warning(f"No active mapping found for platform: {platform_id}")
         
-        logger.warning(f"No active mapping found for platform: {platform_id}")
-        return None
+        with _plans_lock:
+            # A concurrent invalidation wins: don't store a plan compiled from stale rows
+            if _plan_version(platform_id) == version:
+                _plans[platform_id] = (version, now + get_settings().field_mapping_plan_ttl, plan)
+        return plan
+    
+    def get_mapping(self, platform_id: str) -> Optional[Dict[str, Any]]:
+        """Get field mapping for platform"""
+        plan = self.get_plan(platform_id)
+        return plan.mapping if plan else None
     
-    def map_fields(self, raw_data: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
+    def map_fields(self, raw_data: Dict[str, Any], mapping: Union[MappingPlan, Dict[str, Any]]) -> Dict[str, Any]:
         """Apply mapping to raw data
         
         Args:
             raw_data: Original data from scraper
-            mapping: Field mapping rules {normalized_field: source_field_key}
+            mapping: Compiled plan, or mapping rules {normalized_field: source_field_key}
         
         Returns:
             Mapped data dictionary
         """
-        mapped = {}
-        
-        for normalized_field, source_field in mapping.items():
-            # Handle nested fields (e.g., "customer.name")
-            if "." in source_field:
-                value = self._get_nested(raw_data, source_field)
-            else:
-                value = raw_data.get(source_field)
-            
-            if value is not None:
-                mapped[normalized_field] = value
-        
-        return mapped
-    
-    def _get_nested(self, data: Dict[str, Any], path: str) -> Optional[Any]:
-        """Get value from nested dictionary
-        
-        Args:
-            data: Dictionary to search
-            path: Dot-separated path (e.g., "customer.name")
-        
-        Returns:
-            Value or None
-        """
-        keys = path.split(".")
-        current = data
-        
-        for key in keys:
-            if isinstance(current, dict):
-                current = current.get(key)
-                if current is None:
-                    return None
-            else:
-                return None
-        
-        return current
+        if not isinstance(mapping, MappingPlan):
+            mapping = MappingPlan(mapping)
+        return mapping.apply(raw_data)
     
-    def create_mapping(self, platform_id: str, mappings: Dict[str, str]) -> FieldMapping:
+    def create_mapping(self, platform_id: str, mappings: Dict[str, Any]) -> FieldMapping:
         """Create or update field mapping
         
         Args:
@@ -105,7 +243,8 @@ class FieldMapper:
             self.db.add(existing)
         
         self.db.commit()
-        self._cache[platform_id] = mappings  # Update cache
+        invalidate_mapping_plan(platform_id)
+        get_config_cache().invalidate(FIELD_MAPPINGS)  # Other workers
         
         logger.info(f"Created/updated mapping for platform: {platform_id}")
         return existing
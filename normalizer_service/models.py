@@ -1,9 +1,9 @@
 """Database models for normalized tenders"""
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Integer, String, Text, Float, JSON, Boolean, Index
+from sqlalchemy import Column, DateTime, Integer, String, Text, Float, JSON, Boolean, Index, LargeBinary
 
-fromshared.database import Base
+from shared.database import Base
 
 
 class NormalizedTender(Base):
@@ -20,6 +20,7 @@ class NormalizedTender(Base):
     
     # Basic information
     title = Column(String(500), nullable=False)
+    title_fingerprint = Column(String(32), nullable=True)  # MD5 of normalized title (DuplicateDetector)
     description = Column(Text, nullable=True)
     summary = Column(Text, nullable=True)  # AI-generated summary
     category = Column(String(100), index=True, nullable=True)
@@ -75,6 +76,7 @@ class NormalizedTender(Base):
     scraped_at = Column(DateTime, nullable=True)
     normalized_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    indexed_at = Column(DateTime, nullable=True)  # updated_at of the version the bulk sink indexed
     processing_time_ms = Column(Integer, nullable=True)  # Time spent normalizing
     
     # Indexes for common queries
@@ -84,6 +86,8 @@ class NormalizedTender(Base):
         Index('idx_customer_date', 'customer_name', 'published_date'),
         Index('idx_duplicate', 'is_duplicate'),
         Index('idx_quality_score', 'data_quality_score'),
+        Index('idx_platform_title_fingerprint', 'platform_id', 'title_fingerprint', 'is_duplicate'),
+        Index('idx_updated_at', 'updated_at', 'id'),
     )
     
     def __repr__(self) -> str:
@@ -116,6 +120,48 @@ class NormalizationLog(Base):
         return f"<NormalizationLog(id={self.id}, tender_id={self.tender_id}, status={self.status})>"
 
 
+class TenderSignature(Base):
+    """MinHash signature of a tender for cross-platform near-duplicate matching"""
+    
+    __tablename__ = "tender_signatures"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    normalized_tender_id = Column(Integer, unique=True, index=True, nullable=False)  # NormalizedTender.id
+    platform_id = Column(String(100), index=True, nullable=False)
+    signature = Column(LargeBinary, nullable=False)  # packed uint32 MinHash values
+    created_at = Column(DateTime, default=datetime.utcnow, index=True, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<TenderSignature(normalized_tender_id={self.normalized_tender_id}, platform_id={self.platform_id})>"
+
+
+class IndexTombstone(Base):
+    """Deleted tender that still has to be removed from the search index"""
+    
+    __tablename__ = "index_tombstones"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    tender_id = Column(String(255), index=True, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<IndexTombstone(id={self.id}, tender_id={self.tender_id})>"
+
+
+class IndexSyncState(Base):
+    """High-water marks of incremental indexing per search index"""
+    
+    __tablename__ = "index_sync_state"
+    
+    index_name = Column(String(100), primary_key=True)
+    updated_at_watermark = Column(DateTime, nullable=True)  # Last NormalizedTender.updated_at shipped
+    tombstone_watermark = Column(Integer, default=0, nullable=False)  # Last IndexTombstone.id shipped
+    last_run_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self) -> str:
+        return f"<IndexSyncState(index_name={self.index_name}, updated_at_watermark={self.updated_at_watermark})>"
+
+
 class FieldMapping(Base):
     """Field mapping between platform-specific formats and normalized format"""
     
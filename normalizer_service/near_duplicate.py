@@ -0,0 +1,307 @@
+"""Near-duplicate detection (MinHash + LSH) for tenders republished across platforms"""
+
+import operator
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from shared.config import get_settings
+from shared.logger import logger
+from .models import TenderSignature
+
+NUM_PERMUTATIONS = 64
+NUM_BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // NUM_BANDS
+SHINGLE_SIZE = 4
+
+_MAX_HASH = (1 << 32) - 1
+_SEED = 42  # Fixed so signatures are comparable across processes and restarts
+_PACK_FORMAT = f"<{NUM_PERMUTATIONS}I"
+
+# (NormalizedTender.id, signature, platform_id, created_at) of a staged row
+SignatureEntry = Tuple[int, Tuple[int, ...], str, datetime]
+
+
+def _mix32(value: int) -> int:
+    """MurmurHash3 finalizer: spreads CRC32 shingle hashes over all 32 bits"""
+    value ^= value >> 16
+    value = (value * 0x85EBCA6B) & _MAX_HASH
+    value ^= value >> 13
+    value = (value * 0xC2B2AE35) & _MAX_HASH
+    return value ^ (value >> 16)
+
+
+class MinHasher:
+    """Compute MinHash signatures for tender text
+    
+    Uses one-permutation hashing: each shingle hash is mixed once, its low
+    part picks one of num_perm bins and the bin keeps the smallest high part.
+    Empty bins borrow the next filled bin (rotation densification), so
+    signatures stay comparable slot by slot. One pass over the shingles
+    instead of one per permutation keeps a signature well under a millisecond.
+    """
+
+    def __init__(self, num_perm: int = NUM_PERMUTATIONS, seed: int = _SEED):
+        self.num_perm = num_perm
+        self.seed = seed & _MAX_HASH
+        self._bin_range = _MAX_HASH // num_perm + 1  # Values per bin; also the densification offset
+
+    @staticmethod
+    def shingles(title: Optional[str], customer: Optional[str] = None, budget: Optional[float] = None) -> Set[int]:
+        """Build hashed character shingles
+
+        Args:
+            title: Tender title
+            customer: Customer name
+            budget: Budget amount
+
+        Returns:
+            Set of 32-bit shingle hashes
+        """
+        text = " ".join(f"{title or ''} {customer or ''}".lower().split())
+        if len(text) < SHINGLE_SIZE:
+            grams = {text} if text else set()
+        else:
+            grams = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+        hashes = {zlib.crc32(gram.encode("utf-8")) for gram in grams}
+        if budget:
+            hashes.add(zlib.crc32(f"#budget:{int(round(budget))}".encode("utf-8")))
+        return hashes
+
+    def signature(self, shingles: Set[int]) -> Tuple[int, ...]:
+        """Compute MinHash signature
+
+        Args:
+            shingles: Shingle hashes
+
+        Returns:
+            Tuple of num_perm minimum hash values
+        """
+        if not shingles:
+            return tuple([_MAX_HASH] * self.num_perm)
+
+        num_perm = self.num_perm
+        empty = self._bin_range
+        seed = self.seed
+        bins = [empty] * num_perm
+        for shingle in shingles:
+            value = _mix32(shingle ^ seed)
+            slot = value % num_perm
+            value //= num_perm
+            if value < bins[slot]:
+                bins[slot] = value
+
+        if empty not in bins:
+            return tuple(bins)
+
+        signature = list(bins)
+        for slot, value in enumerate(bins):
+            if value != empty:
+                continue
+            for distance in range(1, num_perm):
+                borrowed = bins[(slot + distance) % num_perm]
+                if borrowed != empty:
+                    signature[slot] = borrowed + distance * empty
+                    break
+        return tuple(signature)
+
+    @staticmethod
+    def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimate Jaccard similarity from two signatures"""
+        return sum(map(operator.eq, sig_a, sig_b)) / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """LSH index over persisted tender signatures
+    
+    Signatures live in `tender_signatures`; each process keeps the recent
+    window in memory and tops it up incrementally, so a lookup only compares
+    against tenders sharing an LSH band instead of scanning the table.
+    """
+
+    def __init__(self, hasher: Optional[MinHasher] = None):
+        settings = get_settings()
+        self.hasher = hasher or MinHasher()
+        self.threshold = settings.near_duplicate_threshold
+        self.window = timedelta(days=settings.near_duplicate_window_days)
+        self.sync_interval = settings.near_duplicate_sync_seconds
+        self.sync_overlap = timedelta(seconds=settings.near_duplicate_sync_overlap_seconds)
+
+        self._buckets: List[Dict[int, Set[int]]] = [{} for _ in range(NUM_BANDS)]
+        self._signatures: Dict[int, Tuple[Tuple[int, ...], str, datetime]] = {}
+        self._lock = threading.RLock()
+        self._synced_until: Optional[datetime] = None  # Newest created_at loaded
+        self._last_sync = 0.0
+
+    def find_duplicate(
+        self,
+        db: Session,
+        title: Optional[str],
+        customer: Optional[str] = None,
+        budget: Optional[float] = None,
+    ) -> Optional[int]:
+        """Find the closest near-duplicate on any platform
+
+        Args:
+            db: Database session (used to pick up signatures from other workers)
+            title: Tender title
+            customer: Customer name
+            budget: Budget amount
+
+        Returns:
+            NormalizedTender.id of the best match or None
+        """
+        matches = self.query(db, title, customer, budget)
+        return matches[0][0] if matches else None
+
+    def query(
+        self,
+        db: Session,
+        title: Optional[str],
+        customer: Optional[str] = None,
+        budget: Optional[float] = None,
+    ) -> List[Tuple[int, float]]:
+        """Find near-duplicates above the similarity threshold
+
+        Returns:
+            List of (NormalizedTender.id, similarity), best match first
+        """
+        self.sync(db)
+        signature = self.hasher.signature(self.hasher.shingles(title, customer, budget))
+
+        with self._lock:
+            candidates: Set[int] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                bucket = self._buckets[band].get(key)
+                if bucket:
+                    candidates.update(bucket)
+
+            matches = []
+            for tender_pk in candidates:
+                score = MinHasher.similarity(signature, self._signatures[tender_pk][0])
+                if score >= self.threshold:
+                    matches.append((tender_pk, score))
+
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def add(self, db: Session, tender) -> SignatureEntry:
+        """Stage signature row for a stored tender
+
+        The caller commits the session together with the tender itself and
+        then hands the returned entry to `publish`, so a rolled back insert
+        never reaches the in-memory buckets.
+
+        Args:
+            db: Database session
+            tender: Flushed NormalizedTender record (id assigned)
+
+        Returns:
+            Entry to publish once the session has committed
+        """
+        signature = self.hasher.signature(
+            self.hasher.shingles(tender.title, tender.customer_name, tender.budget_amount)
+        )
+        created_at = datetime.utcnow()
+        db.add(TenderSignature(
+            normalized_tender_id=tender.id,
+            platform_id=tender.platform_id,
+            signature=struct.pack(_PACK_FORMAT, *signature),
+            created_at=created_at,
+        ))
+        return tender.id, signature, tender.platform_id, created_at
+
+    def publish(self, entries: List[SignatureEntry]) -> None:
+        """Index committed signatures in memory
+
+        Args:
+            entries: Entries returned by `add` for the committed tenders
+        """
+        for tender_pk, signature, platform_id, created_at in entries:
+            self._insert(tender_pk, signature, platform_id, created_at)
+
+    def sync(self, db: Session, force: bool = False) -> int:
+        """Load signatures written by other workers since the last sync
+
+        Args:
+            db: Database session
+            force: Ignore the sync interval
+
+        Returns:
+            Number of loaded signatures
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sync < self.sync_interval:
+            return 0
+        self._last_sync = now
+
+        # Rows commit out of id/created_at order across workers, so every sync
+        # re-reads the last `sync_overlap` of rows; already loaded ones are skipped
+        cutoff = datetime.utcnow() - self.window
+        since = cutoff if self._synced_until is None else max(cutoff, self._synced_until - self.sync_overlap)
+        rows = db.query(
+            TenderSignature.normalized_tender_id,
+            TenderSignature.platform_id,
+            TenderSignature.signature,
+            TenderSignature.created_at,
+        ).filter(
+            TenderSignature.created_at >= since,
+        ).order_by(TenderSignature.created_at).all()
+
+        loaded = 0
+        for row in rows:
+            if self._insert(
+                row.normalized_tender_id,
+                struct.unpack(_PACK_FORMAT, row.signature),
+                row.platform_id,
+                row.created_at,
+            ):
+                loaded += 1
+        if rows:
+            self._synced_until = max(self._synced_until or rows[-1].created_at, rows[-1].created_at)
+
+        evicted = self._evict_older_than(cutoff)
+        if loaded or evicted:
+            logger.debug(f"Near-duplicate index synced: +{loaded} / -{evicted}, size {len(self._signatures)}")
+        return loaded
+
+    def _insert(self, tender_pk: int, signature: Tuple[int, ...], platform_id: str, created_at: datetime) -> bool:
+        with self._lock:
+            if tender_pk in self._signatures:
+                return False
+            self._signatures[tender_pk] = (signature, platform_id, created_at)
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(key, set()).add(tender_pk)
+            return True
+
+    def _evict_older_than(self, cutoff: datetime) -> int:
+        with self._lock:
+            expired = [pk for pk, (_, _, created_at) in self._signatures.items() if created_at < cutoff]
+            for tender_pk in expired:
+                signature = self._signatures.pop(tender_pk)[0]
+                for band, key in enumerate(self._band_keys(signature)):
+                    bucket = self._buckets[band].get(key)
+                    if bucket:
+                        bucket.discard(tender_pk)
+                        if not bucket:
+                            del self._buckets[band][key]
+        return len(expired)
+
+    @staticmethod
+    def _band_keys(signature: Tuple[int, ...]) -> List[int]:
+        # Strided bands: densified empty bins copy their neighbours, so
+        # adjacent slots are correlated and must not share a band
+        return [hash(signature[band::NUM_BANDS]) for band in range(NUM_BANDS)]
+
+
+@lru_cache()
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """Get process-wide near-duplicate index"""
+    return NearDuplicateIndex()
@@ -1,25 +1,65 @@
 """Data normalization and standardization - SPRINT 32 Implementation"""
 
 import re
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 
-fromshared.logger import logger
+from shared.logger import logger
 from .models import NormalizedTender, NormalizationLog
 from .field_mapper import FieldMapper
 from .duplicate_detector import DuplicateDetector
-from .elasticsearch_indexer import ElasticsearchIndexer
+from .near_duplicate import get_near_duplicate_index
+from .repositories import get_detail_cache
+from .elasticsearch_indexer import ElasticsearchIndexer, BulkIndexBuffer
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+# Numeric date shapes, parsed straight from the groups (same separator twice)
+_YMD_DATE_RE = re.compile(r'(\d{4})([-/])(\d{1,2})\2(\d{1,2})')
+_DMY_DATE_RE = re.compile(r'(\d{1,2})([-./])(\d{1,2})\2(\d{4})')
+
+# Month-name dates still go through strptime
+_TEXT_DATE_FORMATS = ('%d %b %Y', '%d %B %Y')
+
+# Last month-name format that worked per platform, tried first next time
+_last_date_format: Dict[Optional[str], str] = {}
+
+_CURRENCY_MAP = {
+    'РУБ': 'RUB', 'РУБ.': 'RUB', 'РУБЛЬ': 'RUB', 'РУБЛЕЙ': 'RUB',
+    'KZT': 'KZT', 'ТЕНГЕ': 'KZT',
+    'USD': 'USD', 'DOLLAR': 'USD', 'ДОЛЛАР': 'USD',
+    'EUR': 'EUR', 'EURO': 'EUR', 'ЕВРО': 'EUR',
+}
 
 
 class TenderNormalizer:
     """Complete tender normalization pipeline (Sprint 32)"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, index_buffer: Optional[BulkIndexBuffer] = None):
         self.db = db
         self.field_mapper = FieldMapper(db)
         self.duplicate_detector = DuplicateDetector(db)
+        self.near_duplicates = get_near_duplicate_index()
         self.es_indexer = ElasticsearchIndexer()
+        self.index_buffer = index_buffer or BulkIndexBuffer(self.es_indexer)
+    
+    def flush_index(self) -> List[Dict[str, Any]]:
+        """Flush buffered Elasticsearch documents
+        
+        Returns:
+            Per-document indexing failures (already recorded in NormalizationLog)
+        """
+        failures = self.index_buffer.flush()
+        self._record_index_failures(failures)
+        return failures
+    
+    def _record_index_failures(self, failures: List[Dict[str, Any]]) -> None:
+        """Mark logs of documents Elasticsearch rejected as 'partial' and commit"""
+        if failures:
+            BulkIndexBuffer.mark_failed_logs(self.db, failures)
+            self.db.commit()
     
     def normalize_and_store(self, raw_data: Dict[str, Any], platform_id: str) -> Tuple[bool, Optional[int]]:
         """Complete normalization pipeline (data → PostgreSQL + Elasticsearch)
@@ -44,7 +84,7 @@ class TenderNormalizer:
         
         try:
             # Step 1: Apply field mapping
-            mapping = self.field_mapper.get_mapping(platform_id)
+            mapping = self.field_mapper.get_plan(platform_id)
             if not mapping:
                 logger.warning(f"No mapping for platform {platform_id}, using raw data")
                 mapped_data = raw_data
@@ -82,53 +122,44 @@ class TenderNormalizer:
                 logger.info(f"Tender marked as duplicate")
                 return True, dup_of
             
+            # Step 4b: Link near-duplicates republished on other platforms
+            near_dup_of = self.near_duplicates.find_duplicate(
+                self.db,
+                normalized_data.get('title'),
+                normalized_data.get('customer_name'),
+                normalized_data.get('budget_amount'),
+            )
+            
             # Step 5: Store in PostgreSQL
-            tender = NormalizedTender(
-                tender_id=normalized_data['tender_id'],
-                platform_id=platform_id,
-                external_id=normalized_data.get('external_id', ''),
-                title=normalized_data.get('title'),
-                description=normalized_data.get('description'),
-                summary=normalized_data.get('summary'),
-                category=normalized_data.get('category'),
-                customer_name=normalized_data.get('customer_name'),
-                customer_contact=normalized_data.get('customer_contact'),
-                published_date=normalized_data.get('published_date'),
-                deadline_date=normalized_data.get('deadline_date'),
-                start_date=normalized_data.get('start_date'),
-                end_date=normalized_data.get('end_date'),
-                budget_amount=normalized_data.get('budget_amount'),
-                budget_currency=normalized_data.get('budget_currency', 'RUB'),
-                status=normalized_data.get('status', 'new'),
-                source_url=normalized_data.get('source_url'),
-                requirements=normalized_data.get('requirements'),
-                criteria=normalized_data.get('criteria'),
-                restrictions=normalized_data.get('restrictions'),
-                attachments=normalized_data.get('attachments'),
-                ai_extracted=normalized_data.get('ai_extracted'),
-                ai_keywords=normalized_data.get('ai_keywords'),
-                raw_data=raw_data,
-                extracted_text=normalized_data.get('extracted_text'),
-                data_quality_score=self._calculate_quality_score(normalized_data),
-                is_duplicate=False,
-                normalized_at=datetime.utcnow(),
-                processing_time_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            tender = self._build_tender(
+                normalized_data,
+                raw_data,
+                platform_id,
+                start_time,
+                duplicate_of=str(near_dup_of) if near_dup_of else None,
             )
             
             self.db.add(tender)
+            self.db.flush()
+            signature = self.near_duplicates.add(self.db, tender)
             self.db.commit()
+            self.near_duplicates.publish([signature])
+            get_detail_cache().invalidate(tender.tender_id)  # May have been cached as not found
             
-            # Step 6: Index in Elasticsearch
-            indexed = self.es_indexer.index_tender(tender)
-            if not indexed:
-                logger.warning(f"Failed to index tender in Elasticsearch")
+            if near_dup_of:
+                log.warnings = [f"Near duplicate of tender {near_dup_of}"]
+                logger.info(f"Tender {tender.tender_id} is a near duplicate of {near_dup_of}")
             
             # Update log
             log.status = 'success'
             log.completed_at = datetime.utcnow()
             log.duration_ms = int((log.completed_at - log.started_at).total_seconds() * 1000)
+            
             self.db.commit()
             
+            # Step 6: Buffer for Elasticsearch bulk indexing (failures mark the log 'partial')
+            self._record_index_failures(self.index_buffer.add(tender, log))
+            
             logger.info(f"Successfully normalized and stored tender: {tender.tender_id}")
             return True, tender.id
         
@@ -140,29 +171,312 @@ class TenderNormalizer:
             self.db.commit()
             return False, None
     
-    def _normalize_fields(self, data: Dict[str, Any], platform_id: str) -> Dict[str, Any]:
+    def normalize_and_store_many(self, raw_items: List[Dict[str, Any]], platform_id: str) -> Dict[str, Any]:
+        """Batch normalization pipeline with a single transaction per batch
+        
+        Mapping, normalization and validation run in memory, the whole batch is
+        checked for duplicates with one query, tenders and logs are inserted in
+        one commit and indexed in Elasticsearch with one bulk request. If that
+        commit fails, the batch is stored again with one savepoint per tender.
+        
+        Args:
+            raw_items: Raw tender data from scraper/API
+            platform_id: Platform identifier
+        
+        Returns:
+            Batch stats {total, success, duplicates, failed, stored_ids}
+        """
+        started_at = datetime.utcnow()
+        results = {
+            'total': len(raw_items),
+            'success': 0,
+            'duplicates': 0,
+            'failed': 0,
+            'stored_ids': [],
+        }
+        logs = []
+        candidates = []
+        
+        # Steps 1-3: Map, normalize and validate in memory
+        mapping = self.field_mapper.get_plan(platform_id)
+        if not mapping:
+            logger.warning(f"No mapping for platform {platform_id}, using raw data")
+        
+        mapped_items = []
+        for raw_data in raw_items:
+            item_start = datetime.utcnow()
+            log = NormalizationLog(
+                tender_id=raw_data.get('tender_id', 'unknown'),
+                raw_data_id=raw_data.get('id'),
+                status='started',
+                started_at=started_at
+            )
+            logs.append(log)
+            
+            try:
+                mapped_data = self.field_mapper.map_fields(raw_data, mapping) if mapping else raw_data
+            except Exception as e:
+                logger.error(f"Normalization error: {str(e)}", exc_info=True)
+                log.status = 'failed'
+                log.message = str(e)
+                continue
+            mapped_items.append((raw_data, mapped_data, log, item_start))
+        
+        normalized_items = self.normalize_many([mapped for _, mapped, _, _ in mapped_items], platform_id)
+        for (raw_data, _, log, item_start), normalized_data in zip(mapped_items, normalized_items):
+            is_valid, errors = self._validate_tender(normalized_data)
+            if not is_valid:
+                log.status = 'failed'
+                log.errors = errors
+                log.message = f"Validation failed: {'; '.join(errors)}"
+                continue
+            
+            candidates.append((raw_data, normalized_data, log, item_start))
+        
+        # Step 4: Detect duplicates for the whole batch in one query
+        existing_ids, existing_fingerprints = self.duplicate_detector.find_existing(
+            platform_id,
+            [data.get('external_id') for _, data, _, _ in candidates if data.get('external_id')],
+            [DuplicateDetector.title_fingerprint(data.get('title')) for _, data, _, _ in candidates],
+        )
+        # In-batch originals have no id until flushed; their duplicates' logs
+        # are filled in afterwards so they match DB duplicates
+        seen_ids = {}
+        seen_fingerprints = {}
+        batch_duplicates = []
+        
+        tenders = []
+        stored = []
+        for raw_data, normalized_data, log, item_start in candidates:
+            external_id = normalized_data.get('external_id', '')
+            fingerprint = DuplicateDetector.title_fingerprint(normalized_data.get('title'))
+            dup_of = (
+                (external_id and existing_ids.get(external_id))
+                or existing_fingerprints.get(fingerprint)
+            )
+            if dup_of:
+                log.status = 'duplicate'
+                log.message = f"Duplicate of tender {dup_of}"
+                continue
+            
+            original = (external_id and seen_ids.get(external_id)) or seen_fingerprints.get(fingerprint)
+            if original is not None:
+                log.status = 'duplicate'
+                batch_duplicates.append((log, original))
+                continue
+            
+            near_dup_of = self.near_duplicates.find_duplicate(
+                self.db,
+                normalized_data.get('title'),
+                normalized_data.get('customer_name'),
+                normalized_data.get('budget_amount'),
+            )
+            if near_dup_of:
+                log.warnings = [f"Near duplicate of tender {near_dup_of}"]
+            
+            tender = self._build_tender(
+                normalized_data,
+                raw_data,
+                platform_id,
+                item_start,
+                duplicate_of=str(near_dup_of) if near_dup_of else None,
+            )
+            tenders.append(tender)
+            stored.append((tender, log))
+            log.status = 'success'
+            if external_id:
+                seen_ids[external_id] = tender
+            seen_fingerprints[fingerprint] = tender
+        
+        # Step 5: Store tenders and logs in one transaction
+        completed_at = datetime.utcnow()
+        for log in logs:
+            log.completed_at = completed_at
+            log.duration_ms = int((completed_at - started_at).total_seconds() * 1000)
+        
+        try:
+            self.db.add_all(tenders)
+            self.db.add_all(logs)
+            self.db.flush()
+            for log, original in batch_duplicates:
+                log.message = f"Duplicate of tender {original.id}"
+            signatures = [self.near_duplicates.add(self.db, tender) for tender in tenders]
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"Batch store failed for platform {platform_id}, storing tenders one by one: {str(e)}")
+            stored, signatures = self._store_each(stored, logs, batch_duplicates)
+        self.near_duplicates.publish(signatures)
+        get_detail_cache().invalidate_many(tender.tender_id for tender, _ in stored)
+        
+        # Step 6: Index in Elasticsearch with one bulk request
+        for tender, log in stored:
+            self._record_index_failures(self.index_buffer.add(tender, log))
+        self.flush_index()
+        
+        for log in logs:
+            if log.status in ('success', 'partial'):
+                results['success'] += 1
+            elif log.status == 'duplicate':
+                results['duplicates'] += 1
+            else:
+                results['failed'] += 1
+        results['stored_ids'] = [tender.id for tender, _ in stored]
+        
+        logger.info(
+            f"Batch normalized for {platform_id}: {results['success']} stored, "
+            f"{results['duplicates']} duplicates, {results['failed']} failed"
+        )
+        return results
+    
+    def _store_each(
+        self,
+        stored: List[Tuple[NormalizedTender, NormalizationLog]],
+        logs: List[NormalizationLog],
+        batch_duplicates: List[Tuple[NormalizationLog, NormalizedTender]],
+    ) -> Tuple[List[Tuple[NormalizedTender, NormalizationLog]], list]:
+        """Store a batch tender by tender after its single transaction failed
+        
+        Each tender gets its own savepoint, so a bad row (e.g. IntegrityError)
+        only fails itself; the other tenders and every log are still committed.
+        
+        Args:
+            stored: (tender, log) pairs of the batch
+            logs: Logs of the whole batch
+            batch_duplicates: (log, original tender) pairs of in-batch duplicates
+        
+        Returns:
+            Tuple of (committed (tender, log) pairs, near-duplicate entries to publish)
+        """
+        committed = []
+        signatures = []
+        for tender, log in stored:
+            try:
+                with self.db.begin_nested():
+                    self.db.add(tender)
+                    self.db.flush()
+                    signature = self.near_duplicates.add(self.db, tender)
+                    self.db.flush()
+            except Exception as e:
+                logger.error(f"Storing tender {tender.tender_id} failed: {str(e)}")
+                log.status = 'failed'
+                log.message = str(e)
+                continue
+            committed.append((tender, log))
+            signatures.append(signature)
+        
+        stored_tenders = {id(tender) for tender, _ in committed}
+        for log, original in batch_duplicates:
+            if id(original) in stored_tenders:
+                log.message = f"Duplicate of tender {original.id}"
+            else:
+                # Nothing was stored for this tender
+                log.status = 'failed'
+                log.message = f"Duplicate of tender {original.tender_id}, which failed to store"
+        
+        self.db.add_all(logs)
+        self.db.commit()
+        return committed, signatures
+    
+    def _build_tender(
+        self,
+        normalized_data: Dict[str, Any],
+        raw_data: Dict[str, Any],
+        platform_id: str,
+        start_time: datetime,
+        duplicate_of: Optional[str] = None,
+    ) -> NormalizedTender:
+        """Build NormalizedTender record from normalized data"""
+        return NormalizedTender(
+            tender_id=normalized_data['tender_id'],
+            platform_id=platform_id,
+            external_id=normalized_data.get('external_id', ''),
+            title=normalized_data.get('title'),
+            title_fingerprint=DuplicateDetector.title_fingerprint(normalized_data.get('title')),
+            description=normalized_data.get('description'),
+            summary=normalized_data.get('summary'),
+            category=normalized_data.get('category'),
+            customer_name=normalized_data.get('customer_name'),
+            customer_contact=normalized_data.get('customer_contact'),
+            published_date=normalized_data.get('published_date'),
+            deadline_date=normalized_data.get('deadline_date'),
+            start_date=normalized_data.get('start_date'),
+            end_date=normalized_data.get('end_date'),
+            budget_amount=normalized_data.get('budget_amount'),
+            budget_currency=normalized_data.get('budget_currency', 'RUB'),
+            status=normalized_data.get('status', 'new'),
+            source_url=normalized_data.get('source_url'),
+            requirements=normalized_data.get('requirements'),
+            criteria=normalized_data.get('criteria'),
+            restrictions=normalized_data.get('restrictions'),
+            attachments=normalized_data.get('attachments'),
+            ai_extracted=normalized_data.get('ai_extracted'),
+            ai_keywords=normalized_data.get('ai_keywords'),
+            raw_data=raw_data,
+            extracted_text=normalized_data.get('extracted_text'),
+            data_quality_score=self._calculate_quality_score(normalized_data),
+            is_duplicate=False,
+            duplicate_of=duplicate_of,
+            normalized_at=datetime.utcnow(),
+            processing_time_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        )
+    
+    def normalize_many(self, items: List[Dict[str, Any]], platform_id: str) -> List[Dict[str, Any]]:
+        """Normalize a batch of mapped tenders
+        
+        Date strings repeat heavily within a batch (publication dates,
+        deadlines), so each distinct value is parsed once per batch.
+        
+        Args:
+            items: Mapped data
+            platform_id: Platform identifier
+        
+        Returns:
+            Normalized data, in input order
+        """
+        date_cache: Dict[Any, Optional[datetime]] = {}
+        return [self._normalize_fields(data, platform_id, date_cache) for data in items]
+    
+    def _normalize_fields(
+        self,
+        data: Dict[str, Any],
+        platform_id: str,
+        date_cache: Optional[Dict[Any, Optional[datetime]]] = None,
+    ) -> Dict[str, Any]:
         """Normalize individual fields
         
         Args:
             data: Mapped data
             platform_id: Platform identifier
+            date_cache: Parsed dates by raw value, shared across a batch
         
         Returns:
             Normalized data
         """
+        normalize_text = self._normalize_text
+        if date_cache is None:
+            date_cache = {}
+        
+        def normalize_date(value: Any) -> Optional[datetime]:
+            if not isinstance(value, str):
+                return self._normalize_date(value, platform_id)
+            if value not in date_cache:
+                date_cache[value] = self._normalize_date(value, platform_id)
+            return date_cache[value]
+        
         return {
             'tender_id': data.get('tender_id'),
             'external_id': data.get('external_id'),
-            'title': self._normalize_text(data.get('title')),
-            'description': self._normalize_text(data.get('description')),
+            'title': normalize_text(data.get('title')),
+            'description': normalize_text(data.get('description')),
             'summary': data.get('summary'),
-            'category': self._normalize_text(data.get('category')),
-            'customer_name': self._normalize_text(data.get('customer_name')),
+            'category': normalize_text(data.get('category')),
+            'customer_name': normalize_text(data.get('customer_name')),
             'customer_contact': data.get('customer_contact'),
-            'published_date': self._normalize_date(data.get('published_date')),
-            'deadline_date': self._normalize_date(data.get('deadline_date')),
-            'start_date': self._normalize_date(data.get('start_date')),
-            'end_date': self._normalize_date(data.get('end_date')),
+            'published_date': normalize_date(data.get('published_date')),
+            'deadline_date': normalize_date(data.get('deadline_date')),
+            'start_date': normalize_date(data.get('start_date')),
+            'end_date': normalize_date(data.get('end_date')),
             'budget_amount': self._normalize_budget(data.get('budget_amount')),
             'budget_currency': self._normalize_currency(data.get('budget_currency')),
             'status': data.get('status', 'new'),
@@ -181,34 +495,44 @@ class TenderNormalizer:
         """Normalize text field"""
         if not text:
             return None
-        text = re.sub(r'\s+', ' ', str(text))
-        text = text.strip()
+        text = _WHITESPACE_RE.sub(' ', str(text)).strip()
         return text if text else None
     
     @staticmethod
-    def _normalize_date(date_str: str) -> Optional[datetime]:
-        """Normalize date to datetime"""
+    def _normalize_date(date_str: str, platform_id: Optional[str] = None) -> Optional[datetime]:
+        """Normalize date to datetime
+        
+        Numeric dates are classified by shape (YYYY-MM-DD, DD.MM.YYYY, ...)
+        and built directly from the regex groups; month-name dates fall back
+        to strptime, starting with the format that last worked for the platform.
+        """
         if not date_str:
             return None
         
         if isinstance(date_str, datetime):
             return date_str
         
-        formats = [
-            '%Y-%m-%d',
-            '%d-%m-%Y',
-            '%d.%m.%Y',
-            '%Y/%m/%d',
-            '%d/%m/%Y',
-            '%d %b %Y',
-            '%d %B %Y',
-        ]
+        value = str(date_str)
+        try:
+            match = _YMD_DATE_RE.fullmatch(value)
+            if match:
+                return datetime(int(match.group(1)), int(match.group(3)), int(match.group(4)))
+            match = _DMY_DATE_RE.fullmatch(value)
+            if match:
+                return datetime(int(match.group(4)), int(match.group(3)), int(match.group(1)))
+        except ValueError:
+            logger.warning(f"Could not parse date: {date_str}")
+            return None
         
+        last_format = _last_date_format.get(platform_id)
+        formats = (last_format,) + _TEXT_DATE_FORMATS if last_format else _TEXT_DATE_FORMATS
         for fmt in formats:
             try:
-                return datetime.strptime(str(date_str), fmt)
+                parsed = datetime.strptime(value, fmt)
             except ValueError:
                 continue
+            _last_date_format[platform_id] = fmt
+            return parsed
         
         logger.warning(f"Could not parse date: {date_str}")
         return None
@@ -222,14 +546,9 @@ class TenderNormalizer:
         if isinstance(budget_str, (int, float)):
             return float(budget_str)
         
-        budget_str = re.sub(r'[\s,\-]+', '', str(budget_str))
-        numbers = re.findall(r'\d+', budget_str)
-        
-        if numbers:
-            try:
-                return float(''.join(numbers))
-            except ValueError:
-                pass
+        digits = _NON_DIGIT_RE.sub('', str(budget_str))
+        if digits:
+            return float(digits)
         
         logger.warning(f"Could not parse budget: {budget_str}")
         return None
@@ -241,15 +560,7 @@ class TenderNormalizer:
             return "RUB"
         
         currency_str = str(currency_str).upper().strip()
-        
-        currency_map = {
-            'РУБ': 'RUB', 'РУБ.': 'RUB', 'РУБЛЬ': 'RUB', 'РУБЛЕЙ': 'RUB',
-            'KZT': 'KZT', 'ТЕНГЕ': 'KZT',
-            'USD': 'USD', 'DOLLAR': 'USD', 'ДОЛЛАР': 'USD',
-            'EUR': 'EUR', 'EURO': 'EUR', 'ЕВРО': 'EUR',
-        }
-        
-        return currency_map.get(currency_str, currency_str[:3])
+        return _CURRENCY_MAP.get(currency_str, currency_str[:3])
     
     @staticmethod
     def _validate_tender(data: Dict[str, Any]) -> Tuple[bool, list]:
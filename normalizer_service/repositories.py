@@ -4,7 +4,20 @@ from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 
-from .models import NormalizedTender, NormalizationLog
+from shared.config import get_settings
+from shared.tiered_cache import TieredCache, get_tiered_cache
+from .duplicate_detector import DuplicateDetector
+from .models import NormalizedTender, NormalizationLog, IndexTombstone
+
+DETAIL_CACHE_NAMESPACE = "tender-detail"
+
+
+def get_detail_cache() -> TieredCache:
+    """Get process-wide tender detail cache (keyed by tender_id)
+    
+    Loads run on the caller's DB session, so there is no background refresh.
+    """
+    return get_tiered_cache(DETAIL_CACHE_NAMESPACE, get_settings().detail_cache_ttl, early_refresh=False)
 
 
 class NormalizedTenderRepository:
@@ -19,6 +32,7 @@ class NormalizedTenderRepository:
         self.db.add(tender)
         self.db.commit()
         self.db.refresh(tender)
+        get_detail_cache().invalidate(tender.tender_id)  # May have been cached as not found
         return tender
     
     def get_by_id(self, tender_id: str) -> Optional[NormalizedTender]:
@@ -61,17 +75,26 @@ class NormalizedTenderRepository:
             for key, value in kwargs.items():
                 if hasattr(tender, key):
                     setattr(tender, key, value)
+            if 'title' in kwargs:
+                tender.title_fingerprint = DuplicateDetector.title_fingerprint(tender.title)
             tender.updated_at = datetime.utcnow()
             self.db.commit()
             self.db.refresh(tender)
+            get_detail_cache().invalidate(tender_id)
         return tender
     
+    def update_extracted_text(self, tender_id: str, text: str) -> Optional[NormalizedTender]:
+        """Store text extracted from tender attachments"""
+        return self.update(tender_id, extracted_text=text)
+    
     def delete(self, tender_id: str) -> bool:
-        """Delete tender"""
+        """Delete tender (tombstone lets the incremental indexer remove it from search)"""
         tender = self.get_by_id(tender_id)
         if tender:
             self.db.delete(tender)
+            self.db.add(IndexTombstone(tender_id=tender_id))
             self.db.commit()
+            get_detail_cache().invalidate(tender_id)
             return True
         return False
     
@@ -1,14 +1,22 @@
 """Celery tasks for normalizer service - SPRINT 32"""
 
+import os
+import threading
+import time
+from contextlib import nullcontext
 from datetime import datetime
+from celery.signals import task_postrun, worker_process_shutdown, worker_shutdown
 from sqlalchemy.orm import Session
 
-fromscheduler_service.celery_app import task
-fromshared.database import SessionLocal
-fromshared.logger import logger
-fromnormalizer_service.normalizer import TenderNormalizer
-fromnormalizer_service.text_extractor import TextExtractor
-fromnormalizer_service.repositories import NormalizedTenderRepository
+from scheduler_service.celery_app import task
+from shared.config import get_settings
+from shared.database import SessionLocal
+from shared.logger import logger
+from .normalizer import TenderNormalizer
+from .elasticsearch_indexer import BulkIndexBuffer, get_index_buffer
+from .extraction_engine import ExtractionEngine
+from .repositories import NormalizedTenderRepository
+from .duplicate_detector import DuplicateDetector
 
 
 @task(name="normalize_tender", bind=True, max_retries=3)
@@ -27,7 +35,9 @@ def normalize_tender_task(self, raw_tender_data: dict, platform_id: str) -> dict
         tender_id = raw_tender_data.get('tender_id')
         logger.info(f"Normalizing tender {tender_id} from platform {platform_id}")
         
-        normalizer = TenderNormalizer(db)
+        # Documents go to the worker's shared buffer, flushed by size/age (see below)
+        _ensure_index_flusher()
+        normalizer = TenderNormalizer(db, index_buffer=get_index_buffer())
         success, stored_id = normalizer.normalize_and_store(raw_tender_data, platform_id)
         
         if success:
@@ -54,6 +64,67 @@ def normalize_tender_task(self, raw_tender_data: dict, platform_id: str) -> dict
         db.close()
 
 
+_flusher_pid = None
+_flusher_lock = threading.Lock()
+
+
+def _flush_index_buffer(force: bool = False) -> None:
+    """Flush the worker's index buffer if due and record per-document failures
+    
+    Args:
+        force: Flush regardless of the size/age thresholds
+    """
+    if not get_index_buffer.cache_info().currsize:
+        return  # No tender normalized in this process
+    buffer = get_index_buffer()
+    if not force and not buffer.is_due():
+        return
+    
+    failures = buffer.flush()
+    if failures:
+        db = SessionLocal()
+        try:
+            BulkIndexBuffer.mark_failed_logs(db, failures)
+            db.commit()
+        finally:
+            db.close()
+
+
+def _flush_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            _flush_index_buffer()
+        except Exception as e:
+            logger.error(f"Index buffer flush failed: {str(e)}")
+
+
+def _ensure_index_flusher() -> None:
+    """Start the age-based flush thread once per worker process
+    
+    Covers idle periods: without new tasks nothing else checks the
+    buffer's age threshold.
+    """
+    global _flusher_pid
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()  # Threads don't survive a prefork fork
+        interval = max(get_settings().es_bulk_flush_seconds / 2, 0.5)
+        threading.Thread(target=_flush_loop, args=(interval,), name="index-buffer-flusher", daemon=True).start()
+
+
+@task_postrun.connect(sender=normalize_tender_task)
+def _flush_index_after_task(**kwargs) -> None:
+    _flush_index_buffer()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _flush_index_on_shutdown(**kwargs) -> None:
+    _flush_index_buffer(force=True)
+
+
 @task(name="extract_text_from_tender_attachments", bind=True)
 def extract_text_from_attachments(self, tender_id: str, attachment_urls: list) -> dict:
     """Extract text from tender attachments
@@ -69,17 +140,19 @@ def extract_text_from_attachments(self, tender_id: str, attachment_urls: list) -
     try:
         logger.info(f"Extracting text from {len(attachment_urls)} attachments for {tender_id}")
         
-        extracted_texts = []
+        texts_by_url = {}
         errors = []
         
-        for url in attachment_urls:
-            try:
-                text = TextExtractor.extract_from_url(url)
-                if text:
-                    extracted_texts.append(text)
-            except Exception as e:
-                logger.error(f"Failed to extract from {url}: {str(e)}")
-                errors.append({"url": url, "error": str(e)})
+        # Parallel streaming downloads, parsing in a bounded process pool
+        with ExtractionEngine() as engine:
+            for result in engine.extract_many(attachment_urls):
+                if result['error']:
+                    errors.append({"url": result['url'], "error": result['error']})
+                elif result['text']:
+                    texts_by_url[result['url']] = result['text']
+        
+        # Keep attachment order stable regardless of completion order
+        extracted_texts = [texts_by_url[url] for url in attachment_urls if url in texts_by_url]
         
         # Update tender with extracted text
         if extracted_texts:
@@ -108,12 +181,16 @@ def extract_text_from_attachments(self, tender_id: str, attachment_urls: list) -
 
 
 @task(name="batch_normalize_tenders")
-def batch_normalize_tenders(tenders_data: list, platform_id: str) -> dict:
+def batch_normalize_tenders(tenders_data: list, platform_id: str, chunk_size: int = 500) -> dict:
     """Normalize batch of tenders (Sprint 32.7)
     
+    Each chunk is normalized, stored and indexed in a single transaction
+    via TenderNormalizer.normalize_and_store_many.
+    
     Args:
         tenders_data: List of raw tender data
         platform_id: Platform identifier
+        chunk_size: Tenders per transaction
     
     Returns:
         Batch processing results
@@ -121,23 +198,38 @@ def batch_normalize_tenders(tenders_data: list, platform_id: str) -> dict:
     results = {
         'total': len(tenders_data),
         'success': 0,
+        'duplicates': 0,
         'failed': 0,
         'errors': [],
     }
     
     logger.info(f"Starting batch normalization: {len(tenders_data)} tenders from {platform_id}")
     
-    for tender_data in tenders_data:
-        try:
-            # Queue each tender for normalization
-            normalize_tender_task.delay(tender_data, platform_id)
-            results['success'] += 1
-        except Exception as e:
-            logger.error(f"Batch queuing failed: {str(e)}")
-            results['failed'] += 1
-            results['errors'].append(str(e))
+    db = SessionLocal()
+    try:
+        normalizer = TenderNormalizer(db)
+        bulk_load = len(tenders_data) >= get_settings().es_bulk_load_min_docs
+        
+        # Large loads run with index refresh disabled and refresh once at the end
+        with normalizer.index_buffer.bulk_load() if bulk_load else nullcontext():
+            for offset in range(0, len(tenders_data), chunk_size):
+                chunk = tenders_data[offset:offset + chunk_size]
+                try:
+                    stats = normalizer.normalize_and_store_many(chunk, platform_id)
+                    results['success'] += stats['success']
+                    results['duplicates'] += stats['duplicates']
+                    results['failed'] += stats['failed']
+                except Exception as e:
+                    # Leave the session usable for the next chunk
+                    db.rollback()
+                    logger.error(f"Batch chunk failed: {str(e)}")
+                    results['failed'] += len(chunk)
+                    results['errors'].append(str(e))
     
-    logger.info(f"Batch queued: {results['success']}/{results['total']} success")
+    finally:
+        db.close()
+    
+    logger.info(f"Batch normalized: {results['success']}/{results['total']} success")
     return results
 
 
@@ -160,3 +252,23 @@ def reprocess_failed_tenders(limit: int = 100) -> dict:
     
     finally:
         db.close()
+
+
+@task(name="backfill_title_fingerprints")
+def backfill_title_fingerprints(batch_size: int = 1000) -> dict:
+    """Fill NormalizedTender.title_fingerprint for rows stored before the column existed
+    
+    Args:
+        batch_size: Rows updated per transaction
+    
+    Returns:
+        Backfill results
+    """
+    db = SessionLocal()
+    try:
+        logger.info("Backfilling title fingerprints")
+        updated = DuplicateDetector(db).backfill_title_fingerprints(batch_size=batch_size)
+        return {'status': 'success', 'updated': updated}
+    
+    finally:
+        db.close()
@@ -1,36 +1,181 @@
 """Text extraction from various file formats"""
 
 import os
-import tempfile
-from typing import Optional
+from typing import Iterator, Optional
 from pathlib import Path
 
-fromshared.logger import logger
+from shared.config import get_settings
+from shared.logger import logger
+from .archive_extractor import ArchiveExtractor, is_archive
+
+
+def _limit(chunks: Iterator[str], max_chars: Optional[int] = None, max_chunks: Optional[int] = None) -> Iterator[str]:
+    """Stop a chunk stream once the character or chunk budget is spent
+
+    Characters count the newline that joins consecutive chunks, so
+    `'\n'.join(...)` of the output never exceeds `max_chars`.
+    """
+    remaining = max_chars
+    try:
+        for index, chunk in enumerate(chunks):
+            if max_chunks is not None and index >= max_chunks:
+                break
+            if remaining is not None:
+                if index:
+                    remaining -= 1
+                if remaining <= 0:
+                    break
+                if len(chunk) >= remaining:
+                    yield chunk[:remaining]
+                    break
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        chunks.close()  # Release the underlying file right away
 
 
 class TextExtractor:
-    """Extract text from various file formats"""
+    """Extract text from various file formats
+    
+    `iter_*` methods stream a document in natural units (PDF pages, DOCX
+    paragraphs, XLSX rows, TXT lines) so callers can stop early and memory
+    stays bounded by one unit; they raise on unreadable files. `extract_from_*`
+    join those streams and return "" on failure.
+    """
     
     @staticmethod
-    def extract_from_pdf(file_path: str) -> str:
-        """Extract text from PDF
+    def iter_pdf(file_path: str, max_chars: Optional[int] = None, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Yield PDF text page by page
         
         Args:
             file_path: Path to PDF file
+            max_chars: Stop after this many characters
+            max_pages: Stop after this many pages
         
-        Returns:
-            Extracted text
+        Yields:
+            Text of each page
         """
-        try:
+        def pages() -> Iterator[str]:
             import PyPDF2
             
-            text = []
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 for page in pdf_reader.pages:
-                    text.append(page.extract_text())
+                    yield page.extract_text() or ''
+        
+        return _limit(pages(), max_chars, max_pages)
+    
+    @staticmethod
+    def iter_docx(file_path: str, max_chars: Optional[int] = None) -> Iterator[str]:
+        """Yield DOCX text paragraph by paragraph
+        
+        Args:
+            file_path: Path to DOCX file
+            max_chars: Stop after this many characters
+        
+        Yields:
+            Text of each paragraph
+        """
+        def paragraphs() -> Iterator[str]:
+            from docx import Document
             
-            result = '\n'.join(text)
+            for paragraph in Document(file_path).paragraphs:
+                yield paragraph.text
+        
+        return _limit(paragraphs(), max_chars)
+    
+    @staticmethod
+    def iter_xlsx(
+        file_path: str,
+        max_chars: Optional[int] = None,
+        max_rows_per_sheet: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Yield XLSX text row by row, sheet by sheet
+        
+        The workbook is opened read-only, so rows are parsed lazily from the
+        sheet XML instead of materializing every cell up front.
+        
+        Args:
+            file_path: Path to XLSX file
+            max_chars: Stop after this many characters
+            max_rows_per_sheet: Read at most this many rows of each sheet
+        
+        Yields:
+            Non-empty cells of each row, one per line
+        """
+        def rows() -> Iterator[str]:
+            import openpyxl
+            
+            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                for ws in wb.worksheets:
+                    for row in ws.iter_rows(max_row=max_rows_per_sheet, values_only=True):
+                        cells = [str(cell) for cell in row if cell]
+                        if cells:
+                            yield '\n'.join(cells)
+            finally:
+                wb.close()  # Read-only workbooks keep the zip file open
+        
+        return _limit(rows(), max_chars)
+    
+    @staticmethod
+    def iter_txt(file_path: str, max_chars: Optional[int] = None) -> Iterator[str]:
+        """Yield TXT text line by line
+        
+        Args:
+            file_path: Path to TXT file
+            max_chars: Stop after this many characters
+        
+        Yields:
+            Each line without its newline
+        """
+        def lines() -> Iterator[str]:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    yield line.rstrip('\n')
+        
+        return _limit(lines(), max_chars)
+    
+    @staticmethod
+    def iter_file(file_path: str, max_chars: Optional[int] = None, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Yield text chunks from file (auto-detect format)
+        
+        Args:
+            file_path: Path to file
+            max_chars: Stop after this many characters
+            max_pages: Stop after this many PDF pages
+        
+        Yields:
+            Text chunks; nothing for unsupported formats
+        """
+        suffix = Path(file_path).suffix.lower()
+        
+        if suffix == '.pdf':
+            return TextExtractor.iter_pdf(file_path, max_chars, max_pages)
+        elif suffix == '.docx':
+            return TextExtractor.iter_docx(file_path, max_chars)
+        elif suffix == '.xlsx':
+            return TextExtractor.iter_xlsx(file_path, max_chars)
+        elif suffix == '.txt':
+            return TextExtractor.iter_txt(file_path, max_chars)
+        else:
+            logger.warning(f"Unsupported file format: {suffix}")
+            return iter(())
+    
+    @staticmethod
+    def extract_from_pdf(file_path: str, max_chars: Optional[int] = None, max_pages: Optional[int] = None) -> str:
+        """Extract text from PDF
+        
+        Args:
+            file_path: Path to PDF file
+            max_chars: Stop after this many characters
+            max_pages: Stop after this many pages
+        
+        Returns:
+            Extracted text
+        """
+        try:
+            result = '\n'.join(TextExtractor.iter_pdf(file_path, max_chars, max_pages))
             logger.info(f"Extracted {len(result)} chars from PDF: {file_path}")
             return result
         except Exception as e:
@@ -38,22 +183,18 @@ class TextExtractor:
             return ""
     
     @staticmethod
-    def extract_from_docx(file_path: str) -> str:
+    def extract_from_docx(file_path: str, max_chars: Optional[int] = None) -> str:
         """Extract text from DOCX
         
         Args:
             file_path: Path to DOCX file
+            max_chars: Stop after this many characters
         
         Returns:
             Extracted text
         """
         try:
-            from docx import Document
-            
-            doc = Document(file_path)
-            text = [paragraph.text for paragraph in doc.paragraphs]
-            
-            result = '\n'.join(text)
+            result = '\n'.join(TextExtractor.iter_docx(file_path, max_chars))
             logger.info(f"Extracted {len(result)} chars from DOCX: {file_path}")
             return result
         except Exception as e:
@@ -61,27 +202,25 @@ class TextExtractor:
             return ""
     
     @staticmethod
-    def extract_from_xlsx(file_path: str) -> str:
+    def extract_from_xlsx(
+        file_path: str,
+        max_chars: Optional[int] = None,
+        max_rows_per_sheet: Optional[int] = None,
+    ) -> str:
         """Extract text from XLSX
         
         Args:
             file_path: Path to XLSX file
+            max_chars: Stop after this many characters
+            max_rows_per_sheet: Read at most this many rows of each sheet
         
         Returns:
             Extracted text
         """
+        if max_rows_per_sheet is None:
+            max_rows_per_sheet = get_settings().attachment_max_rows_per_sheet or None
         try:
-            import openpyxl
-            
-            wb = openpyxl.load_workbook(file_path)
-            text = []
-            
-            for sheet in wb.sheetnames:
-                ws = wb[sheet]
-                for row in ws.iter_rows(values_only=True):
-                    text.extend([str(cell) for cell in row if cell])
-            
-            result = '\n'.join(text)
+            result = '\n'.join(TextExtractor.iter_xlsx(file_path, max_chars, max_rows_per_sheet))
             logger.info(f"Extracted {len(result)} chars from XLSX: {file_path}")
             return result
         except Exception as e:
@@ -89,18 +228,18 @@ class TextExtractor:
             return ""
     
     @staticmethod
-    def extract_from_txt(file_path: str) -> str:
+    def extract_from_txt(file_path: str, max_chars: Optional[int] = None) -> str:
         """Extract text from TXT
         
         Args:
             file_path: Path to TXT file
+            max_chars: Stop after this many characters
         
         Returns:
             Extracted text
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
+            text = '\n'.join(TextExtractor.iter_txt(file_path, max_chars))
             logger.info(f"Extracted {len(text)} chars from TXT: {file_path}")
             return text
         except Exception as e:
@@ -108,11 +247,49 @@ class TextExtractor:
             return ""
     
     @staticmethod
-    def extract_from_file(file_path: str) -> str:
+    def extract_from_archive(file_path: str, max_chars: Optional[int] = None, max_pages: Optional[int] = None) -> str:
+        """Extract text from supported members of a ZIP/RAR/7z archive
+        
+        Members are unpacked and parsed one at a time; see
+        ExtractionEngine for parallel parsing.
+        
+        Args:
+            file_path: Path to archive
+            max_chars: Stop after this many characters
+            max_pages: Stop after this many pages per PDF member
+        
+        Returns:
+            Member texts joined in archive order
+        """
+        try:
+            texts = []
+            total = 0
+            with ArchiveExtractor().members(file_path) as members:
+                for name, member_path in members:
+                    text = TextExtractor.extract_from_file(member_path, max_chars, max_pages)
+                    if text:
+                        texts.append(text)
+                        total += len(text) + 1
+                    if max_chars is not None and total >= max_chars:
+                        break
+            
+            result = '\n'.join(texts)
+            if max_chars is not None:
+                result = result[:max_chars]
+            logger.info(f"Extracted {len(result)} chars from archive: {file_path}")
+            return result
+        except Exception as e:
+            logger.error(f"Failed to extract archive: {str(e)}")
+            return ""
+    
+    @staticmethod
+    def extract_from_file(file_path: str, max_chars: Optional[int] = None, max_pages: Optional[int] = None) -> str:
         """Extract text from file (auto-detect format)
         
         Args:
             file_path: Path to file
+            max_chars: Stop after this many characters
+            max_pages: Stop after this many PDF pages
         
         Returns:
             Extracted text
@@ -123,13 +300,15 @@ class TextExtractor:
         logger.info(f"Extracting text from {suffix} file: {file_path}")
         
         if suffix == '.pdf':
-            return TextExtractor.extract_from_pdf(file_path)
+            return TextExtractor.extract_from_pdf(file_path, max_chars, max_pages)
         elif suffix == '.docx':
-            return TextExtractor.extract_from_docx(file_path)
+            return TextExtractor.extract_from_docx(file_path, max_chars)
         elif suffix == '.xlsx':
-            return TextExtractor.extract_from_xlsx(file_path)
+            return TextExtractor.extract_from_xlsx(file_path, max_chars)
         elif suffix == '.txt':
-            return TextExtractor.extract_from_txt(file_path)
+            return TextExtractor.extract_from_txt(file_path, max_chars)
+        elif is_archive(file_path):
+            return TextExtractor.extract_from_archive(file_path, max_chars, max_pages)
         else:
             logger.warning(f"Unsupported file format: {suffix}")
             return ""
@@ -146,20 +325,24 @@ class TextExtractor:
         """
         try:
             import requests
+            from .extraction_engine import download_to_temp
             
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            settings = get_settings()
             
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(url).suffix) as tmp:
-                tmp.write(response.content)
-                tmp_path = tmp.name
+            # Stream to temp file under the size cap instead of buffering the body
+            with requests.Session() as session:
+                tmp_path = download_to_temp(
+                    session,
+                    url,
+                    max_bytes=settings.attachment_max_bytes,
+                    timeout=settings.attachment_download_timeout,
+                )['path']
             
             # Extract from temp file
-            text = TextExtractor.extract_from_file(tmp_path)
-            
-            # Cleanup
-            os.unlink(tmp_path)
+            try:
+                text = TextExtractor.extract_from_file(tmp_path)
+            finally:
+                os.unlink(tmp_path)
             
             logger.info(f"Extracted text from URL: {url}")
             return text
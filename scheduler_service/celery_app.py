@@ -33,6 +33,12 @@ celery_app.conf.beat_schedule = {
         "task": "scheduler_service.tasks.check_platform_status",
         "schedule": crontab(minute="*"),
     },
+    # Ship changed/deleted tenders to Elasticsearch by updated_at watermark
+    "index-changed-tenders": {
+        "task": "index_changed_tenders",
+        "schedule": settings.incremental_index_interval_seconds,
+        "options": {"expires": settings.incremental_index_interval_seconds},
+    },
 }
 
 # Define task decorator for easy registration
@@ -1,10 +1,10 @@
 """Scheduler logic for managing task execution"""
 
 from sqlalchemy.orm import Session
-from factory_parsers.shared.logger import logger
-from factory_parsers.admin_service.repositories import SearchRuleRepository
-from factory_parsers.scheduler_service.celery_app import celery_app
-from factory_parsers.scheduler_service.tasks import fetch_tenders_api, fetch_tenders_web
+from shared.logger import logger
+from admin_service.repositories import SearchRuleRepository
+from .celery_app import celery_app
+from .tasks import fetch_tenders_api, fetch_tenders_web
 
 
 class TenderScheduler:
@@ -20,7 +20,7 @@ class TenderScheduler:
         Returns:
             Dictionary with scheduling results
         """
-        from factory_parsers.admin_service.repositories import PlatformRepository
+        from admin_service.repositories import PlatformRepository
         
         platform_repo = PlatformRepository(self.db)
         platforms = platform_repo.list_all(active_only=True)
@@ -57,7 +57,7 @@ class TenderScheduler:
         logger.info(f"Scheduling rule {rule_id} for platform {platform_id}")
         
         # Determine if API or web scraping
-        from factory_parsers.admin_service.models import Platform
+        from admin_service.models import Platform
         
         platform = self.db.query(Platform).filter(Platform.id == platform_id).first()
         if not platform:
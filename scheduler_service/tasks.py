@@ -1,7 +1,7 @@
 """Celery tasks for scheduler_service"""
 
-from factory_parsers.scheduler_service.celery_app import task
-from factory_parsers.shared.logger import logger
+from .celery_app import task
+from shared.logger import logger
 
 
 @task(name="fetch_tenders_api", bind=True)
@@ -1,7 +1,16 @@
 """Search Service - Full-text search with Elasticsearch"""
 
 from .elasticsearch_client import ElasticsearchClient
-from .indexer import TenderIndexer
 from .searcher import TenderSearcher
 
 __all__ = ["ElasticsearchClient", "TenderIndexer", "TenderSearcher"]
+
+
+def __getattr__(name):
+    # The indexer pulls in the normalizer models; importing it lazily keeps
+    # `import search_service.elasticsearch_client` free of them (and of the
+    # normalizer -> search_service import cycle)
+    if name == "TenderIndexer":
+        from .indexer import TenderIndexer
+        return TenderIndexer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,42 @@
+"""Opaque cursor tokens for point-in-time + search_after pagination"""
+
+import base64
+import json
+from typing import Any, List, Optional, Tuple
+
+# Cursor value that starts a new cursor-paginated search
+START_CURSOR = "*"
+
+# Stable sort for search_after: relevance, then a unique keyword tiebreaker
+CURSOR_SORT = [{"_score": "desc"}, {"tender_id": "asc"}]
+
+
+def encode_cursor(pit_id: str, search_after: List[Any]) -> str:
+    """Encode PIT id and sort values of the last hit as an opaque token"""
+    payload = json.dumps({"pit": pit_id, "after": search_after}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], Optional[List[Any]]]:
+    """Decode cursor token
+    
+    Args:
+        cursor: Token from a previous page, or "*" to start
+    
+    Returns:
+        (pit_id, search_after); both None for the start cursor
+    
+    Raises:
+        ValueError: Malformed token
+    """
+    if cursor == START_CURSOR:
+        return None, None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        pit_id, search_after = payload["pit"], payload["after"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(pit_id, str) or not isinstance(search_after, list):
+        raise ValueError("Invalid cursor")
+    return pit_id, search_after
@@ -1,67 +1,255 @@
 """Elasticsearch client wrapper"""
 
-from typing import Dict, List, Optional, Any
-from elasticsearch import Elasticsearch
-from elasticsearch.helpers import bulk
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
+from elasticsearch import AsyncElasticsearch, Elasticsearch, NotFoundError
+from elasticsearch.helpers import bulk, streaming_bulk
 
-from factory_parsers.shared.config import get_settings
-from factory_parsers.shared.logger import logger
+from shared.config import get_settings
+from shared.logger import logger
+from .query_builder import build_cursor_search_body, build_search_body
+from .cursor import CURSOR_SORT
 
 settings = get_settings()
 
 
+# Index mappings and settings shared by bootstrap and versioned reindex
+TENDER_INDEX_BODY = {
+    "mappings": {
+        "properties": {
+            "tender_id": {"type": "keyword"},
+            "title": {
+                "type": "text",
+                "analyzer": "standard",
+                "fields": {"raw": {"type": "keyword"}}
+            },
+            "description": {
+                "type": "text",
+                "analyzer": "standard"
+            },
+            "extracted_text": {
+                "type": "text",
+                "analyzer": "standard"
+            },
+            "platform": {"type": "keyword"},
+            "customer": {"type": "keyword"},
+            "category": {"type": "keyword"},
+            "status": {"type": "keyword"},
+            "budget": {"type": "float"},
+            "currency": {"type": "keyword"},
+            "start_date": {"type": "date"},
+            "end_date": {"type": "date"},
+            "normalized_at": {"type": "date"},
+        }
+    },
+    "settings": {
+        "number_of_shards": 1,
+        "number_of_replicas": 0,
+    }
+}
+
+
+TENDER_INDEX_ALIAS = "tenders"
+
+
+def build_tender_document(tender) -> Dict[str, Any]:
+    """Build the index document for a NormalizedTender (TENDER_INDEX_BODY fields)
+    
+    Shared by every writer of the tender index (normalizer sink, search
+    indexer, reindex), so documents always match the mapping and filters.
+    
+    Args:
+        tender: NormalizedTender object
+    
+    Returns:
+        Elasticsearch document
+    """
+    return {
+        "tender_id": tender.tender_id,
+        "title": tender.title,
+        "description": tender.description or "",
+        "extracted_text": tender.extracted_text or "",
+        "platform": tender.platform_id,
+        "customer": tender.customer_name or "",
+        "category": tender.category or "",
+        "status": tender.status,
+        "budget": tender.budget_amount,
+        "currency": tender.budget_currency,
+        "start_date": tender.start_date.isoformat() if tender.start_date else None,
+        "end_date": tender.end_date.isoformat() if tender.end_date else None,
+        "normalized_at": tender.normalized_at.isoformat(),
+    }
+
+
+_index_ready = False
+_index_lock = threading.Lock()
+
+
+def _client_options() -> Dict[str, Any]:
+    return dict(
+        hosts=[url.strip() for url in settings.elasticsearch_url.split(",")],
+        connections_per_node=settings.es_connections_per_node,
+        request_timeout=settings.es_request_timeout,
+        max_retries=settings.es_max_retries,
+        retry_on_timeout=True,
+        sniff_on_start=settings.es_sniff,
+        sniff_on_node_failure=settings.es_sniff,
+        min_delay_between_sniffing=settings.es_sniff_interval,
+    )
+
+
+@lru_cache()
+def get_elasticsearch() -> Elasticsearch:
+    """Get process-wide Elasticsearch client
+    
+    The client keeps a pool of persistent (keep-alive) HTTP connections per
+    node and is thread-safe, so every searcher/indexer in the process shares it.
+    """
+    return Elasticsearch(**_client_options())
+
+
+@lru_cache()
+def get_async_elasticsearch() -> AsyncElasticsearch:
+    """Get process-wide async Elasticsearch client (bound to the serving event loop)"""
+    return AsyncElasticsearch(**_client_options())
+
+
+async def close_async_elasticsearch() -> None:
+    """Close the async client's connections (application shutdown)"""
+    if get_async_elasticsearch.cache_info().currsize:
+        await get_async_elasticsearch().close()
+        get_async_elasticsearch.cache_clear()
+
+
 class ElasticsearchClient:
-    """Elasticsearch client for tender search"""
+    """Elasticsearch client for tender search
+    
+    `index_name` is an alias pointing at a versioned index (`tenders_<timestamp>`),
+    so a full reindex can build a new index and flip the alias atomically.
+    Instances are cheap: they share the pooled process-wide client, and the
+    index is bootstrapped once per process.
+    """
     
     def __init__(self):
-        self.es = Elasticsearch([settings.elasticsearch_url])
-        self.index_name = "tenders"
-        self._init_index()
+        self.es = get_elasticsearch()
+        self.index_name = TENDER_INDEX_ALIAS
+        self.ensure_index()
+    
+    def ensure_index(self) -> None:
+        """Create the index on first use in this process (no-op afterwards)"""
+        global _index_ready
+        if _index_ready:
+            return
+        with _index_lock:
+            if not _index_ready:
+                self._init_index()
+                _index_ready = True
     
     def _init_index(self):
         """Initialize Elasticsearch index"""
         try:
             if not self.es.indices.exists(index=self.index_name):
-                # Create index with mappings
-                mappings = {
-                    "mappings": {
-                        "properties": {
-                            "tender_id": {"type": "keyword"},
-                            "title": {
-                                "type": "text",
-                                "analyzer": "standard",
-                                "fields": {"raw": {"type": "keyword"}}
-                            },
-                            "description": {
-                                "type": "text",
-                                "analyzer": "standard"
-                            },
-                            "extracted_text": {
-                                "type": "text",
-                                "analyzer": "standard"
-                            },
-                            "platform": {"type": "keyword"},
-                            "customer": {"type": "keyword"},
-                            "category": {"type": "keyword"},
-                            "status": {"type": "keyword"},
-                            "budget": {"type": "float"},
-                            "currency": {"type": "keyword"},
-                            "start_date": {"type": "date"},
-                            "end_date": {"type": "date"},
-                            "normalized_at": {"type": "date"},
-                        }
-                    },
-                    "settings": {
-                        "number_of_shards": 1,
-                        "number_of_replicas": 0,
-                    }
-                }
-                self.es.indices.create(index=self.index_name, body=mappings)
-                logger.info(f"Created Elasticsearch index: {self.index_name}")
+                # Create versioned index behind the alias
+                body = dict(TENDER_INDEX_BODY, aliases={self.index_name: {}})
+                index = self._versioned_index_name()
+                self.es.indices.create(index=index, body=body)
+                logger.info(f"Created Elasticsearch index: {index} (alias {self.index_name})")
         except Exception as e:
             logger.error(f"Failed to initialize index: {str(e)}")
             raise
     
+    def _versioned_index_name(self) -> str:
+        return f"{self.index_name}_{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}"
+    
+    def create_versioned_index(self) -> str:
+        """Create new versioned index for a bulk reindex
+        
+        Refresh is disabled until `finalize_versioned_index` is called.
+        
+        Returns:
+            New index name
+        """
+        index = self._versioned_index_name()
+        body = {
+            "mappings": TENDER_INDEX_BODY["mappings"],
+            "settings": dict(TENDER_INDEX_BODY["settings"], refresh_interval="-1"),
+        }
+        self.es.indices.create(index=index, body=body)
+        logger.info(f"Created versioned index: {index}")
+        return index
+    
+    def get_alias_indices(self) -> List[str]:
+        """Get concrete indices currently behind the alias"""
+        try:
+            return list(self.es.indices.get_alias(name=self.index_name).keys())
+        except NotFoundError:
+            return []
+    
+    def finalize_versioned_index(self, index: str) -> List[str]:
+        """Enable refresh on a freshly built index and atomically point the alias at it
+        
+        Args:
+            index: Versioned index built by reindex
+        
+        Returns:
+            Indices that were behind the alias before the swap
+        """
+        self.es.indices.put_settings(
+            index=index,
+            body={"index": {"refresh_interval": settings.es_refresh_interval}}
+        )
+        self.es.indices.refresh(index=index)
+        
+        old_indices = self.get_alias_indices()
+        actions = [{"remove": {"index": old, "alias": self.index_name}} for old in old_indices]
+        if not old_indices and self.es.indices.exists(index=self.index_name):
+            # Legacy concrete index with the alias name: drop it in the same atomic request
+            actions.append({"remove_index": {"index": self.index_name}})
+        actions.append({"add": {"index": index, "alias": self.index_name}})
+        
+        self.es.indices.update_aliases(body={"actions": actions})
+        logger.info(f"Alias {self.index_name} -> {index} (was {old_indices or 'none'})")
+        return old_indices
+    
+    def delete_index(self, index: str) -> bool:
+        """Delete concrete index"""
+        try:
+            self.es.indices.delete(index=index)
+            logger.info(f"Deleted index: {index}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete index {index}: {str(e)}")
+            return False
+    
+    def get_partitions(self, doc_ids: Iterable[str]) -> Optional[Dict[str, Tuple[Optional[str], Optional[str]]]]:
+        """(platform, category) of documents as currently indexed
+        
+        Read before overwriting documents, so writers can invalidate cached
+        searches over the partitions a document moves out of.
+        
+        Args:
+            doc_ids: Document IDs
+        
+        Returns:
+            {doc_id: (platform, category)} of the indexed ones, None if the
+            lookup failed
+        """
+        doc_ids = list(doc_ids)
+        if not doc_ids:
+            return {}
+        try:
+            response = self.es.mget(index=self.index_name, ids=doc_ids, _source_includes=["platform", "category"])
+        except Exception as e:
+            logger.warning(f"Failed to read indexed partitions: {str(e)}")
+            return None
+        return {
+            doc["_id"]: (doc["_source"].get("platform") or None, doc["_source"].get("category") or None)
+            for doc in response["docs"]
+            if doc.get("found")
+        }
+    
     def index_document(self, doc_id: str, document: Dict[str, Any]) -> bool:
         """Index single document"""
         try:
@@ -91,51 +279,143 @@ class ElasticsearchClient:
             logger.error(f"Bulk indexing failed: {str(e)}")
             return 0
     
+    def bulk(
+        self,
+        actions: List[Dict[str, Any]],
+        refresh: Union[bool, str] = False,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Send prepared bulk actions
+        
+        Args:
+            actions: Bulk helper actions (`_id`, `_source`, optional `_op_type`)
+            refresh: ES refresh policy (False, True or "wait_for")
+        
+        Returns:
+            (successful count, per-document errors)
+        """
+        for action in actions:
+            action.setdefault("_index", self.index_name)
+        
+        success, errors = bulk(
+            self.es,
+            actions,
+            raise_on_error=False,
+            raise_on_exception=False,
+            refresh=refresh,
+        )
+        return success, errors
+    
+    def streaming_bulk(
+        self,
+        actions: Iterable[Dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        """Stream bulk actions in chunks without materializing them
+        
+        Args:
+            actions: Bulk helper actions (`_index` defaults to the alias)
+            chunk_size: Documents per bulk request
+        
+        Yields:
+            (ok, result item) per document
+        """
+        def with_index(items):
+            for action in items:
+                action.setdefault("_index", self.index_name)
+                yield action
+        
+        yield from streaming_bulk(
+            self.es,
+            with_index(actions),
+            chunk_size=chunk_size,
+            max_retries=3,
+            raise_on_error=False,
+            raise_on_exception=False,
+        )
+    
+    def set_refresh_interval(self, interval: str) -> bool:
+        """Set index refresh interval ("-1" disables refresh during bulk loads)"""
+        try:
+            self.es.indices.put_settings(
+                index=self.index_name,
+                body={"index": {"refresh_interval": interval}}
+            )
+            logger.info(f"Set refresh_interval={interval} on {self.index_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set refresh interval: {str(e)}")
+            return False
+    
+    def refresh(self) -> None:
+        """Make all indexed documents searchable"""
+        self.es.indices.refresh(index=self.index_name)
+    
     def search(
         self,
         query: str,
         filters: Optional[Dict[str, Any]] = None,
         size: int = 20,
         from_: int = 0,
+        range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        view: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Search documents"""
-        try:
-            es_query = {
-                "bool": {
-                    "must": [
-                        {
-                            "multi_match": {
-                                "query": query,
-                                "fields": ["title^2", "description", "extracted_text"],
-                                "fuzziness": "AUTO",
-                            }
-                        }
-                    ]
-                }
-            }
-            
-            # Add filters
-            if filters:
-                for field, value in filters.items():
-                    if isinstance(value, list):
-                        es_query["bool"]["filter"] = {
-                            "terms": {field: value}
-                        }
-                    else:
-                        es_query["bool"]["filter"] = {
-                            "term": {field: value}
-                        }
-            
-            results = self.es.search(
-                index=self.index_name,
-                body={"query": es_query, "size": size, "from": from_}
-            )
-            
-            return results
+        """Search documents
+        
+        Args:
+            query: Search text ("*" or empty matches all)
+            filters: Term/terms filters {field: value or [values]}
+            size: Results per page
+            from_: Pagination offset
+            range_filters: Range filters {field: {"gte": ..., "lte": ...}}
+            view: Result view (see query_builder.RESULT_VIEWS), None for full `_source`
+        
+        Raises:
+            ValueError: Unknown view
+        """
+        body = build_search_body(query, filters, range_filters, size, from_, view)
+        try:
+            return self.es.search(index=self.index_name, body=body)
         except Exception as e:
             logger.error(f"Search failed: {str(e)}")
             return {"hits": {"total": 0, "hits": []}}
     
+    def open_point_in_time(self) -> str:
+        """Open point-in-time over the alias for consistent deep pagination"""
+        response = self.es.open_point_in_time(index=self.index_name, keep_alive=settings.search_cursor_keep_alive)
+        return response["id"]
+    
+    def close_point_in_time(self, pit_id: str) -> None:
+        """Release point-in-time (it also expires after keep_alive)"""
+        try:
+            self.es.close_point_in_time(body={"id": pit_id})
+        except Exception as e:
+            logger.warning(f"Failed to close point-in-time: {str(e)}")
+    
+    def search_after(
+        self,
+        query: str,
+        pit_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        size: int = 20,
+        search_after: Optional[List[Any]] = None,
+        source: Optional[Dict[str, List[str]]] = None,
+        view: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch the page after `search_after` within a point-in-time
+        
+        Raises:
+            ValueError: Point-in-time expired or unknown, or unknown view
+        """
+        body = build_cursor_search_body(
+            query, pit_id, settings.search_cursor_keep_alive, CURSOR_SORT,
+            filters, range_filters, size, search_after, source, view,
+        )
+        try:
+            return self.es.search(body=body)
+        except NotFoundError:
+            raise ValueError("Cursor expired")
+    
     def delete_document(self, doc_id: str) -> bool:
         """Delete document"""
         try:
@@ -149,7 +429,8 @@ class ElasticsearchClient:
     def clear_index(self) -> bool:
         """Clear all documents from index"""
         try:
-            self.es.indices.delete(index=self.index_name)
+            for index in self.get_alias_indices() or [self.index_name]:
+                self.es.indices.delete(index=index)
             self._init_index()
             logger.info(f"Cleared index: {self.index_name}")
             return True
@@ -161,7 +442,94 @@ class ElasticsearchClient:
         """Get index statistics"""
         try:
             stats = self.es.indices.stats(index=self.index_name)
-            return stats["indices"][self.index_name]["primaries"]["docs"]
+            return stats["_all"]["primaries"]["docs"]
+        except Exception as e:
+            logger.error(f"Failed to get stats: {str(e)}")
+            return {"count": 0, "deleted": 0}
+
+
+class AsyncElasticsearchClient:
+    """Non-blocking search against the tender alias
+    
+    Read-only counterpart of ElasticsearchClient for async route handlers;
+    index bootstrap and writes stay on the sync client.
+    """
+    
+    def __init__(self):
+        self.es = get_async_elasticsearch()
+        self.index_name = TENDER_INDEX_ALIAS
+    
+    async def search(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        size: int = 20,
+        from_: int = 0,
+        range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        view: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Search documents
+        
+        Args:
+            query: Search text ("*" or empty matches all)
+            filters: Term/terms filters {field: value or [values]}
+            size: Results per page
+            from_: Pagination offset
+            range_filters: Range filters {field: {"gte": ..., "lte": ...}}
+            view: Result view (see query_builder.RESULT_VIEWS), None for full `_source`
+        
+        Raises:
+            ValueError: Unknown view
+        """
+        body = build_search_body(query, filters, range_filters, size, from_, view)
+        try:
+            return await self.es.search(index=self.index_name, body=body)
+        except Exception as e:
+            logger.error(f"Search failed: {str(e)}")
+            return {"hits": {"total": 0, "hits": []}}
+    
+    async def open_point_in_time(self) -> str:
+        """Open point-in-time over the alias for consistent deep pagination"""
+        response = await self.es.open_point_in_time(index=self.index_name, keep_alive=settings.search_cursor_keep_alive)
+        return response["id"]
+    
+    async def close_point_in_time(self, pit_id: str) -> None:
+        """Release point-in-time (it also expires after keep_alive)"""
+        try:
+            await self.es.close_point_in_time(body={"id": pit_id})
+        except Exception as e:
+            logger.warning(f"Failed to close point-in-time: {str(e)}")
+    
+    async def search_after(
+        self,
+        query: str,
+        pit_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+        size: int = 20,
+        search_after: Optional[List[Any]] = None,
+        source: Optional[Dict[str, List[str]]] = None,
+        view: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch the page after `search_after` within a point-in-time
+        
+        Raises:
+            ValueError: Point-in-time expired or unknown, or unknown view
+        """
+        body = build_cursor_search_body(
+            query, pit_id, settings.search_cursor_keep_alive, CURSOR_SORT,
+            filters, range_filters, size, search_after, source, view,
+        )
+        try:
+            return await self.es.search(body=body)
+        except NotFoundError:
+            raise ValueError("Cursor expired")
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        try:
+            stats = await self.es.indices.stats(index=self.index_name)
+            return stats["_all"]["primaries"]["docs"]
         except Exception as e:
             logger.error(f"Failed to get stats: {str(e)}")
             return {"count": 0, "deleted": 0}
@@ -1,12 +1,18 @@
 """Tender indexer for Elasticsearch"""
 
-from typing import List, Dict, Any
-from datetime import datetime
-from sqlalchemy.orm import Session
+import time
+from itertools import islice
+from typing import Callable, List, Dict, Any, Optional
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.orm import Session, defer
 
-from factory_parsers.shared.logger import logger
-from factory_parsers.normalizer_service.repositories import NormalizedTenderRepository
-from factory_parsers.search_service.elasticsearch_client import ElasticsearchClient
+from shared.config import get_settings
+from shared.index_generation import get_index_generations
+from shared.logger import logger
+from normalizer_service.models import NormalizedTender, IndexTombstone, IndexSyncState
+from normalizer_service.repositories import NormalizedTenderRepository
+from .elasticsearch_client import ElasticsearchClient, build_tender_document
 
 
 class TenderIndexer:
@@ -31,8 +37,15 @@ class TenderIndexer:
             logger.warning(f"Tender not found: {tender_id}")
             return False
         
-        doc = self._prepare_document(tender)
-        return self.es_client.index_document(tender_id, doc)
+        doc = build_tender_document(tender)
+        previous = self.es_client.get_partitions([tender_id])
+        if not self.es_client.index_document(tender_id, doc):
+            return False
+        get_index_generations().bump_written(
+            [(tender.platform_id, tender.category)],
+            previous.values() if previous is not None else None,
+        )
+        return True
     
     def bulk_index(self, tender_ids: List[str] = None, platform: str = None) -> int:
         """Bulk index tenders
@@ -60,48 +73,229 @@ class TenderIndexer:
             return 0
         
         # Prepare documents
-        documents = [self._prepare_document(t) for t in tenders]
+        documents = [build_tender_document(t) for t in tenders]
+        previous = self.es_client.get_partitions(t.tender_id for t in tenders)
         
         # Index
         count = self.es_client.bulk_index(documents)
+        if count:
+            get_index_generations().bump_written(
+                [(t.platform_id, t.category) for t in tenders],
+                previous.values() if previous is not None else None,
+            )
         logger.info(f"Indexed {count} tenders")
         return count
     
-    def reindex_all(self) -> int:
-        """Reindex all tenders
+    def reindex_all(
+        self,
+        chunk_size: int = 500,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> int:
+        """Reindex all tenders without search downtime
+        
+        Rows are streamed from PostgreSQL with a server-side cursor into a new
+        versioned index via streaming bulk; the alias is flipped atomically
+        once the new index is complete and old indices are dropped.
+        
+        Args:
+            chunk_size: Rows fetched / documents sent per round-trip
+            progress: Callback receiving {indexed, failed, total, docs_per_sec}
         
         Returns:
             Number of indexed documents
         """
         logger.info("Starting full reindex...")
         
-        # Clear old index
-        self.es_client.clear_index()
+        total = self.db.query(func.count(NormalizedTender.id)).scalar() or 0
+        reindex_started_at = datetime.utcnow()
+        last_tombstone_id = self.db.query(func.max(IndexTombstone.id)).scalar() or 0
+        new_index = self.es_client.create_versioned_index()
+        
+        stats = {'index': new_index, 'indexed': 0, 'failed': 0, 'total': total, 'docs_per_sec': 0.0}
+        started = time.monotonic()
+        
+        try:
+            tenders = self.db.query(NormalizedTender).options(
+                defer(NormalizedTender.raw_data)
+            ).order_by(NormalizedTender.id).yield_per(chunk_size)
+            
+            actions = (
+                {"_index": new_index, "_id": tender.tender_id, "_source": build_tender_document(tender)}
+                for tender in tenders
+            )
+            
+            for processed, (ok, item) in enumerate(self.es_client.streaming_bulk(actions, chunk_size=chunk_size), 1):
+                if ok:
+                    stats['indexed'] += 1
+                else:
+                    stats['failed'] += 1
+                    logger.warning(f"Reindex failed for document: {item}")
+                
+                if processed % chunk_size == 0:
+                    stats['docs_per_sec'] = round(processed / max(time.monotonic() - started, 1e-6), 1)
+                    if progress:
+                        progress(dict(stats))
+        except Exception:
+            logger.error(f"Reindex into {new_index} failed, alias left unchanged", exc_info=True)
+            self.es_client.delete_index(new_index)
+            raise
         
-        # Bulk index all
-        return self.bulk_index()
+        if total and not stats['indexed']:
+            self.es_client.delete_index(new_index)
+            raise RuntimeError(f"Reindex produced an empty index ({stats['failed']} failures), alias left unchanged")
+        
+        old_indices = self.es_client.finalize_versioned_index(new_index)
+        for old_index in old_indices:
+            self.es_client.delete_index(old_index)
+        get_index_generations().bump_epoch()
+        
+        # Changes written to the old index while streaming are replayed by the incremental indexer
+        self._rewind_sync_state(reindex_started_at, last_tombstone_id)
+        
+        stats['docs_per_sec'] = round(stats['indexed'] / max(time.monotonic() - started, 1e-6), 1)
+        if progress:
+            progress(dict(stats))
+        
+        logger.info(
+            f"Reindexed {stats['indexed']}/{total} tenders into {new_index} "
+            f"({stats['failed']} failed, {stats['docs_per_sec']} docs/s)"
+        )
+        return stats['indexed']
     
-    def _prepare_document(self, tender) -> Dict[str, Any]:
-        """Prepare tender document for indexing
+    def index_changes(self, chunk_size: int = 500) -> Dict[str, Any]:
+        """Ship only tenders changed since the last run, plus deletions
+        
+        Rows with `updated_at` at or after the stored high-water mark (minus a
+        small overlap for late commits) are re-indexed, except those the
+        normalizer's bulk sink already indexed at that version (`indexed_at`).
+        Tombstones written by NormalizedTenderRepository.delete become ES
+        delete actions. The sync state row is locked for the run so
+        overlapping Beat ticks skip.
         
         Args:
-            tender: NormalizedTender object
+            chunk_size: Rows fetched / documents sent per round-trip
         
         Returns:
-            Elasticsearch document
+            Run stats {status, indexed, deleted, failed, watermark}
         """
-        return {
-            "tender_id": tender.tender_id,
-            "title": tender.title,
-            "description": tender.description or "",
-            "extracted_text": tender.extracted_text or "",
-            "platform": tender.platform,
-            "customer": tender.customer or "",
-            "category": tender.category or "",
-            "status": tender.status,
-            "budget": tender.budget,
-            "currency": tender.currency,
-            "start_date": tender.start_date.isoformat() if tender.start_date else None,
-            "end_date": tender.end_date.isoformat() if tender.end_date else None,
-            "normalized_at": tender.normalized_at.isoformat(),
-        }
+        state = self._lock_sync_state()
+        if state is None:
+            logger.info("Incremental indexing already running, skipping")
+            return {'status': 'skipped', 'indexed': 0, 'deleted': 0, 'failed': 0}
+        
+        overlap = timedelta(seconds=get_settings().incremental_index_overlap_seconds)
+        query = self.db.query(NormalizedTender).options(defer(NormalizedTender.raw_data))
+        if state.updated_at_watermark:
+            query = query.filter(NormalizedTender.updated_at >= state.updated_at_watermark - overlap)
+        tenders = query.order_by(NormalizedTender.updated_at, NormalizedTender.id).yield_per(chunk_size)
+        
+        tombstones = self.db.query(IndexTombstone.id, IndexTombstone.tender_id).filter(
+            IndexTombstone.id > state.tombstone_watermark
+        ).order_by(IndexTombstone.id).all()
+        
+        stats = {'status': 'success', 'indexed': 0, 'deleted': 0, 'failed': 0}
+        max_updated_at = state.updated_at_watermark
+        first_failed_at = None
+        updated_at_by_id = {}
+        partitions = set()
+        previous_partitions = set()
+        previous_unknown = False
+        
+        def actions():
+            nonlocal max_updated_at, previous_unknown
+            rows = iter(tenders)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                for tender in chunk:
+                    if max_updated_at is None or tender.updated_at > max_updated_at:
+                        max_updated_at = tender.updated_at
+                chunk = [
+                    tender for tender in chunk
+                    if tender.indexed_at is None or tender.indexed_at < tender.updated_at
+                ]
+                if not chunk:
+                    continue
+                # Partitions the documents are about to leave (category/platform edits)
+                previous = self.es_client.get_partitions(tender.tender_id for tender in chunk)
+                if previous is None:
+                    previous_unknown = True
+                else:
+                    previous_partitions.update(previous.values())
+                
+                for tender in chunk:
+                    updated_at_by_id[tender.tender_id] = tender.updated_at
+                    partitions.add((tender.platform_id, tender.category))
+                    yield {"_id": tender.tender_id, "_source": build_tender_document(tender)}
+            for tombstone in tombstones:
+                yield {"_op_type": "delete", "_id": tombstone.tender_id}
+        
+        for ok, item in self.es_client.streaming_bulk(actions(), chunk_size=chunk_size):
+            op_type, result = next(iter(item.items()))
+            if op_type == "delete":
+                # Already missing from the index counts as deleted
+                if ok or result.get("status") == 404:
+                    stats['deleted'] += 1
+                else:
+                    stats['failed'] += 1
+                continue
+            
+            updated_at = updated_at_by_id.pop(result.get("_id"), None)
+            if ok:
+                stats['indexed'] += 1
+            else:
+                stats['failed'] += 1
+                logger.warning(f"Incremental index failed for document: {item}")
+                if updated_at and (first_failed_at is None or updated_at < first_failed_at):
+                    first_failed_at = updated_at
+        
+        # Never move the watermark past a failed row; it is retried next run
+        state.updated_at_watermark = first_failed_at or max_updated_at
+        if tombstones and not stats['failed']:
+            state.tombstone_watermark = tombstones[-1].id
+        state.last_run_at = datetime.utcnow()
+        self.db.commit()
+        
+        if stats['deleted']:
+            get_index_generations().bump_epoch()
+        elif stats['indexed']:
+            get_index_generations().bump_written(partitions, None if previous_unknown else previous_partitions)
+        
+        stats['watermark'] = state.updated_at_watermark.isoformat() if state.updated_at_watermark else None
+        if stats['indexed'] or stats['deleted'] or stats['failed']:
+            logger.info(
+                f"Incremental index: {stats['indexed']} indexed, {stats['deleted']} deleted, "
+                f"{stats['failed']} failed, watermark {stats['watermark']}"
+            )
+        return stats
+    
+    def _lock_sync_state(self) -> Optional[IndexSyncState]:
+        """Lock (creating if needed) the sync state row of the index, None if held elsewhere"""
+        index_name = self.es_client.index_name
+        state = self.db.query(IndexSyncState).filter(
+            IndexSyncState.index_name == index_name
+        ).with_for_update(skip_locked=True).first()
+        if state is not None:
+            return state
+        
+        if self.db.query(IndexSyncState.index_name).filter(IndexSyncState.index_name == index_name).first():
+            return None
+        
+        state = IndexSyncState(index_name=index_name, tombstone_watermark=0)
+        self.db.add(state)
+        self.db.flush()
+        return state
+    
+    def _rewind_sync_state(self, updated_at: datetime, tombstone_id: int) -> None:
+        """Move watermarks back so changes made during a reindex are replayed"""
+        state = self.db.query(IndexSyncState).filter(
+            IndexSyncState.index_name == self.es_client.index_name
+        ).with_for_update().first()
+        if state is None:
+            state = IndexSyncState(index_name=self.es_client.index_name)
+            self.db.add(state)
+        
+        state.updated_at_watermark = updated_at
+        state.tombstone_watermark = tombstone_id
+        self.db.commit()
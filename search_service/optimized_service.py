@@ -1,26 +1,27 @@
 """Search optimizations (caching, pagination defaults)"""
 
 from typing import Dict, Any
-from factory_parsers.shared.cache import Cache
-from factory_parsers.search_service.searcher import TenderSearcher
+from shared.config import get_settings
+from shared.index_generation import get_index_generations
+from shared.tiered_cache import get_tiered_cache
+from .searcher import TenderSearcher
 
 
 class OptimizedSearchService:
     """Search service with caching and sane defaults"""
 
     def __init__(self):
+        settings = get_settings()
         self.searcher = TenderSearcher()
-        self.cache = Cache(namespace="search")
+        self.cache = get_tiered_cache("search", settings.search_cache_ttl, settings.search_cache_stale_ttl)
 
     def search_with_cache(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        key = self._build_cache_key(params)
-        cached = self.cache.get(key)
-        if cached:
-            return cached
+        generation = get_index_generations().current(params.get("platform"), params.get("category"))
+        if generation is None:
+            return self.searcher.search(**params)
 
-        results = self.searcher.search(**params)
-        self.cache.set(key, results, ttl=60)  # 1 minute cache
-        return results
+        key = self._build_cache_key({**params, "generation": generation})
+        return self.cache.get_or_compute(key, lambda: self.searcher.search(**params))
 
     @staticmethod
     def _build_cache_key(params: Dict[str, Any]) -> str:
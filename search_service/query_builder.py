@@ -0,0 +1,193 @@
+"""Elasticsearch query DSL builder for tender search"""
+
+from typing import Any, Dict, List, Optional
+
+# Full-text fields and boosts
+SEARCH_FIELDS = ["title^2", "description", "extracted_text"]
+
+# Queries that mean "no text constraint"
+MATCH_ALL_QUERIES = {"", "*"}
+
+# Result views: which `_source` fields come back and which fields are
+# returned as highlighted fragments instead of full text
+LIST_VIEW = "list"
+DETAIL_VIEW = "detail"
+EXPORT_VIEW = "export"
+
+# Attachment text can be megabytes; cap what the highlighter analyzes
+HIGHLIGHT_MAX_ANALYZED_OFFSET = 1_000_000
+
+RESULT_VIEWS: Dict[str, Dict[str, Any]] = {
+    LIST_VIEW: {
+        "_source": {
+            "includes": [
+                "tender_id", "title", "platform", "customer", "category", "status",
+                "budget", "currency", "start_date", "end_date", "normalized_at",
+            ],
+        },
+        "highlight": {
+            "max_analyzed_offset": HIGHLIGHT_MAX_ANALYZED_OFFSET,
+            "fields": {
+                "title": {"number_of_fragments": 0},
+                "description": {"fragment_size": 200, "number_of_fragments": 1, "no_match_size": 200},
+                "extracted_text": {"fragment_size": 200, "number_of_fragments": 2},
+            },
+        },
+    },
+    DETAIL_VIEW: {
+        "_source": {"excludes": ["extracted_text"]},
+        "highlight": {
+            "max_analyzed_offset": HIGHLIGHT_MAX_ANALYZED_OFFSET,
+            "fields": {
+                "extracted_text": {"fragment_size": 300, "number_of_fragments": 5},
+            },
+        },
+    },
+    EXPORT_VIEW: {
+        "_source": {
+            "includes": [
+                "tender_id", "title", "description", "platform", "customer", "category",
+                "status", "budget", "currency", "start_date", "end_date", "normalized_at",
+            ],
+        },
+    },
+}
+
+
+def view_options(view: Optional[str]) -> Dict[str, Any]:
+    """Get `_source`/`highlight` request options for a result view
+    
+    Args:
+        view: Result view name, None for the full `_source`
+    
+    Returns:
+        Body keys to merge into a search request
+    
+    Raises:
+        ValueError: Unknown view
+    """
+    if view is None:
+        return {}
+    try:
+        return RESULT_VIEWS[view]
+    except KeyError:
+        raise ValueError(f"Unknown result view: {view}")
+
+
+def build_filter_clauses(
+    filters: Optional[Dict[str, Any]] = None,
+    range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """Build filter-context clauses
+    
+    Args:
+        filters: {field: value} for term, {field: [values]} for terms;
+            None values and empty lists are skipped
+        range_filters: {field: {"gte": ..., "lte": ...}}; None bounds are skipped
+    
+    Returns:
+        List of term/terms/range clauses
+    """
+    clauses = []
+    for field, value in (filters or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            if value:
+                clauses.append({"terms": {field: list(value)}})
+        else:
+            clauses.append({"term": {field: value}})
+    
+    for field, bounds in (range_filters or {}).items():
+        bounds = {op: bound for op, bound in (bounds or {}).items() if bound is not None}
+        if bounds:
+            clauses.append({"range": {field: bounds}})
+    
+    return clauses
+
+
+def build_query(
+    query: Optional[str],
+    filters: Optional[Dict[str, Any]] = None,
+    range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Build bool query: full-text in query context, filters in filter context
+    
+    Filter clauses don't contribute to scoring and are cached by
+    Elasticsearch. An empty or "*" query matches all documents instead of
+    fuzzy-matching the literal string.
+    
+    Args:
+        query: Search text
+        filters: Term filters (see build_filter_clauses)
+        range_filters: Range filters (see build_filter_clauses)
+    
+    Returns:
+        Query DSL
+    """
+    text = (query or "").strip()
+    if text in MATCH_ALL_QUERIES:
+        must = {"match_all": {}}
+    else:
+        must = {
+            "multi_match": {
+                "query": text,
+                "fields": SEARCH_FIELDS,
+                "fuzziness": "AUTO",
+            }
+        }
+    
+    bool_query: Dict[str, Any] = {"must": [must]}
+    clauses = build_filter_clauses(filters, range_filters)
+    if clauses:
+        bool_query["filter"] = clauses
+    return {"bool": bool_query}
+
+
+def build_search_body(
+    query: Optional[str],
+    filters: Optional[Dict[str, Any]] = None,
+    range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+    size: int = 20,
+    from_: int = 0,
+    view: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build search request body (shared by the sync and async clients)"""
+    return {
+        "query": build_query(query, filters, range_filters),
+        "size": size,
+        "from": from_,
+        **view_options(view),
+    }
+
+
+def build_cursor_search_body(
+    query: Optional[str],
+    pit_id: str,
+    keep_alive: str,
+    sort: List[Dict[str, Any]],
+    filters: Optional[Dict[str, Any]] = None,
+    range_filters: Optional[Dict[str, Dict[str, Any]]] = None,
+    size: int = 20,
+    search_after: Optional[List[Any]] = None,
+    source: Optional[Dict[str, List[str]]] = None,
+    view: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build point-in-time search body for search_after pagination
+    
+    The index comes from the PIT, so the request must not name one.
+    `source` is a `_source` filter ({"includes": [...], "excludes": [...]})
+    and overrides the one of `view`.
+    """
+    body = {
+        "query": build_query(query, filters, range_filters),
+        "size": size,
+        "sort": sort,
+        "pit": {"id": pit_id, "keep_alive": keep_alive},
+        **view_options(view),
+    }
+    if search_after:
+        body["search_after"] = search_after
+    if source is not None:
+        body["_source"] = source
+    return body
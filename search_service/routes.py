@@ -1,13 +1,16 @@
 """FastAPI routes for search service"""
 
 from typing import List, Optional
-from fastapi import APIRouter, Query, Depends
+from celery.result import AsyncResult
+from fastapi import APIRouter, Query, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
-from factory_parsers.shared.database import get_db
-from factory_parsers.search_service.searcher import TenderSearcher
-from factory_parsers.search_service.indexer import TenderIndexer
+from shared.database import get_db
+from .searcher import AsyncTenderSearcher
+from .indexer import TenderIndexer
+from .tasks import reindex_all_tenders
+from scheduler_service.celery_app import celery_app
 
 router = APIRouter(prefix="/search", tags=["search"])
 
@@ -22,54 +25,60 @@ class SearchRequest(BaseModel):
     budget_max: Optional[float] = None
     size: int = 20
     page: int = 1
+    cursor: Optional[str] = None  # "*" starts cursor pagination; then pass next_cursor
 
 
 class SearchResult(BaseModel):
     total: int
     items: list
     query_time_ms: int
+    next_cursor: Optional[str] = None
 
 
 @router.post("/query", response_model=SearchResult)
-def search_tenders(request: SearchRequest):
+async def search_tenders(request: SearchRequest):
     """Search tenders"""
-    searcher = TenderSearcher()
+    searcher = AsyncTenderSearcher()
     from_offset = (request.page - 1) * request.size
     
-    return searcher.search(
-        query=request.query,
-        platform=request.platform,
-        category=request.category,
-        customer=request.customer,
-        status=request.status,
-        budget_min=request.budget_min,
-        budget_max=request.budget_max,
-        size=request.size,
-        from_=from_offset,
-    )
+    try:
+        return await searcher.search(
+            query=request.query,
+            platform=request.platform,
+            category=request.category,
+            customer=request.customer,
+            status=request.status,
+            budget_min=request.budget_min,
+            budget_max=request.budget_max,
+            size=request.size,
+            from_=from_offset,
+            cursor=request.cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/by-customer/{customer}", response_model=SearchResult)
-def search_by_customer(customer: str, size: int = Query(50, le=100)):
+async def search_by_customer(customer: str, size: int = Query(50, le=100)):
     """Search tenders by customer"""
-    searcher = TenderSearcher()
-    items = searcher.search_by_customer(customer, size=size)
+    searcher = AsyncTenderSearcher()
+    items = await searcher.search_by_customer(customer, size=size)
     return {"total": len(items), "items": items, "query_time_ms": 0}
 
 
 @router.get("/by-category/{category}", response_model=SearchResult)
-def search_by_category(category: str, size: int = Query(50, le=100)):
+async def search_by_category(category: str, size: int = Query(50, le=100)):
     """Search tenders by category"""
-    searcher = TenderSearcher()
-    items = searcher.search_by_category(category, size=size)
+    searcher = AsyncTenderSearcher()
+    items = await searcher.search_by_category(category, size=size)
     return {"total": len(items), "items": items, "query_time_ms": 0}
 
 
 @router.get("/trending", response_model=SearchResult)
-def get_trending(days: int = Query(7, ge=1, le=90), size: int = Query(20, le=100)):
+async def get_trending(days: int = Query(7, ge=1, le=90), size: int = Query(20, le=100)):
     """Get trending tenders"""
-    searcher = TenderSearcher()
-    items = searcher.get_trending(days=days, size=size)
+    searcher = AsyncTenderSearcher()
+    items = await searcher.get_trending(days=days, size=size)
     return {"total": len(items), "items": items, "query_time_ms": 0}
 
 
@@ -89,17 +98,31 @@ def index_all_tenders(platform: Optional[str] = None, db: Session = Depends(get_
     return {"status": "success", "indexed_count": count}
 
 
-@router.post("/reindex")
-def reindex_all(db: Session = Depends(get_db)):
-    """Reindex all tenders"""
+@router.post("/index-changes")
+def index_changed(db: Session = Depends(get_db)):
+    """Index only tenders changed since the last incremental run"""
     indexer = TenderIndexer(db)
-    count = indexer.reindex_all()
-    return {"status": "success", "indexed_count": count}
+    return indexer.index_changes()
+
+
+@router.post("/reindex")
+def reindex_all(chunk_size: int = Query(500, ge=50, le=5000)):
+    """Start zero-downtime reindex of all tenders"""
+    task = reindex_all_tenders.delay(chunk_size=chunk_size)
+    return {"status": "queued", "task_id": task.id}
+
+
+@router.get("/reindex/{task_id}")
+def reindex_status(task_id: str):
+    """Get reindex progress"""
+    result = AsyncResult(task_id, app=celery_app)
+    info = result.info if isinstance(result.info, dict) else {}
+    return {"task_id": task_id, "state": result.state, **info}
 
 
 @router.get("/stats")
-def get_search_stats():
+async def get_search_stats():
     """Get search engine statistics"""
-    searcher = TenderSearcher()
-    stats = searcher.es_client.get_stats()
+    searcher = AsyncTenderSearcher()
+    stats = await searcher.es_client.get_stats()
     return stats
@@ -1,10 +1,54 @@
 """Tender searcher using Elasticsearch"""
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta
 
-from factory_parsers.shared.logger import logger
-from factory_parsers.search_service.elasticsearch_client import ElasticsearchClient
+from shared.config import get_settings
+from shared.logger import logger
+from .elasticsearch_client import AsyncElasticsearchClient, ElasticsearchClient
+from .cursor import decode_cursor, encode_cursor
+from .query_builder import LIST_VIEW
+
+settings = get_settings()
+
+
+def _build_filters(
+    platform: Optional[str] = None,
+    category: Optional[str] = None,
+    customer: Optional[str] = None,
+    status: Optional[str] = None,
+    budget_min: Optional[float] = None,
+    budget_max: Optional[float] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Build term and range filters from search parameters"""
+    filters = {
+        'platform': platform,
+        'category': category,
+        'customer': customer,
+        'status': status,
+    }
+    range_filters = {
+        'budget': {'gte': budget_min, 'lte': budget_max},
+        'end_date': {'gte': start_date, 'lte': end_date},
+    }
+    # None values are dropped by the query builder; 0 is a valid budget bound
+    return filters, range_filters
+
+
+def _next_cursor(es_results: Dict[str, Any], pit_id: str, size: int) -> Optional[str]:
+    """Cursor for the page after this one, None when results are exhausted"""
+    hits = es_results.get('hits', {}).get('hits', [])
+    if len(hits) < size or not hits:
+        return None
+    # ES may return a refreshed PIT id; always continue with the latest one
+    return encode_cursor(es_results.get('pit_id', pit_id), hits[-1]['sort'])
+
+
+def _trending_range(days: int) -> Tuple[str, str]:
+    end_date = datetime.utcnow()
+    return (end_date - timedelta(days=days)).isoformat(), end_date.isoformat()
 
 
 class TenderSearcher:
@@ -26,6 +70,8 @@ class TenderSearcher:
         end_date: Optional[str] = None,
         size: int = 20,
         from_: int = 0,
+        cursor: Optional[str] = None,
+        view: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Search tenders with filters
         
@@ -40,53 +86,101 @@ class TenderSearcher:
             start_date: Filter start date (ISO format)
             end_date: Filter end date (ISO format)
             size: Results per page
-            from_: Pagination offset
+            from_: Pagination offset (page-number mode)
+            cursor: "*" to start cursor mode, or `next_cursor` of the previous
+                page; uses point-in-time + search_after and ignores from_
+            view: Result view ("list", "detail", "export"); None returns the
+                full `_source` including extracted_text
         
         Returns:
-            Search results
+            Search results; `next_cursor` is set in cursor mode while more
+            results remain, items carry `highlight` fragments in views that
+            request them
+        
+        Raises:
+            ValueError: Invalid or expired cursor, or unknown view
         """
         logger.info(f"Searching: {query}")
         
-        # Build filters
-        filters = {}
-        if platform:
-            filters['platform'] = platform
-        if category:
-            filters['category'] = category
-        if customer:
-            filters['customer'] = customer
-        if status:
-            filters['status'] = status
-        
-        # Build range filters
-        range_filters = {}
-        if budget_min or budget_max:
-            budget_filter = {}
-            if budget_min:
-                budget_filter['gte'] = budget_min
-            if budget_max:
-                budget_filter['lte'] = budget_max
-            range_filters['budget'] = budget_filter
-        
-        if start_date or end_date:
-            date_filter = {}
-            if start_date:
-                date_filter['gte'] = start_date
-            if end_date:
-                date_filter['lte'] = end_date
-            range_filters['end_date'] = date_filter
+        filters, range_filters = _build_filters(
+            platform, category, customer, status, budget_min, budget_max, start_date, end_date
+        )
+        
+        if cursor is not None:
+            pit_id, search_after = decode_cursor(cursor)
+            pit_id = pit_id or self.es_client.open_point_in_time()
+            results = self.es_client.search_after(
+                query, pit_id, filters, range_filters, size, search_after, view=view
+            )
+            parsed = self._parse_results(results)
+            parsed['next_cursor'] = _next_cursor(results, pit_id, size)
+            if parsed['next_cursor'] is None:
+                self.es_client.close_point_in_time(results.get('pit_id', pit_id))
+            return parsed
         
         # Execute search
         results = self.es_client.search(
             query=query,
             filters=filters,
+            range_filters=range_filters,
             size=size,
             from_=from_,
+            view=view,
         )
         
         # Parse results
         return self._parse_results(results)
     
+    def iter_export(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        category: Optional[str] = None,
+        customer: Optional[str] = None,
+        status: Optional[str] = None,
+        budget_min: Optional[float] = None,
+        budget_max: Optional[float] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        source: Optional[Dict[str, List[str]]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Walk all matches with point-in-time + search_after
+        
+        Memory is bounded by one batch; the point-in-time is closed when the
+        generator finishes or is closed early.
+        
+        Args:
+            query: Search query
+            platform..end_date: Filters (see search)
+            source: `_source` filter {"includes": [...], "excludes": [...]}
+            batch_size: Hits per request
+        
+        Yields:
+            Lists of `_source` documents, one list per batch
+        """
+        filters, range_filters = _build_filters(
+            platform, category, customer, status, budget_min, budget_max, start_date, end_date
+        )
+        batch_size = batch_size or settings.search_export_batch_size
+        
+        pit_id = self.es_client.open_point_in_time()
+        search_after = None
+        try:
+            while True:
+                results = self.es_client.search_after(
+                    query, pit_id, filters, range_filters, batch_size, search_after, source
+                )
+                pit_id = results.get('pit_id', pit_id)
+                hits = results.get('hits', {}).get('hits', [])
+                if hits:
+                    yield [hit.get('_source', {}) for hit in hits]
+                if len(hits) < batch_size:
+                    return
+                search_after = hits[-1]['sort']
+        finally:
+            self.es_client.close_point_in_time(pit_id)
+    
     def search_by_customer(self, customer: str, size: int = 50) -> List[Dict[str, Any]]:
         """Search all tenders for customer
         
@@ -102,6 +196,7 @@ class TenderSearcher:
             query="*",
             customer=customer,
             size=size,
+            view=LIST_VIEW,
         )
         return results['items']
     
@@ -120,6 +215,7 @@ class TenderSearcher:
             query="*",
             category=category,
             size=size,
+            view=LIST_VIEW,
         )
         return results['items']
     
@@ -135,20 +231,18 @@ class TenderSearcher:
         """
         logger.info(f"Fetching trending tenders from last {days} days")
         
-        # Calculate date range
-        from datetime import timedelta
-        end_date = datetime.utcnow().isoformat()
-        start_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        
+        start_date, end_date = _trending_range(days)
         results = self.search(
             query="*",
             start_date=start_date,
             end_date=end_date,
             size=size,
+            view=LIST_VIEW,
         )
         return results['items']
     
-    def _parse_results(self, es_results: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_results(es_results: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Elasticsearch results
         
         Args:
@@ -167,9 +261,11 @@ class TenderSearcher:
         
         items = []
         for hit in hits.get('hits', []):
-            item = hit['_source']
+            item = hit.get('_source', {})
             item['_id'] = hit['_id']
             item['_score'] = hit['_score']
+            if 'highlight' in hit:
+                item['highlight'] = hit['highlight']
             items.append(item)
         
         return {
@@ -177,3 +273,111 @@ class TenderSearcher:
             'items': items,
             'query_time_ms': es_results.get('took', 0),
         }
+
+
+class AsyncTenderSearcher:
+    """Search tenders without blocking the event loop (async route handlers)"""
+    
+    def __init__(self):
+        self.es_client = AsyncElasticsearchClient()
+    
+    async def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        category: Optional[str] = None,
+        customer: Optional[str] = None,
+        status: Optional[str] = None,
+        budget_min: Optional[float] = None,
+        budget_max: Optional[float] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        size: int = 20,
+        from_: int = 0,
+        cursor: Optional[str] = None,
+        view: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Search tenders with filters (see TenderSearcher.search)"""
+        logger.info(f"Searching: {query}")
+        
+        filters, range_filters = _build_filters(
+            platform, category, customer, status, budget_min, budget_max, start_date, end_date
+        )
+        
+        if cursor is not None:
+            pit_id, search_after = decode_cursor(cursor)
+            pit_id = pit_id or await self.es_client.open_point_in_time()
+            results = await self.es_client.search_after(
+                query, pit_id, filters, range_filters, size, search_after, view=view
+            )
+            parsed = TenderSearcher._parse_results(results)
+            parsed['next_cursor'] = _next_cursor(results, pit_id, size)
+            if parsed['next_cursor'] is None:
+                await self.es_client.close_point_in_time(results.get('pit_id', pit_id))
+            return parsed
+        
+        results = await self.es_client.search(
+            query=query,
+            filters=filters,
+            range_filters=range_filters,
+            size=size,
+            from_=from_,
+            view=view,
+        )
+        return TenderSearcher._parse_results(results)
+    
+    async def iter_export(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        category: Optional[str] = None,
+        customer: Optional[str] = None,
+        status: Optional[str] = None,
+        budget_min: Optional[float] = None,
+        budget_max: Optional[float] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        source: Optional[Dict[str, List[str]]] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Walk all matches with point-in-time + search_after (see TenderSearcher.iter_export)"""
+        filters, range_filters = _build_filters(
+            platform, category, customer, status, budget_min, budget_max, start_date, end_date
+        )
+        batch_size = batch_size or settings.search_export_batch_size
+        
+        pit_id = await self.es_client.open_point_in_time()
+        search_after = None
+        try:
+            while True:
+                results = await self.es_client.search_after(
+                    query, pit_id, filters, range_filters, batch_size, search_after, source
+                )
+                pit_id = results.get('pit_id', pit_id)
+                hits = results.get('hits', {}).get('hits', [])
+                if hits:
+                    yield [hit.get('_source', {}) for hit in hits]
+                if len(hits) < batch_size:
+                    return
+                search_after = hits[-1]['sort']
+        finally:
+            await self.es_client.close_point_in_time(pit_id)
+    
+    async def search_by_customer(self, customer: str, size: int = 50) -> List[Dict[str, Any]]:
+        """Search all tenders for customer"""
+        logger.info(f"Searching tenders by customer: {customer}")
+        results = await self.search(query="*", customer=customer, size=size, view=LIST_VIEW)
+        return results['items']
+    
+    async def search_by_category(self, category: str, size: int = 50) -> List[Dict[str, Any]]:
+        """Search all tenders in category"""
+        logger.info(f"Searching tenders by category: {category}")
+        results = await self.search(query="*", category=category, size=size, view=LIST_VIEW)
+        return results['items']
+    
+    async def get_trending(self, days: int = 7, size: int = 20) -> List[Dict[str, Any]]:
+        """Get trending tenders"""
+        logger.info(f"Fetching trending tenders from last {days} days")
+        start_date, end_date = _trending_range(days)
+        results = await self.search(query="*", start_date=start_date, end_date=end_date, size=size, view=LIST_VIEW)
+        return results['items']
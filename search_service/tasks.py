@@ -1,9 +1,9 @@
 """Celery tasks for search service"""
 
-from factory_parsers.scheduler_service.celery_app import task
-from factory_parsers.shared.database import SessionLocal
-from factory_parsers.shared.logger import logger
-from factory_parsers.search_service.indexer import TenderIndexer
+from scheduler_service.celery_app import task
+from shared.database import SessionLocal
+from shared.logger import logger
+from .indexer import TenderIndexer
 
 
 @task(name="index_tender")
@@ -52,9 +52,37 @@ def bulk_index_tenders(platform: str = None) -> dict:
         db.close()
 
 
-@task(name="reindex_all_tenders")
-def reindex_all_tenders() -> dict:
-    """Reindex all tenders
+@task(name="index_changed_tenders")
+def index_changed_tenders(chunk_size: int = 500) -> dict:
+    """Index tenders changed since the last run (Celery Beat)
+    
+    Args:
+        chunk_size: Rows / documents per round-trip
+    
+    Returns:
+        Incremental indexing result
+    """
+    db = SessionLocal()
+    try:
+        indexer = TenderIndexer(db)
+        return indexer.index_changes(chunk_size=chunk_size)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Incremental indexing failed: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+
+@task(name="reindex_all_tenders", bind=True)
+def reindex_all_tenders(self, chunk_size: int = 500) -> dict:
+    """Reindex all tenders into a new versioned index and flip the alias
+    
+    Progress is published as task state PROGRESS with
+    {indexed, failed, total, docs_per_sec}.
+    
+    Args:
+        chunk_size: Rows / documents per round-trip
     
     Returns:
         Reindexing result
@@ -63,7 +91,10 @@ def reindex_all_tenders() -> dict:
     try:
         logger.info("Starting full reindex")
         indexer = TenderIndexer(db)
-        count = indexer.reindex_all()
+        count = indexer.reindex_all(
+            chunk_size=chunk_size,
+            progress=lambda stats: self.update_state(state="PROGRESS", meta=stats),
+        )
         return {"status": "success", "indexed_count": count}
     except Exception as e:
         logger.error(f"Reindexing failed: {str(e)}")
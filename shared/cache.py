@@ -1,18 +1,52 @@
 """Caching layer for Tender Sniper"""
 
-from typing import Any, Optional
-from redis import Redis
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+from redis import BlockingConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool, Redis as AsyncRedis
 
-from factory_parsers.shared.config import get_settings
+from .config import get_settings
+from .serializers import Codec, get_codec
+
+
+@lru_cache()
+def get_redis() -> Redis:
+    """Get process-wide Redis client; all namespaces share its connection pool
+
+    Callers wait up to `redis_pool_timeout` for a free connection instead of
+    failing once `redis_max_connections` are in use. The pool reconnects
+    after a fork (Celery prefork workers).
+    """
+    settings = get_settings()
+    pool = BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+    )
+    return Redis(connection_pool=pool)
+
+
+def _decode_many(codec: Codec, keys: List[str], values: List[Optional[bytes]]) -> Dict[str, Any]:
+    """Pair MGET results with keys, skipping misses and undecodable values"""
+    result = {}
+    for key, data in zip(keys, values):
+        if not data:
+            continue
+        try:
+            result[key] = codec.loads(data)
+        except Exception:
+            continue
+    return result
 
 
 class Cache:
-    """Simple Redis-based cache"""
+    """Simple Redis-based cache (value encoding per namespace, see serializers.get_codec)"""
 
     def __init__(self, namespace: str = "tender-sniper"):
-        settings = get_settings()
-        self.redis = Redis.from_url(settings.redis_url)
+        self.redis = get_redis()
         self.namespace = namespace
+        self.codec = get_codec(namespace)
 
     def _key(self, key: str) -> str:
         return f"{self.namespace}:{key}"
@@ -22,14 +56,98 @@ class Cache:
         if not data:
             return None
         try:
-            import json
-            return json.loads(data)
+            return self.codec.loads(data)
         except Exception:
             return None
 
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        import json
-        self.redis.setex(self._key(key), ttl, json.dumps(value))
+        self.redis.setex(self._key(key), ttl, self.codec.dumps(value))
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several keys in one round-trip (MGET)
+
+        Returns:
+            {key: value} for keys that are cached
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        return _decode_many(self.codec, keys, self.redis.mget([self._key(key) for key in keys]))
+
+    def set_many(self, items: Dict[str, Any], ttl: int = 300) -> None:
+        """Set several keys in one round-trip (pipeline)"""
+        if not items:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.setex(self._key(key), ttl, self.codec.dumps(value))
+        pipe.execute()
 
     def invalidate(self, key: str) -> None:
         self.redis.delete(self._key(key))
+
+
+@lru_cache()
+def get_async_redis() -> AsyncRedis:
+    """Get process-wide asyncio Redis client (bound to the serving event loop)"""
+    settings = get_settings()
+    pool = AsyncBlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+    )
+    return AsyncRedis(connection_pool=pool)
+
+
+async def close_async_redis() -> None:
+    """Close the asyncio Redis connection pool (application shutdown)"""
+    if get_async_redis.cache_info().currsize:
+        client = get_async_redis()
+        await client.close()
+        await client.connection_pool.disconnect()
+        get_async_redis.cache_clear()
+
+
+class AsyncCache:
+    """Redis-based cache for async handlers (same keys and format as Cache)"""
+
+    def __init__(self, namespace: str = "tender-sniper"):
+        self.redis = get_async_redis()
+        self.namespace = namespace
+        self.codec = get_codec(namespace)
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self.redis.get(self._key(key))
+        if not data:
+            return None
+        try:
+            return self.codec.loads(data)
+        except Exception:
+            return None
+
+    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        await self.redis.setex(self._key(key), ttl, self.codec.dumps(value))
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several keys in one round-trip (see Cache.get_many)"""
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = await self.redis.mget([self._key(key) for key in keys])
+        return _decode_many(self.codec, keys, values)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int = 300) -> None:
+        """Set several keys in one round-trip (pipeline)"""
+        if not items:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.setex(self._key(key), ttl, self.codec.dumps(value))
+        await pipe.execute()
+
+    async def invalidate(self, key: str) -> None:
+        await self.redis.delete(self._key(key))
@@ -3,6 +3,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Dict
 from pydantic_settings import BaseSettings
 
 # Получаем путь к базовой директории (backend)
@@ -25,11 +26,72 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 50  # Per-process pool shared by all caches
+    redis_pool_timeout: float = 5.0  # Seconds to wait for a free pooled connection
+    redis_health_check_interval: int = 30  # Ping idle connections before reuse after this many seconds
+    config_cache_ttl: int = 300  # Fallback expiry of cached platforms/rules/mappings, seconds
+    config_cache_channel: str = "tender-sniper:config-invalidate"  # Pub/sub channel for invalidations
+    cache_codec: str = "json"  # Default "serializer[+compression]": json/orjson/msgpack, zlib/zstd/lz4
+    cache_codecs: Dict[str, str] = {"search": "json+zlib"}  # Per-namespace codec overrides
+    cache_compression_threshold: int = 1024  # Compress encoded values from this many bytes
+    cache_local_max_entries: int = 1000  # In-process tier size per tiered cache namespace
+    cache_local_ttl: float = 5.0  # In-process tier lifetime; bounds cross-process staleness, seconds
+    cache_early_refresh_beta: float = 1.0  # XFetch early refresh eagerness, 0 = disabled
+    cache_recompute_lock_timeout: float = 10.0  # Cross-process recompute lock expiry, seconds
+    cache_recompute_wait: float = 2.0  # How long other processes wait for the lock holder's value
+    cache_invalidate_settle_seconds: float = 2.0  # Repeat invalidations after this, past in-flight loads
+    search_cache_ttl: int = 1800  # Seconds a cached search page is fresh; writes invalidate it via index generations
+    search_cache_stale_ttl: int = 300  # ...then served stale while one caller refreshes it
+    detail_cache_ttl: int = 600  # Tender detail pages; invalidated by repository writes
+    index_generation_prefix: str = "tender-sniper:index-generation"  # Redis keys of generation counters
+    index_generation_local_ttl: float = 1.0  # Seconds a process reuses generations read from Redis
+    index_generation_settle_seconds: float = 2.0  # Repeat bumps after this, once ES refreshed the writes
 
     # Celery
     celery_broker_url: str = "redis://localhost:6379/1"
     celery_result_backend: str = "redis://localhost:6379/2"
 
+    # Elasticsearch
+    elasticsearch_url: str = "http://localhost:9200"  # Comma-separated for several nodes
+    es_connections_per_node: int = 25  # Keep-alive HTTP connection pool size per node
+    es_request_timeout: float = 10.0
+    es_max_retries: int = 3
+    es_sniff: bool = False  # Discover cluster nodes on start and on node failure
+    es_sniff_interval: float = 60.0  # Minimum seconds between sniffs
+    search_cursor_keep_alive: str = "2m"  # Point-in-time lifetime between cursor pages
+    search_export_batch_size: int = 1000  # Hits fetched per point-in-time page when exporting
+    es_refresh_interval: str = "1s"  # Restored after bulk loads
+    es_bulk_max_docs: int = 500  # Flush indexing buffer at this many documents
+    es_bulk_flush_seconds: float = 5.0  # ...or when the oldest buffered document is this old
+    es_bulk_load_min_docs: int = 1000  # Batches this large disable index refresh while loading
+    incremental_index_interval_seconds: float = 10.0  # Celery Beat period of the change-driven indexer
+    incremental_index_overlap_seconds: int = 5  # Re-scan window for rows committed out of updated_at order
+
+    # Normalizer
+    near_duplicate_threshold: float = 0.8  # Estimated Jaccard similarity
+    near_duplicate_window_days: int = 90  # Signatures kept in the in-memory LSH index
+    near_duplicate_sync_seconds: int = 30  # How often to pick up signatures from other workers
+    near_duplicate_sync_overlap_seconds: int = 300  # Re-read window for late commits; longer than any store transaction
+    field_mapping_plan_ttl: int = 60  # Seconds before a compiled mapping plan is reloaded from the DB
+
+    # Attachment extraction
+    attachment_max_bytes: int = 50 * 1024 * 1024  # Download size cap per file
+    attachment_download_workers: int = 8  # Parallel downloads (HTTP pool size)
+    attachment_download_timeout: int = 30  # Connect/read timeout, seconds
+    attachment_parse_workers: int = 0  # Parser processes, 0 = CPU count
+    attachment_parse_timeout: int = 120  # Per-file parse timeout, seconds
+    attachment_parse_tasks_per_child: int = 50  # Recycle parser processes to cap RSS growth
+    attachment_max_chars: int = 0  # Stop extracting a file after this many chars, 0 = no limit
+    attachment_max_pages: int = 0  # Stop extracting a PDF after this many pages, 0 = no limit
+    attachment_max_rows_per_sheet: int = 0  # Stop reading an XLSX sheet after this many rows, 0 = no limit
+    archive_max_members: int = 200  # Archives listing more members are rejected
+    archive_max_total_bytes: int = 500 * 1024 * 1024  # Total unpacked size per archive
+    archive_max_member_bytes: int = 100 * 1024 * 1024  # Unpacked size per member
+    archive_max_compression_ratio: int = 100  # Higher ratios are treated as zip bombs
+    extraction_cache_enabled: bool = True
+    extraction_cache_dir: str = ""  # Empty = <system temp>/tender-extraction-cache
+    extraction_cache_max_bytes: int = 2 * 1024 * 1024 * 1024  # Oldest entries evicted above this
+
     # AI
     openai_api_key: str = ""
     llm_model: str = "gpt-4"
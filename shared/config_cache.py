@@ -0,0 +1,160 @@
+"""Process-wide cache of DB-backed configuration with Redis pub/sub invalidation"""
+
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from redis import Redis
+
+from .cache import get_redis
+from .config import get_settings
+from .logger import logger
+from .metrics import config_cache_requests_total
+
+# Namespaces of cached admin configuration
+PLATFORMS = "platform"
+SEARCH_RULES = "search_rule"
+FIELD_MAPPINGS = "field_mapping"
+
+_MISSING = object()
+
+
+class ConfigCache:
+    """In-memory cache of configuration rows shared by the whole process
+
+    Entries are keyed by (namespace, key) and expire after `ttl` seconds as a
+    fallback. Writers call `invalidate(namespace)`, which drops the namespace
+    locally and publishes on a Redis channel; every process listening on the
+    channel drops it too and notifies its listeners. While the subscriber is
+    disconnected, entries still expire by TTL and the whole cache is dropped
+    on reconnect, since messages may have been missed.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: Optional[int] = None, channel: Optional[str] = None):
+        settings = get_settings()
+        self.redis_url = redis_url
+        self.ttl = ttl or settings.config_cache_ttl
+        self.channel = channel or settings.config_cache_channel
+
+        self._entries: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._generations: Dict[Optional[str], int] = {}
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+        self._subscriber: Optional[threading.Thread] = None
+        self._subscriber_pid: Optional[int] = None
+        self._redis: Optional[Redis] = None
+
+    def get_or_load(self, namespace: str, key: str, loader: Callable[[], Any]) -> Any:
+        """Get cached value or load and cache it
+
+        Args:
+            namespace: Config namespace (invalidation unit)
+            key: Key within namespace
+            loader: Called on miss; its result is cached, including None
+
+        Returns:
+            Cached or loaded value
+        """
+        self._ensure_subscriber()
+        now = time.monotonic()
+        with self._lock:
+            expires_at, value = self._entries.get((namespace, key), (0.0, _MISSING))
+            generation = self._generation(namespace)
+        if value is not _MISSING and expires_at > now:
+            config_cache_requests_total.labels(namespace=namespace, result="hit").inc()
+            return value
+
+        config_cache_requests_total.labels(namespace=namespace, result="miss").inc()
+        value = loader()
+        with self._lock:
+            # Don't store a value loaded before a concurrent invalidation
+            if self._generation(namespace) == generation:
+                self._entries[(namespace, key)] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, namespace: Optional[str] = None, publish: bool = True) -> None:
+        """Drop a namespace (or everything) here and, by default, in all processes
+
+        Args:
+            namespace: Namespace to drop, None for all
+            publish: Broadcast to other processes
+        """
+        self._drop(namespace)
+        if not publish:
+            return
+        try:
+            self._get_redis().publish(self.channel, json.dumps({"namespace": namespace}))
+        except Exception as e:
+            logger.warning(f"Config cache invalidation not published, other processes rely on TTL: {str(e)}")
+
+    def add_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """Call listener(namespace) whenever a namespace is invalidated (None = all)"""
+        with self._lock:
+            self._listeners.append(listener)
+        self._ensure_subscriber()
+
+    def _generation(self, namespace: str) -> Tuple[int, int]:
+        return self._generations.get(None, 0), self._generations.get(namespace, 0)
+
+    def _drop(self, namespace: Optional[str]) -> None:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            if namespace is None:
+                self._entries.clear()
+            else:
+                for entry_key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[entry_key]
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(namespace)
+            except Exception as e:
+                logger.error(f"Config cache listener failed: {str(e)}")
+
+    def _get_redis(self) -> Redis:
+        if self._redis is None:
+            self._redis = Redis.from_url(self.redis_url) if self.redis_url else get_redis()
+        return self._redis
+
+    def _ensure_subscriber(self) -> None:
+        # Threads don't survive a fork (Celery prefork workers): start one per process
+        pid = os.getpid()
+        if self._subscriber_pid == pid:
+            return
+        with self._lock:
+            if self._subscriber_pid != pid:
+                self._subscriber = threading.Thread(target=self._listen, name="config-cache-subscriber", daemon=True)
+                self._subscriber.start()
+                self._subscriber_pid = pid
+
+    def _listen(self) -> None:
+        """Apply invalidations published by other processes (runs forever)"""
+        backoff = 1
+        while True:
+            try:
+                pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self._drop(None)  # Anything could have changed while disconnected
+                backoff = 1
+                for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        namespace = json.loads(message["data"]).get("namespace")
+                    except (ValueError, AttributeError):
+                        namespace = None
+                    self._drop(namespace)
+            except Exception as e:
+                logger.warning(f"Config cache subscriber disconnected, retrying in {backoff}s: {str(e)}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+
+
+@lru_cache()
+def get_config_cache() -> ConfigCache:
+    """Get process-wide config cache"""
+    return ConfigCache()
@@ -0,0 +1,172 @@
+"""Search index generation counters for cache invalidation"""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from redis import Redis
+
+from .cache import get_async_redis, get_redis
+from .config import get_settings
+from .logger import logger
+
+# Bumped on deletions, reindexes and other writes whose partitions are unknown
+EPOCH = "epoch"
+# Bumped on every write; covers searches without a partition filter
+ALL = "all"
+
+
+class _IndexGenerationsBase:
+    """Key layout and local read cache shared by the sync and async variants
+
+    Redis keys (under `index_generation_prefix`):
+        epoch                 every search key
+        all                   searches without platform/category filter
+        platform:<id>         searches filtered by platform
+        category:<name>       searches filtered by category
+
+    A search cache key includes the generations of the slices it reads, so
+    writes to other platforms/categories don't invalidate it.
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.prefix = settings.index_generation_prefix
+        self.local_ttl = settings.index_generation_local_ttl
+        self._local: Dict[Tuple[str, ...], Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def _keys(self, platform: Optional[str], category: Optional[str]) -> Tuple[str, ...]:
+        keys = [f"{self.prefix}:{EPOCH}"]
+        if platform:
+            keys.append(f"{self.prefix}:platform:{platform}")
+        if category:
+            keys.append(f"{self.prefix}:category:{category}")
+        if not platform and not category:
+            keys.append(f"{self.prefix}:{ALL}")
+        return tuple(keys)
+
+    def _cached(self, keys: Tuple[str, ...]) -> Optional[str]:
+        with self._lock:
+            expires_at, token = self._local.get(keys, (0.0, None))
+        return token if expires_at > time.monotonic() else None
+
+    def _remember(self, keys: Tuple[str, ...], values: List[Optional[bytes]]) -> str:
+        token = ".".join((value or b"0").decode() for value in values)
+        with self._lock:
+            self._local[keys] = (time.monotonic() + self.local_ttl, token)
+        return token
+
+
+class IndexGenerations(_IndexGenerationsBase):
+    """Per-partition generation counters bumped by the indexers
+
+    Elasticsearch makes writes searchable only after a refresh, so a search
+    that runs between the bump and the refresh could cache pre-write
+    results under the new generation. Every bump is therefore repeated
+    `index_generation_settle_seconds` later, once the write is visible.
+    """
+
+    def __init__(self, redis: Optional[Redis] = None):
+        super().__init__()
+        self.redis = redis or get_redis()
+        self.settle_seconds = get_settings().index_generation_settle_seconds
+
+    def current(self, platform: Optional[str] = None, category: Optional[str] = None) -> Optional[str]:
+        """Generation token of the index slice a search reads
+
+        Args:
+            platform: Platform filter of the search
+            category: Category filter of the search
+
+        Returns:
+            Token for the cache key, None if Redis is unavailable (don't cache)
+        """
+        keys = self._keys(platform, category)
+        token = self._cached(keys)
+        if token is not None:
+            return token
+        try:
+            values = self.redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"Index generation unavailable, search cache bypassed: {str(e)}")
+            return None
+        return self._remember(keys, values)
+
+    def bump(self, partitions: Iterable[Tuple[Optional[str], Optional[str]]] = ()) -> None:
+        """Invalidate cached searches over the written partitions
+
+        Args:
+            partitions: (platform, category) of each written document
+        """
+        keys = {f"{self.prefix}:{ALL}"}
+        for platform, category in partitions:
+            if platform:
+                keys.add(f"{self.prefix}:platform:{platform}")
+            if category:
+                keys.add(f"{self.prefix}:category:{category}")
+        self._incr(sorted(keys))
+
+    def bump_written(
+        self,
+        partitions: Iterable[Tuple[Optional[str], Optional[str]]],
+        previous: Optional[Iterable[Tuple[Optional[str], Optional[str]]]],
+    ) -> None:
+        """Invalidate the partitions overwritten documents moved into and out of
+
+        Args:
+            partitions: (platform, category) of each written document
+            previous: (platform, category) the documents had in the index
+                before the write, None if unknown (bumps the epoch)
+        """
+        if previous is None:
+            self.bump_epoch()
+        else:
+            self.bump(set(partitions) | set(previous))
+
+    def bump_epoch(self) -> None:
+        """Invalidate every cached search (deletes, reindex, bulk loads)"""
+        self._incr([f"{self.prefix}:{EPOCH}"])
+
+    def _incr(self, keys: List[str], settle: bool = True) -> None:
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.incr(key)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Index generation bump failed, cached searches expire by TTL: {str(e)}")
+        if settle and self.settle_seconds > 0:
+            timer = threading.Timer(self.settle_seconds, self._incr, args=(keys, False))
+            timer.daemon = True
+            timer.start()
+
+
+class AsyncIndexGenerations(_IndexGenerationsBase):
+    """Generation reads for async handlers (writes stay on IndexGenerations)"""
+
+    async def current(self, platform: Optional[str] = None, category: Optional[str] = None) -> Optional[str]:
+        """Generation token of the index slice a search reads (see IndexGenerations.current)"""
+        keys = self._keys(platform, category)
+        token = self._cached(keys)
+        if token is not None:
+            return token
+        try:
+            values = await get_async_redis().mget(keys)
+        except Exception as e:
+            logger.warning(f"Index generation unavailable, search cache bypassed: {str(e)}")
+            return None
+        return self._remember(keys, values)
+
+
+@lru_cache()
+def get_index_generations() -> IndexGenerations:
+    """Get process-wide index generations"""
+    return IndexGenerations()
+
+
+@lru_cache()
+def get_async_index_generations() -> AsyncIndexGenerations:
+    """Get process-wide async index generation reader"""
+    return AsyncIndexGenerations()
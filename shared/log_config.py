@@ -1,7 +1,7 @@
 """Logging configuration (Sprint 37)"""
 
 import os
-from factory_parsers.shared.logging_service import LoggingService
+from .logging_service import LoggingService
 
 
 def setup_logging():
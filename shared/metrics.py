@@ -42,6 +42,18 @@ normalization_failures_total = Counter(
     ["reason"],
 )
 
+# Attachment extraction cache metrics
+extraction_cache_requests_total = Counter(
+    "ts_extraction_cache_requests_total",
+    "Extraction cache lookups",
+    ["kind", "result"],  # kind: content (SHA-256) / url (ETag, Last-Modified)
+)
+
+extraction_cache_evictions_total = Counter(
+    "ts_extraction_cache_evictions_total",
+    "Extraction cache entries evicted by size limit",
+)
+
 # Queue metrics
 celery_queue_length = Gauge(
     "ts_celery_queue_length",
@@ -55,3 +67,30 @@ celery_task_duration_seconds = Histogram(
     ["task_name"],
     buckets=(0.1, 0.5, 1, 2, 5, 10, 30),
 )
+
+# Config cache metrics
+config_cache_requests_total = Counter(
+    "ts_config_cache_requests_total",
+    "Config cache lookups",
+    ["namespace", "result"],
+)
+
+# Two-tier (in-process LRU + Redis) cache metrics
+tiered_cache_requests_total = Counter(
+    "ts_tiered_cache_requests_total",
+    "Tiered cache lookups",
+    ["namespace", "tier", "result"],  # tier: local / redis; result: hit / stale / miss
+)
+
+tiered_cache_recomputes_total = Counter(
+    "ts_tiered_cache_recomputes_total",
+    "Tiered cache values recomputed",
+    ["namespace", "reason"],  # reason: miss / early (XFetch) / stale
+)
+
+tiered_cache_recompute_seconds = Histogram(
+    "ts_tiered_cache_recompute_seconds",
+    "Tiered cache recompute duration (seconds)",
+    ["namespace"],
+    buckets=(0.01, 0.05, 0.1, 0.2, 0.5, 1, 2, 5),
+)
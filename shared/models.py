@@ -4,7 +4,7 @@ from datetime import datetime
 from sqlalchemy import Column, DateTime, Integer, String, Text, Float, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 
-from shared.database import Base
+from .database import Base
 
 
 class Tender(Base):
@@ -4,7 +4,7 @@ import time
 import functools
 from typing import Any, Callable
 
-from factory_parsers.shared.logger import logger
+from .logger import logger
 
 
 def timer(func: Callable) -> Callable:
@@ -0,0 +1,147 @@
+"""Pluggable serialization and compression for cached values"""
+
+import json
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+from .config import get_settings
+from .logger import logger
+
+# Encoded values start with one header byte: 1SSSSCCC (S = serializer id,
+# C = compression id). ASCII JSON written before codecs existed can never
+# start with a byte >= 0x80, so values without a header are legacy JSON.
+HEADER_FLAG = 0x80
+
+
+def _json_codec() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    return (lambda value: json.dumps(value).encode("utf-8")), json.loads
+
+
+def _orjson_codec() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    import orjson
+    return orjson.dumps, orjson.loads
+
+
+def _msgpack_codec() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    import msgpack
+    return (
+        lambda value: msgpack.packb(value, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False),
+    )
+
+
+def _zlib_codec() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    return (lambda data: zlib.compress(data, 6)), zlib.decompress
+
+
+def _zstd_codec() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    import zstandard
+    compressor = zstandard.ZstdCompressor(level=3)
+    decompressor = zstandard.ZstdDecompressor()
+    return compressor.compress, decompressor.decompress
+
+
+def _lz4_codec() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    import lz4.frame
+    return lz4.frame.compress, lz4.frame.decompress
+
+
+# name: (header id, factory); ids are persisted in Redis, never reuse them
+SERIALIZERS: Dict[str, Tuple[int, Callable]] = {
+    "json": (0, _json_codec),
+    "orjson": (1, _orjson_codec),
+    "msgpack": (2, _msgpack_codec),
+}
+
+COMPRESSIONS: Dict[str, Tuple[int, Callable]] = {
+    "none": (0, None),
+    "zlib": (1, _zlib_codec),
+    "zstd": (2, _zstd_codec),
+    "lz4": (3, _lz4_codec),
+}
+
+
+@lru_cache(maxsize=None)
+def _serializer(name: str) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    return SERIALIZERS[name][1]()
+
+
+@lru_cache(maxsize=None)
+def _compression(name: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    return COMPRESSIONS[name][1]()
+
+
+_SERIALIZER_NAMES = {sid: name for name, (sid, _) in SERIALIZERS.items()}
+_COMPRESSION_NAMES = {cid: name for name, (cid, _) in COMPRESSIONS.items()}
+
+
+class Codec:
+    """Serializer plus optional compression for values above a size threshold
+
+    Every value records how it was encoded in its header byte, so any
+    codec decodes values written with another one (e.g. after a namespace
+    changes serializer) and plain JSON written by older releases.
+    """
+
+    def __init__(self, serializer: str = "json", compression: str = "none", threshold: int = 1024):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        self.serializer = serializer
+        self.compression = compression
+        self.threshold = threshold
+        self._dumps = _serializer(serializer)[0]
+        self._compress = _compression(compression)[0] if compression != "none" else None
+        self._serializer_id = SERIALIZERS[serializer][0]
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode value with header byte"""
+        data = self._dumps(value)
+        compression_id = 0
+        if self._compress is not None and len(data) >= self.threshold:
+            data = self._compress(data)
+            compression_id = COMPRESSIONS[self.compression][0]
+        return bytes((HEADER_FLAG | self._serializer_id << 3 | compression_id,)) + data
+
+    def loads(self, data: bytes) -> Any:
+        """Decode value written by any codec, or legacy header-less JSON"""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if not data or not data[0] & HEADER_FLAG:
+            return json.loads(data)
+
+        header = data[0]
+        serializer = _SERIALIZER_NAMES.get((header >> 3) & 0x0F)
+        compression = _COMPRESSION_NAMES.get(header & 0x07)
+        if serializer is None or compression is None:
+            raise ValueError(f"Unknown cache value header: {header:#x}")
+
+        payload = data[1:]
+        if compression != "none":
+            payload = _compression(compression)[1](payload)
+        return _serializer(serializer)[1](payload)
+
+
+def _parse_spec(spec: str) -> Tuple[str, str]:
+    serializer, _, compression = spec.partition("+")
+    return serializer.strip() or "json", compression.strip() or "none"
+
+
+@lru_cache(maxsize=None)
+def get_codec(namespace: str) -> Codec:
+    """Get codec for cache namespace
+
+    Configured by `cache_codecs` ({namespace: "serializer[+compression]"}),
+    falling back to `cache_codec`. A codec whose optional package is not
+    installed degrades to plain JSON.
+    """
+    settings = get_settings()
+    spec = settings.cache_codecs.get(namespace, settings.cache_codec)
+    serializer, compression = _parse_spec(spec)
+    try:
+        return Codec(serializer, compression, settings.cache_compression_threshold)
+    except ImportError as e:
+        logger.warning(f"Cache codec '{spec}' for namespace {namespace} unavailable, using json: {str(e)}")
+        return Codec()
@@ -0,0 +1,495 @@
+"""Two-tier cache: in-process LRU in front of Redis, with stampede protection"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from redis import Redis
+
+from .cache import get_async_redis, get_redis
+from .config import get_settings
+from .logger import logger
+from .metrics import tiered_cache_recompute_seconds, tiered_cache_recomputes_total, tiered_cache_requests_total
+from .serializers import Codec, get_codec
+
+# Entry states, see _state()
+FRESH = "fresh"
+EARLY = "early"  # Fresh, but picked for probabilistic early refresh
+STALE = "stale"  # Past its TTL, served while one caller revalidates
+EXPIRED = "expired"
+
+_MISSING = object()
+
+# Deletes the recompute lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class CacheEntry:
+    """Cached value with the metadata needed for early and stale refresh"""
+
+    __slots__ = ("value", "delta", "expires_at", "stale_until")
+
+    def __init__(self, value: Any, delta: float, expires_at: float, stale_until: float):
+        self.value = value
+        self.delta = delta  # Seconds the last recompute took
+        self.expires_at = expires_at  # Wall clock, shared across processes
+        self.stale_until = stale_until
+
+    def dumps(self, codec: Codec) -> bytes:
+        return codec.dumps({"v": self.value, "d": self.delta, "e": self.expires_at, "s": self.stale_until})
+
+    @classmethod
+    def loads(cls, data: Any, codec: Codec) -> Optional["CacheEntry"]:
+        try:
+            payload = codec.loads(data)
+            return cls(payload["v"], payload["d"], payload["e"], payload["s"])
+        except Exception:
+            return None  # Corrupt, written by the plain Cache, or codec package missing
+
+
+def _state(entry: CacheEntry, beta: float, now: float) -> str:
+    """Classify entry; XFetch picks fresh entries for early refresh with a
+    probability that rises as expiry nears and with recompute cost"""
+    if now >= entry.stale_until:
+        return EXPIRED
+    if now >= entry.expires_at:
+        return STALE
+    if beta > 0 and entry.delta > 0:
+        if now - entry.delta * beta * math.log(1.0 - random.random()) >= entry.expires_at:
+            return EARLY
+    return FRESH
+
+
+class LocalLRU:
+    """Bounded, thread-safe in-process tier
+
+    Entries live at most `ttl` seconds here regardless of their Redis
+    lifetime, which bounds how stale one process can be after another one
+    refreshed or invalidated a key.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, CacheEntry]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            if cached[0] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return cached[1]
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        local_expires_at = min(time.time() + self.ttl, entry.stale_until)
+        with self._lock:
+            self._entries[key] = (local_expires_at, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+@lru_cache(maxsize=None)
+def _local_tier(namespace: str) -> LocalLRU:
+    """Per-namespace in-process tier, shared by the sync and async caches"""
+    settings = get_settings()
+    return LocalLRU(settings.cache_local_max_entries, settings.cache_local_ttl)
+
+
+@lru_cache()
+def _refresh_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+class _TieredCacheBase:
+    """Entry handling shared by TieredCache and AsyncTieredCache"""
+
+    def __init__(self, namespace: str, ttl: int, stale_ttl: int = 0, early_refresh: bool = True):
+        settings = get_settings()
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.beta = settings.cache_early_refresh_beta if early_refresh else 0.0
+        self.lock_timeout = settings.cache_recompute_lock_timeout
+        self.recompute_wait = settings.cache_recompute_wait
+        self.settle_seconds = settings.cache_invalidate_settle_seconds
+        self.local = _local_tier(namespace)
+        self.codec = get_codec(namespace)
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.namespace}:lock:{key}"
+
+    def _new_entry(self, value: Any, delta: float) -> CacheEntry:
+        now = time.time()
+        return CacheEntry(value, delta, now + self.ttl, now + self.ttl + self.stale_ttl)
+
+    def _record(self, tier: str, result: str) -> None:
+        tiered_cache_requests_total.labels(namespace=self.namespace, tier=tier, result=result).inc()
+
+    def _record_recompute(self, reason: str, seconds: float) -> None:
+        tiered_cache_recomputes_total.labels(namespace=self.namespace, reason=reason).inc()
+        tiered_cache_recompute_seconds.labels(namespace=self.namespace).observe(seconds)
+
+
+class TieredCache(_TieredCacheBase):
+    """Read-through cache: in-process LRU -> Redis -> compute
+
+    - Single-flight: concurrent misses for a key in this process share one
+      recompute; across processes a short Redis lock lets one process
+      recompute while the others wait briefly for its result.
+    - Early refresh (XFetch): shortly before expiry one caller refreshes
+      the entry in the background while everyone keeps getting hits.
+    - Stale-while-revalidate: for `stale_ttl` seconds after expiry the old
+      value is served and refreshed in the background.
+
+    Redis failures degrade to computing directly. With `stale_ttl=0` and
+    `early_refresh=False` compute() only ever runs in the calling thread,
+    for callables that aren't thread-safe (e.g. bound to a DB session).
+
+    Usage:
+        cache = get_tiered_cache("search", ttl=60, stale_ttl=300)
+        results = cache.get_or_compute(key, lambda: searcher.search(...))
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int,
+        stale_ttl: int = 0,
+        early_refresh: bool = True,
+        redis: Optional[Redis] = None,
+    ):
+        super().__init__(namespace, ttl, stale_ttl, early_refresh)
+        self.redis = redis or get_redis()
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Get cached value, computing and caching it on miss
+
+        Args:
+            key: Cache key within namespace
+            compute: Produces the value; must be JSON-serializable
+
+        Returns:
+            Cached, stale or freshly computed value
+        """
+        entry, tier = self._lookup(key)
+        if entry is not None:
+            state = _state(entry, self.beta, time.time())
+            if state != EXPIRED:
+                self._record(tier, "stale" if state == STALE else "hit")
+                if state != FRESH:
+                    self._refresh_in_background(key, compute, state, entry.value)
+                return entry.value
+            self._record(tier, "miss")
+
+        future, leader = self._join_flight(key)
+        if not leader:
+            try:
+                return future.result(timeout=self.lock_timeout)
+            except FutureTimeoutError:
+                return compute()
+        return self._run_flight(key, future, compute, "miss")
+
+    def invalidate(self, key: str, settle: bool = True) -> None:
+        """Drop key here and in Redis (other processes' local tiers expire by local TTL)
+
+        A recompute that read the source before the write may store its
+        result after this call, so the invalidation is repeated
+        `cache_invalidate_settle_seconds` later.
+        """
+        self.invalidate_many([key], settle)
+
+    def invalidate_many(self, keys: Iterable[str], settle: bool = True) -> None:
+        """Invalidate several keys with one Redis round trip and one settle timer"""
+        keys = list(keys)
+        if not keys:
+            return
+        for key in keys:
+            self.local.delete(key)
+        try:
+            self.redis.delete(*(self._key(key) for key in keys))
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for {len(keys)} {self.namespace} keys: {str(e)}")
+        if settle and self.settle_seconds > 0:
+            timer = threading.Timer(self.settle_seconds, self.invalidate_many, args=(keys, False))
+            timer.daemon = True
+            timer.start()
+
+    def _lookup(self, key: str) -> Tuple[Optional[CacheEntry], Optional[str]]:
+        entry = self.local.get(key)
+        if entry is not None:
+            return entry, "local"
+        self._record("local", "miss")
+
+        entry = self._get_remote(key)
+        if entry is not None:
+            self.local.set(key, entry)
+            return entry, "redis"
+        self._record("redis", "miss")
+        return None, None
+
+    def _get_remote(self, key: str) -> Optional[CacheEntry]:
+        try:
+            data = self.redis.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Cache read failed for {self.namespace}:{key}: {str(e)}")
+            return None
+        return CacheEntry.loads(data, self.codec) if data else None
+
+    def _join_flight(self, key: str) -> Tuple[Future, bool]:
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = self._inflight[key] = Future()
+            return future, True
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Any], reason: str, stale: Any) -> None:
+        future, leader = self._join_flight(key)
+        if leader:
+            _refresh_executor().submit(self._run_flight, key, future, compute, reason, stale)
+
+    def _run_flight(self, key: str, future: Future, compute: Callable[[], Any], reason: str, stale: Any = _MISSING) -> Any:
+        try:
+            value = self._recompute(key, compute, reason, stale)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            if stale is _MISSING:
+                raise
+            logger.warning(f"Background refresh of {self.namespace}:{key} failed: {str(e)}")
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _recompute(self, key: str, compute: Callable[[], Any], reason: str, stale: Any) -> Any:
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        if not self._acquire(lock_key, token):
+            # Another process is recomputing: keep serving stale, or wait for its result
+            if stale is not _MISSING:
+                return stale
+            entry = self._wait_for_peer(key)
+            if entry is not None:
+                return entry.value
+
+        try:
+            started = time.time()
+            value = compute()
+            delta = time.time() - started
+            self._record_recompute(reason, delta)
+            self._store(key, self._new_entry(value, delta))
+            return value
+        finally:
+            self._release(lock_key, token)
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self.local.set(key, entry)
+        try:
+            self.redis.set(self._key(key), entry.dumps(self.codec), ex=self.ttl + self.stale_ttl)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {self.namespace}:{key}: {str(e)}")
+
+    def _acquire(self, lock_key: str, token: str) -> bool:
+        try:
+            return bool(self.redis.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)))
+        except Exception:
+            return True  # Redis down: recompute locally
+
+    def _release(self, lock_key: str, token: str) -> None:
+        try:
+            self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception:
+            pass  # Expires by lock timeout
+
+    def _wait_for_peer(self, key: str) -> Optional[CacheEntry]:
+        deadline = time.monotonic() + self.recompute_wait
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            entry = self._get_remote(key)
+            if entry is not None and _state(entry, 0, time.time()) == FRESH:
+                self.local.set(key, entry)
+                return entry
+        return None
+
+
+class AsyncTieredCache(_TieredCacheBase):
+    """TieredCache for async handlers (same keys, entry format and local tier)"""
+
+    def __init__(self, namespace: str, ttl: int, stale_ttl: int = 0, early_refresh: bool = True):
+        super().__init__(namespace, ttl, stale_ttl, early_refresh)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    @property
+    def redis(self):
+        # Looked up per call: the shared client is replaced after close_async_redis()
+        return get_async_redis()
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Get cached value, awaiting compute() and caching it on miss (see TieredCache)"""
+        entry, tier = await self._lookup(key)
+        if entry is not None:
+            state = _state(entry, self.beta, time.time())
+            if state != EXPIRED:
+                self._record(tier, "stale" if state == STALE else "hit")
+                if state != FRESH:
+                    self._refresh_in_background(key, compute, state, entry.value)
+                return entry.value
+            self._record(tier, "miss")
+
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout=self.lock_timeout)
+            except asyncio.TimeoutError:
+                return await compute()
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        return await self._run_flight(key, future, compute, "miss")
+
+    async def invalidate(self, key: str, settle: bool = True) -> None:
+        """Drop key here and in Redis, repeated after the settle delay (see TieredCache)"""
+        self.local.delete(key)
+        try:
+            await self.redis.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for {self.namespace}:{key}: {str(e)}")
+        if settle and self.settle_seconds > 0:
+            asyncio.get_running_loop().call_later(self.settle_seconds, self._settle, key)
+
+    def _settle(self, key: str) -> None:
+        task = asyncio.create_task(self.invalidate(key, settle=False))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _lookup(self, key: str) -> Tuple[Optional[CacheEntry], Optional[str]]:
+        entry = self.local.get(key)
+        if entry is not None:
+            return entry, "local"
+        self._record("local", "miss")
+
+        entry = await self._get_remote(key)
+        if entry is not None:
+            self.local.set(key, entry)
+            return entry, "redis"
+        self._record("redis", "miss")
+        return None, None
+
+    async def _get_remote(self, key: str) -> Optional[CacheEntry]:
+        try:
+            data = await self.redis.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Cache read failed for {self.namespace}:{key}: {str(e)}")
+            return None
+        return CacheEntry.loads(data, self.codec) if data else None
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Awaitable[Any]], reason: str, stale: Any) -> None:
+        if key in self._inflight:
+            return
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(self._run_flight(key, future, compute, reason, stale))
+        self._background.add(task)  # Keep a reference until done
+        task.add_done_callback(self._background.discard)
+
+    async def _run_flight(self, key: str, future: asyncio.Future, compute: Callable[[], Awaitable[Any]], reason: str, stale: Any = _MISSING) -> Any:
+        try:
+            value = await self._recompute(key, compute, reason, stale)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: there may be no waiters
+            if stale is _MISSING:
+                raise
+            logger.warning(f"Background refresh of {self.namespace}:{key} failed: {str(e)}")
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _recompute(self, key: str, compute: Callable[[], Awaitable[Any]], reason: str, stale: Any) -> Any:
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        if not await self._acquire(lock_key, token):
+            if stale is not _MISSING:
+                return stale
+            entry = await self._wait_for_peer(key)
+            if entry is not None:
+                return entry.value
+
+        try:
+            started = time.time()
+            value = await compute()
+            delta = time.time() - started
+            self._record_recompute(reason, delta)
+            await self._store(key, self._new_entry(value, delta))
+            return value
+        finally:
+            await self._release(lock_key, token)
+
+    async def _store(self, key: str, entry: CacheEntry) -> None:
+        self.local.set(key, entry)
+        try:
+            await self.redis.set(self._key(key), entry.dumps(self.codec), ex=self.ttl + self.stale_ttl)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {self.namespace}:{key}: {str(e)}")
+
+    async def _acquire(self, lock_key: str, token: str) -> bool:
+        try:
+            return bool(await self.redis.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)))
+        except Exception:
+            return True
+
+    async def _release(self, lock_key: str, token: str) -> None:
+        try:
+            await self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception:
+            pass
+
+    async def _wait_for_peer(self, key: str) -> Optional[CacheEntry]:
+        deadline = time.monotonic() + self.recompute_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            entry = await self._get_remote(key)
+            if entry is not None and _state(entry, 0, time.time()) == FRESH:
+                self.local.set(key, entry)
+                return entry
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_tiered_cache(namespace: str, ttl: int, stale_ttl: int = 0, early_refresh: bool = True) -> TieredCache:
+    """Get process-wide tiered cache for namespace (one Redis pool per process)"""
+    return TieredCache(namespace, ttl, stale_ttl, early_refresh)
+
+
+@lru_cache(maxsize=None)
+def get_async_tiered_cache(namespace: str, ttl: int, stale_ttl: int = 0, early_refresh: bool = True) -> AsyncTieredCache:
+    """Get process-wide async tiered cache for namespace (uses the shared asyncio Redis)"""
+    return AsyncTieredCache(namespace, ttl, stale_ttl, early_refresh)
@@ -4,7 +4,7 @@ import uuid
 import contextvars
 
 from fastapi import Request
-from factory_parsers.shared.logging_service import LogContext
+from .logging_service import LogContext
 
 # Context variable for trace ID
 trace_id_var = contextvars.ContextVar('trace_id', default=None)
@@ -0,0 +1,119 @@
+"""Tests for search_service.query_builder
+
+The module is loaded from its file: importing the search_service package
+would pull in the Elasticsearch client, and the builder has no dependencies.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_PATH = Path(__file__).resolve().parent.parent / "search_service" / "query_builder.py"
+_spec = importlib.util.spec_from_file_location("query_builder", _PATH)
+qb = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(qb)
+
+SORT = [{"_score": "desc"}, {"tender_id": "asc"}]
+
+
+def test_combined_term_terms_and_range_filters():
+    query = qb.build_query(
+        "поставка оборудования",
+        filters={"platform": "zakupki", "category": ["it", "medical"], "status": None, "customer": []},
+        range_filters={"budget": {"gte": 1000, "lte": 5000}, "start_date": {"gte": "2024-01-01", "lte": None}},
+    )
+
+    assert query["bool"]["must"] == [{
+        "multi_match": {"query": "поставка оборудования", "fields": qb.SEARCH_FIELDS, "fuzziness": "AUTO"},
+    }]
+    assert query["bool"]["filter"] == [
+        {"term": {"platform": "zakupki"}},
+        {"terms": {"category": ["it", "medical"]}},
+        {"range": {"budget": {"gte": 1000, "lte": 5000}}},
+        {"range": {"start_date": {"gte": "2024-01-01"}}},
+    ]
+
+
+def test_terms_filter_accepts_tuple_and_set():
+    clauses = qb.build_filter_clauses({"platform": ("a", "b"), "category": {"it"}})
+
+    assert clauses == [{"terms": {"platform": ["a", "b"]}}, {"terms": {"category": ["it"]}}]
+
+
+@pytest.mark.parametrize("bounds, expected", [
+    ({"gte": 0, "lte": None}, {"gte": 0}),
+    ({"gte": None, "lte": 0}, {"lte": 0}),
+    ({"gte": 0, "lte": 0}, {"gte": 0, "lte": 0}),
+])
+def test_zero_budget_bounds_are_kept(bounds, expected):
+    assert qb.build_filter_clauses(range_filters={"budget": bounds}) == [{"range": {"budget": expected}}]
+
+
+def test_empty_filters_add_no_filter_clause():
+    query = qb.build_query("ремонт", filters={"platform": None}, range_filters={"budget": {"gte": None, "lte": None}})
+
+    assert "filter" not in query["bool"]
+
+
+@pytest.mark.parametrize("text", ["", "*", "  *  ", None])
+def test_match_all_queries(text):
+    query = qb.build_query(text, filters={"platform": "zakupki"})
+
+    assert query["bool"]["must"] == [{"match_all": {}}]
+    assert query["bool"]["filter"] == [{"term": {"platform": "zakupki"}}]
+
+
+def test_search_body_with_view():
+    body = qb.build_search_body("ремонт", size=50, from_=100, view=qb.LIST_VIEW)
+
+    assert body["size"] == 50
+    assert body["from"] == 100
+    assert body["_source"] == qb.RESULT_VIEWS[qb.LIST_VIEW]["_source"]
+    assert body["highlight"] == qb.RESULT_VIEWS[qb.LIST_VIEW]["highlight"]
+
+
+def test_unknown_view_raises():
+    with pytest.raises(ValueError):
+        qb.build_search_body("ремонт", view="full")
+
+
+def test_cursor_body_first_page():
+    body = qb.build_cursor_search_body(
+        "*",
+        pit_id="pit-1",
+        keep_alive="1m",
+        sort=SORT,
+        filters={"platform": "zakupki"},
+        range_filters={"budget": {"gte": 0}},
+        size=25,
+    )
+
+    assert body == {
+        "query": {"bool": {
+            "must": [{"match_all": {}}],
+            "filter": [{"term": {"platform": "zakupki"}}, {"range": {"budget": {"gte": 0}}}],
+        }},
+        "size": 25,
+        "sort": SORT,
+        "pit": {"id": "pit-1", "keep_alive": "1m"},
+    }
+    assert "index" not in body
+    assert "from" not in body
+
+
+def test_cursor_body_next_page_with_source_override():
+    source = {"includes": ["tender_id", "title"]}
+    body = qb.build_cursor_search_body(
+        "ремонт",
+        pit_id="pit-2",
+        keep_alive="5m",
+        sort=SORT,
+        search_after=[1.5, "t-42"],
+        source=source,
+        view=qb.LIST_VIEW,
+    )
+
+    assert body["search_after"] == [1.5, "t-42"]
+    assert body["_source"] == source
+    assert body["highlight"] == qb.RESULT_VIEWS[qb.LIST_VIEW]["highlight"]